@@ -0,0 +1,72 @@
+"""Store content and opportunity status as SMALLINT codes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Codes follow the declaration order of ContentStatus / OpportunityStatus
+# (see app.db.types.SmallIntEnum). Keep in sync when appending members.
+CONTENT_STATUS_CODES = [
+    'draft', 'pending', 'approved', 'rejected',
+    'publishing', 'published', 'failed', 'deleted',
+]
+OPPORTUNITY_STATUS_CODES = [
+    'pending', 'approved', 'rejected', 'generating', 'ready',
+    'publishing', 'published', 'expired', 'failed',
+]
+
+
+def _to_code(column: str, values: list) -> str:
+    whens = ' '.join(f"WHEN '{v}' THEN {i}" for i, v in enumerate(values))
+    return f"(CASE {column} {whens} END)::smallint"
+
+
+def _to_string(column: str, values: list) -> str:
+    whens = ' '.join(f"WHEN {i} THEN '{v}'" for i, v in enumerate(values))
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'generated_contents', 'status',
+        existing_type=sa.String(length=50),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_code('status', CONTENT_STATUS_CODES),
+    )
+    op.alter_column(
+        'opportunities', 'status',
+        existing_type=sa.String(length=50),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_code('status', OPPORTUNITY_STATUS_CODES),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'opportunities', 'status',
+        existing_type=sa.SmallInteger(),
+        type_=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using=_to_string('status', OPPORTUNITY_STATUS_CODES),
+    )
+    op.alter_column(
+        'generated_contents', 'status',
+        existing_type=sa.SmallInteger(),
+        type_=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using=_to_string('status', CONTENT_STATUS_CODES),
+    )
@@ -0,0 +1,54 @@
+"""Add GIN and expression indexes on JSONB columns
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ('idx_content_metadata_gin', 'generated_contents', 'content_metadata'),
+    ('idx_content_quality_checks_gin', 'generated_contents', 'quality_checks'),
+    ('idx_opp_metadata_gin', 'opportunities', 'opportunity_metadata'),
+    ('idx_feature_data_gin', 'learning_features', 'feature_data'),
+    ('idx_project_settings_gin', 'projects', 'settings'),
+    ('idx_account_subreddit_activity_gin', 'reddit_accounts', 'subreddit_activity'),
+]
+
+
+def upgrade() -> None:
+    # Make sure the columns are JSONB (no-op where the initial migration already did it)
+    for _, table, column in GIN_INDEXES:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::jsonb',
+        )
+
+    for name, table, column in GIN_INDEXES:
+        op.create_index(name, table, [column], unique=False, postgresql_using='gin')
+
+    op.create_index(
+        'idx_content_model',
+        'generated_contents',
+        [sa.text("(CAST(content_metadata ->> 'model' AS VARCHAR))")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_content_model', table_name='generated_contents')
+    for name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,60 @@
+"""Move account rate-limit counters into reddit_account_rates
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reddit_account_rates',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('last_action_at', sa.DateTime(), nullable=True),
+        sa.Column('daily_actions_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('daily_actions_reset_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['account_id'], ['reddit_accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('account_id'),
+    )
+
+    op.execute(
+        """
+        INSERT INTO reddit_account_rates (account_id, last_action_at, daily_actions_count, daily_actions_reset_at)
+        SELECT id, last_action_at, COALESCE(daily_actions_count, 0), daily_actions_reset_at
+        FROM reddit_accounts
+        """
+    )
+
+    op.drop_column('reddit_accounts', 'daily_actions_reset_at')
+    op.drop_column('reddit_accounts', 'daily_actions_count')
+    op.drop_column('reddit_accounts', 'last_action_at')
+
+
+def downgrade() -> None:
+    op.add_column('reddit_accounts', sa.Column('last_action_at', sa.DateTime(), nullable=True))
+    op.add_column('reddit_accounts', sa.Column('daily_actions_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('reddit_accounts', sa.Column('daily_actions_reset_at', sa.DateTime(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE reddit_accounts SET
+            last_action_at = r.last_action_at,
+            daily_actions_count = r.daily_actions_count,
+            daily_actions_reset_at = r.daily_actions_reset_at
+        FROM reddit_account_rates r
+        WHERE r.account_id = reddit_accounts.id
+        """
+    )
+
+    op.drop_table('reddit_account_rates')
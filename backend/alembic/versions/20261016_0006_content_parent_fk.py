@@ -0,0 +1,47 @@
+"""Add self-referential foreign key and index on generated_contents.parent_content_id
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Clear references to rows that no longer exist before adding the constraint
+    op.execute(
+        """
+        UPDATE generated_contents SET parent_content_id = NULL
+        WHERE parent_content_id IS NOT NULL
+          AND parent_content_id NOT IN (SELECT id FROM generated_contents)
+        """
+    )
+    op.create_foreign_key(
+        'fk_generated_contents_parent_content',
+        'generated_contents',
+        'generated_contents',
+        ['parent_content_id'],
+        ['id'],
+        ondelete='SET NULL'
+    )
+    op.create_index(
+        'ix_generated_contents_parent_content_id',
+        'generated_contents',
+        ['parent_content_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_generated_contents_parent_content_id', table_name='generated_contents')
+    op.drop_constraint('fk_generated_contents_parent_content', 'generated_contents', type_='foreignkey')
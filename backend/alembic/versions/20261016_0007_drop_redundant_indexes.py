@@ -0,0 +1,40 @@
+"""Drop single-column indexes that are prefixes of composite indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column) - each is the leading column of a composite
+# index or unique constraint on the same table
+REDUNDANT_INDEXES = [
+    ('ix_opportunities_project_id', 'opportunities', 'project_id'),            # idx_opp_project_status
+    ('ix_generated_contents_project_id', 'generated_contents', 'project_id'),  # idx_content_project_status
+    ('ix_subreddit_configs_project_id', 'subreddit_configs', 'project_id'),    # uq_project_subreddit
+    ('ix_learning_features_feature_type', 'learning_features', 'feature_type'),  # uq_feature_type_key_project
+]
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_content_project_status '
+        'ON generated_contents (project_id, status)'
+    )
+    # Databases created from the models have these; migrated ones may not
+    for name, _, _ in REDUNDANT_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    for name, table, column in REDUNDANT_INDEXES:
+        op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})')
@@ -0,0 +1,58 @@
+"""Store subreddit config list columns as native arrays
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (column, array item type, SQL cast of a JSON array element)
+ARRAY_COLUMNS = [
+    ('allowed_content_types', sa.String(length=16), 'varchar(16)'),
+    ('best_posting_hours', sa.Integer(), 'integer'),
+    ('best_posting_days', sa.Integer(), 'integer'),
+]
+
+
+def upgrade() -> None:
+    # USING does not allow subqueries, so convert through a temporary column
+    for column, item_type, cast in ARRAY_COLUMNS:
+        op.add_column('subreddit_configs', sa.Column(f'{column}_arr', postgresql.ARRAY(item_type), nullable=True))
+        op.execute(
+            f"""
+            UPDATE subreddit_configs
+            SET {column}_arr = ARRAY(SELECT jsonb_array_elements_text({column}::jsonb)::{cast})
+            WHERE {column} IS NOT NULL
+            """
+        )
+        op.drop_column('subreddit_configs', column)
+        op.alter_column('subreddit_configs', f'{column}_arr', new_column_name=column)
+
+    op.create_index(
+        'ix_subreddit_best_hours_gin',
+        'subreddit_configs',
+        ['best_posting_hours'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subreddit_best_hours_gin', table_name='subreddit_configs')
+    for column, _, _ in ARRAY_COLUMNS:
+        op.alter_column(
+            'subreddit_configs', column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'to_jsonb({column})',
+        )
@@ -0,0 +1,51 @@
+"""Add generated size_category and effective_velocity_threshold to subreddit_configs
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SIZE_CATEGORY_SQL = (
+    "CASE WHEN subscribers IS NULL OR subscribers = 0 THEN 'unknown' "
+    "WHEN subscribers < 50000 THEN 'small' "
+    "WHEN subscribers < 500000 THEN 'medium' "
+    "WHEN subscribers < 2000000 THEN 'large' "
+    "ELSE 'massive' END"
+)
+VELOCITY_THRESHOLD_SQL = (
+    "COALESCE(NULLIF(velocity_threshold, 0), "
+    "CASE WHEN subscribers IS NULL OR subscribers = 0 THEN 15.0 "
+    "WHEN subscribers < 50000 THEN 5.0 "
+    "WHEN subscribers < 500000 THEN 15.0 "
+    "WHEN subscribers < 2000000 THEN 50.0 "
+    "ELSE 200.0 END)"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'subreddit_configs',
+        sa.Column('size_category', sa.String(length=16), sa.Computed(SIZE_CATEGORY_SQL, persisted=True), nullable=True)
+    )
+    op.add_column(
+        'subreddit_configs',
+        sa.Column('effective_velocity_threshold', sa.Float(), sa.Computed(VELOCITY_THRESHOLD_SQL, persisted=True), nullable=True)
+    )
+    op.create_index('ix_subreddit_configs_size_category', 'subreddit_configs', ['size_category'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subreddit_configs_size_category', table_name='subreddit_configs')
+    op.drop_column('subreddit_configs', 'effective_velocity_threshold')
+    op.drop_column('subreddit_configs', 'size_category')
@@ -0,0 +1,68 @@
+"""Use server-side defaults for subreddit_configs and users timestamps
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['subreddit_configs', 'users']
+
+
+def _has_column(table: str, column: str) -> bool:
+    # users and config_metadata are created by create_all at app startup,
+    # so they may not exist yet when migrations run
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return False
+    return any(c['name'] == column for c in inspector.get_columns(table))
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        for column in ('created_at', 'updated_at'):
+            if not _has_column(table, column):
+                continue
+            # Existing values were written with datetime.utcnow()
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+    if _has_column('subreddit_configs', 'config_metadata'):
+        op.alter_column(
+            'subreddit_configs', 'config_metadata',
+            server_default=sa.text("'{}'::jsonb"),
+        )
+
+
+def downgrade() -> None:
+    if _has_column('subreddit_configs', 'config_metadata'):
+        op.alter_column('subreddit_configs', 'config_metadata', server_default=None)
+
+    for table in TABLES:
+        for column in ('created_at', 'updated_at'):
+            if not _has_column(table, column):
+                continue
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                server_default=None,
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,56 @@
+"""Store subreddit_configs.config_metadata as JSONB with a GIN index
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_config_metadata() -> bool:
+    # config_metadata is created by create_all at app startup, not by an earlier migration
+    inspector = sa.inspect(op.get_bind())
+    return any(c['name'] == 'config_metadata' for c in inspector.get_columns('subreddit_configs'))
+
+
+def upgrade() -> None:
+    if not _has_config_metadata():
+        op.add_column(
+            'subreddit_configs',
+            sa.Column('config_metadata', postgresql.JSONB(astext_type=sa.Text()),
+                      server_default=sa.text("'{}'::jsonb"), nullable=False)
+        )
+    else:
+        op.alter_column(
+            'subreddit_configs', 'config_metadata',
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using='config_metadata::jsonb',
+        )
+
+    op.create_index(
+        'ix_subreddit_cfg_meta_gin',
+        'subreddit_configs',
+        ['config_metadata'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subreddit_cfg_meta_gin', table_name='subreddit_configs')
+    op.alter_column(
+        'subreddit_configs', 'config_metadata',
+        type_=sa.JSON(),
+        postgresql_using='config_metadata::json',
+    )
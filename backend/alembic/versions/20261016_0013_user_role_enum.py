@@ -0,0 +1,50 @@
+"""Convert users.role to a native user_role ENUM
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+user_role = postgresql.ENUM('admin', 'user', name='user_role')
+
+
+def upgrade() -> None:
+    user_role.create(op.get_bind(), checkfirst=True)
+
+    # users is created by create_all at app startup; nothing to convert on a fresh database
+    if not sa.inspect(op.get_bind()).has_table('users'):
+        return
+
+    op.alter_column('users', 'role', server_default=None)
+    op.alter_column(
+        'users', 'role',
+        existing_type=sa.String(length=50),
+        type_=user_role,
+        existing_nullable=False,
+        postgresql_using='role::user_role',
+    )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table('users'):
+        op.alter_column(
+            'users', 'role',
+            existing_type=user_role,
+            type_=sa.String(length=50),
+            existing_nullable=False,
+            postgresql_using='role::text',
+        )
+
+    user_role.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+"""Add covering index on subreddit_configs (project_id, is_enabled, subreddit_name)
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0014'
+down_revision: Union[str, None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_subreddit_cfg_project_enabled',
+        'subreddit_configs',
+        ['project_id', 'is_enabled', 'subreddit_name'],
+        unique=False,
+        postgresql_include=['subscribers', 'velocity_threshold']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subreddit_cfg_project_enabled', table_name='subreddit_configs')
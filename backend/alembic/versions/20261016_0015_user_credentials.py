@@ -0,0 +1,75 @@
+"""Move user name, password hash and last login into user_credentials
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0015'
+down_revision: Union[str, None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return inspector.has_table(table) and column in {c['name'] for c in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    # users is created by create_all at app startup; nothing to split on a fresh database
+    if not _has_column('users', 'password_hash'):
+        return
+
+    op.create_table(
+        'user_credentials',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('password_hash', sa.String(length=255), nullable=False),
+        sa.Column('last_login_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+    op.execute(
+        """
+        INSERT INTO user_credentials (user_id, name, password_hash, last_login_at)
+        SELECT id, name, password_hash, last_login_at
+        FROM users
+        """
+    )
+
+    op.drop_column('users', 'last_login_at')
+    op.drop_column('users', 'password_hash')
+    op.drop_column('users', 'name')
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('user_credentials'):
+        return
+
+    op.add_column('users', sa.Column('name', sa.String(length=255), nullable=True))
+    op.add_column('users', sa.Column('password_hash', sa.String(length=255), nullable=True))
+    op.add_column('users', sa.Column('last_login_at', sa.DateTime(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE users SET
+            name = c.name,
+            password_hash = c.password_hash,
+            last_login_at = c.last_login_at
+        FROM user_credentials c
+        WHERE c.user_id = users.id
+        """
+    )
+
+    op.alter_column('users', 'name', nullable=False)
+    op.alter_column('users', 'password_hash', nullable=False)
+
+    op.drop_table('user_credentials')
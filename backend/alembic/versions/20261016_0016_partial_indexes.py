@@ -0,0 +1,42 @@
+"""Add partial indexes for active users and enabled subreddit configs
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0016'
+down_revision: Union[str, None] = '0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_subreddit_cfg_project_enabled_partial',
+        'subreddit_configs',
+        ['project_id'],
+        unique=False,
+        postgresql_where=sa.text('is_enabled')
+    )
+
+    # users is created by create_all at app startup
+    if sa.inspect(op.get_bind()).has_table('users'):
+        op.create_index(
+            'uq_users_email_active',
+            'users',
+            ['email'],
+            unique=True,
+            postgresql_where=sa.text('is_active')
+        )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS uq_users_email_active')
+    op.drop_index('ix_subreddit_cfg_project_enabled_partial', table_name='subreddit_configs')
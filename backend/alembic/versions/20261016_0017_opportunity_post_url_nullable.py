@@ -0,0 +1,45 @@
+"""Make opportunities.post_url nullable (derived from subreddit and reddit_post_id)
+
+The API now derives post_url instead of reading the column. The column is
+kept, and still written, so readers on the previous release keep working
+through a rolling deploy; it is dropped in a later migration once nothing
+reads it.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0017'
+down_revision: Union[str, None] = '0016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'opportunities', 'post_url',
+        existing_type=sa.String(length=500),
+        nullable=True
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE opportunities
+        SET post_url = 'https://www.reddit.com/r/' || subreddit || '/comments/' || reddit_post_id || '/'
+        WHERE post_url IS NULL
+        """
+    )
+    op.alter_column(
+        'opportunities', 'post_url',
+        existing_type=sa.String(length=500),
+        nullable=False
+    )
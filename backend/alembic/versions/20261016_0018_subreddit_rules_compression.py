@@ -0,0 +1,40 @@
+"""Compress subreddit_configs rules text with lz4
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0018'
+down_revision: Union[str, None] = '0017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # EXTENDED = compress, then move out of line if still large (EXTERNAL would skip compression).
+    # lz4 needs PostgreSQL 14+; existing values keep their codec until rewritten.
+    op.execute(
+        """
+        ALTER TABLE subreddit_configs
+            ALTER COLUMN posting_rules SET STORAGE EXTENDED,
+            ALTER COLUMN posting_rules SET COMPRESSION lz4,
+            ALTER COLUMN rules_summary SET STORAGE EXTENDED,
+            ALTER COLUMN rules_summary SET COMPRESSION lz4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE subreddit_configs
+            ALTER COLUMN posting_rules SET COMPRESSION default,
+            ALTER COLUMN rules_summary SET COMPRESSION default
+        """
+    )
@@ -0,0 +1,47 @@
+"""Narrow subreddit_configs.subreddit_name and subreddit_type
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0019'
+down_revision: Union[str, None] = '0018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'subreddit_configs', 'subreddit_name',
+        existing_type=sa.String(length=100),
+        type_=sa.String(length=32),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'subreddit_configs', 'subreddit_type',
+        existing_type=sa.String(length=50),
+        type_=sa.String(length=16),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'subreddit_configs', 'subreddit_type',
+        existing_type=sa.String(length=16),
+        type_=sa.String(length=50),
+        existing_nullable=True,
+    )
+    op.alter_column(
+        'subreddit_configs', 'subreddit_name',
+        existing_type=sa.String(length=32),
+        type_=sa.String(length=100),
+        existing_nullable=False,
+    )
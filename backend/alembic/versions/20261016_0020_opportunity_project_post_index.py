@@ -0,0 +1,31 @@
+"""Add (project_id, reddit_post_id) index on opportunities
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0020'
+down_revision: Union[str, None] = '0019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets the miner's existing-post-ID lookup run as an index-only scan
+    op.create_index(
+        'idx_opp_project_post',
+        'opportunities',
+        ['project_id', 'reddit_post_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_opp_project_post', table_name='opportunities')
@@ -0,0 +1,33 @@
+"""Drop the partial enabled-configs index on subreddit_configs
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0021'
+down_revision: Union[str, None] = '0020'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ix_subreddit_cfg_project_enabled (project_id, is_enabled, subreddit_name)
+    # already serves "enabled configs for project X"
+    op.drop_index('ix_subreddit_cfg_project_enabled_partial', table_name='subreddit_configs')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_subreddit_cfg_project_enabled_partial',
+        'subreddit_configs',
+        ['project_id'],
+        unique=False,
+        postgresql_where=sa.text('is_enabled')
+    )
@@ -1,6 +1,7 @@
 """
 API dependencies for FastAPI endpoints.
 """
+from functools import lru_cache
 from typing import Generator, Dict, Any, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -9,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.db.database import SessionLocal
 from app.core.security import validate_token
 from app.models.user import User, UserRole
+from app.services.content_generator import ContentGenerator
 
 
 # HTTP Bearer token security scheme
@@ -29,6 +31,18 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@lru_cache()
+def get_content_generator() -> ContentGenerator:
+    """
+    Dependency that provides the process-wide ContentGenerator.
+
+    Shared so SDK clients and their connection pools are created once per
+    worker. Celery tasks use their own instance, bound to the worker's
+    persistent event loop (see app.tasks.generate_content).
+    """
+    return ContentGenerator()
+
+
 def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
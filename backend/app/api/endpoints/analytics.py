@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 
 from app.api.deps import get_db
+from app.api.responses import schema_response
 from app.models import (
     Project, Opportunity, GeneratedContent, ContentPerformance,
     RedditAccount, LearningFeature, SubredditConfig
@@ -18,6 +19,7 @@ from app.schemas.analytics import (
     PerformanceTimeSeries,
     SubredditInsights,
     LearningFeatureResponse,
+    LEARNING_FEATURE_LIST_ADAPTER,
     DashboardSummary,
 )
 from app.services.reddit_analytics import RedditAnalyticsService
@@ -262,7 +264,8 @@ async def get_learning_features(
 
     features = query.order_by(desc(LearningFeature.success_rate)).limit(limit).all()
 
-    return [LearningFeatureResponse.from_orm(f) for f in features]
+    items = LEARNING_FEATURE_LIST_ADAPTER.validate_python(features, from_attributes=True)
+    return schema_response(items, LEARNING_FEATURE_LIST_ADAPTER)
 
 
 @router.get("/dashboard", response_model=DashboardSummary)
@@ -7,13 +7,15 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_content_generator
+from app.api.responses import schema_response
 from app.models import GeneratedContent, ContentStatus, Opportunity, Project, ContentPerformance
 from app.schemas.content import (
     ContentUpdate,
     ContentResponse,
     ContentDetailResponse,
     ContentListResponse,
+    CONTENT_LIST_ADAPTER,
     GenerateContentRequest,
     PublishContentRequest,
     PublishResult,
@@ -59,12 +61,13 @@ async def list_content(
         desc(GeneratedContent.created_at)
     ).offset(skip).limit(limit).all()
 
-    return ContentListResponse(
-        items=contents,
+    response = ContentListResponse(
+        items=CONTENT_LIST_ADAPTER.validate_python(contents, from_attributes=True),
         total=total,
         skip=skip,
         limit=limit,
     )
+    return schema_response(response)
 
 
 @router.get("/{content_id}", response_model=ContentDetailResponse)
@@ -139,6 +142,7 @@ async def regenerate_content(
     content_id: int,
     request: RegenerateRequest = None,
     db: Session = Depends(get_db),
+    generator: ContentGenerator = Depends(get_content_generator),
 ):
     """Regenerate content with optional feedback."""
     content = db.query(GeneratedContent).get(content_id)
@@ -156,7 +160,6 @@ async def regenerate_content(
         raise HTTPException(status_code=404, detail="Project not found")
 
     try:
-        generator = ContentGenerator()
         new_content = await generator.regenerate_content(
             content=content,
             opportunity=opportunity,
@@ -290,6 +293,6 @@ async def get_content_performance(
         current_score=latest.score if latest else 0,
         current_replies=latest.num_replies if latest else 0,
         is_removed=latest.is_removed if latest else False,
-        snapshots=[PerformanceSnapshot.from_orm(s) for s in snapshots],
+        snapshots=[PerformanceSnapshot.model_validate(s) for s in snapshots],
         total_snapshots=len(snapshots),
     )
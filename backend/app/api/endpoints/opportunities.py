@@ -7,12 +7,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status, Background
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_content_generator
+from app.api.responses import schema_response
 from app.models import Opportunity, OpportunityStatus, Project, GeneratedContent
 from app.schemas.opportunity import (
     OpportunityResponse,
     OpportunityDetailResponse,
     OpportunityListResponse,
+    OPPORTUNITY_LIST_ADAPTER,
     MiningRequest,
     MiningResult,
     ApproveRejectRequest,
@@ -62,12 +64,13 @@ async def list_opportunities(
         desc(Opportunity.composite_score)
     ).offset(skip).limit(limit).all()
 
-    return OpportunityListResponse(
-        items=opportunities,
+    response = OpportunityListResponse(
+        items=OPPORTUNITY_LIST_ADAPTER.validate_python(opportunities, from_attributes=True),
         total=total,
         skip=skip,
         limit=limit,
     )
+    return schema_response(response)
 
 
 @router.get("/{opportunity_id}", response_model=OpportunityDetailResponse)
@@ -149,6 +152,7 @@ async def generate_content_for_opportunity(
     style: str = "helpful_expert",
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
+    generator: ContentGenerator = Depends(get_content_generator),
 ):
     """Generate content for an opportunity."""
     opportunity = db.query(Opportunity).get(opportunity_id)
@@ -167,7 +171,6 @@ async def generate_content_for_opportunity(
 
     try:
         # Generate content
-        generator = ContentGenerator()
         content = await generator.generate_content(opportunity, project, style)
 
         # Run quality checks
@@ -262,4 +265,4 @@ async def refresh_opportunity(
     miner = OpportunityMiner()
     opportunity = miner.refresh_opportunity_scores(db, opportunity)
 
-    return OpportunityResponse.from_orm(opportunity)
+    return OpportunityResponse.model_validate(opportunity)
@@ -3,10 +3,11 @@ Project API endpoints.
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, undefer
 from sqlalchemy import func
 
 from app.api.deps import get_db, get_current_user_optional
+from app.api.responses import schema_response
 from app.models import Project, ProjectStatus, Opportunity, GeneratedContent, RedditAccount, SubredditConfig
 from app.schemas.project import (
     ProjectCreate,
@@ -14,8 +15,10 @@ from app.schemas.project import (
     ProjectResponse,
     ProjectDetailResponse,
     ProjectListResponse,
+    PROJECT_LIST_ADAPTER,
     SubredditConfigCreate,
     SubredditConfigResponse,
+    SUBREDDIT_CONFIG_LIST_ADAPTER,
 )
 from app.services.subreddit_analyzer import SubredditAnalyzer
 
@@ -48,11 +51,8 @@ async def create_project(
     # Analyze target subreddits in background
     if project.target_subreddits:
         analyzer = SubredditAnalyzer()
-        for subreddit_name in project.target_subreddits[:5]:  # Limit initial analysis
-            try:
-                analyzer.analyze_subreddit(db, subreddit_name, project.id)
-            except Exception as e:
-                pass  # Non-blocking
+        # Limit initial analysis; errors are logged per subreddit and non-blocking
+        analyzer.batch_analyze(db, project.target_subreddits[:5], project.id)
 
     return project
 
@@ -65,7 +65,8 @@ async def list_projects(
     db: Session = Depends(get_db),
 ):
     """List all projects."""
-    query = db.query(Project)
+    # ProjectResponse has no relationships; fail loudly if one gets lazy-loaded
+    query = db.query(Project).options(raiseload("*"))
 
     if status:
         query = query.filter(Project.status == status)
@@ -73,12 +74,13 @@ async def list_projects(
     total = query.count()
     projects = query.order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
 
-    return ProjectListResponse(
-        items=projects,
+    response = ProjectListResponse(
+        items=PROJECT_LIST_ADAPTER.validate_python(projects, from_attributes=True),
         total=total,
         skip=skip,
         limit=limit,
     )
+    return schema_response(response)
 
 
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
@@ -177,7 +179,8 @@ async def add_subreddit(
         SubredditConfig.subreddit_name == config_in.subreddit_name
     ).first()
 
-    if existing:
+    # A config that was never analyzed is a leftover placeholder; analyze it again
+    if existing and existing.last_analyzed_at is not None:
         raise HTTPException(status_code=400, detail="Subreddit already configured")
 
     # Analyze and create config
@@ -210,11 +213,16 @@ async def list_subreddits(
     db: Session = Depends(get_db),
 ):
     """List configured subreddits for a project."""
-    configs = db.query(SubredditConfig).filter(
+    # SubredditConfigResponse includes the deferred posting_rules; load it in the same query
+    configs = db.query(SubredditConfig).options(
+        undefer(SubredditConfig.posting_rules),
+        raiseload("*")
+    ).filter(
         SubredditConfig.project_id == project_id
     ).all()
 
-    return configs
+    items = SUBREDDIT_CONFIG_LIST_ADAPTER.validate_python(configs, from_attributes=True)
+    return schema_response(items, SUBREDDIT_CONFIG_LIST_ADAPTER)
 
 
 @router.delete("/{project_id}/subreddits/{subreddit_name}", status_code=status.HTTP_204_NO_CONTENT)
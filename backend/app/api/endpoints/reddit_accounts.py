@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.responses import schema_response
 from app.models import RedditAccount, AccountStatus
 from app.schemas.reddit_account import (
     RedditAccountResponse,
@@ -37,7 +38,12 @@ async def list_accounts(
     accounts = query.order_by(RedditAccount.created_at.desc()).all()
     total = len(accounts)
 
-    return RedditAccountListResponse(items=accounts, total=total)
+    # Rows come from the database, so skip per-field validation
+    response = RedditAccountListResponse.model_construct(
+        items=[RedditAccountResponse.from_orm_fast(account) for account in accounts],
+        total=total
+    )
+    return schema_response(response)
 
 
 @router.get("/{account_id}", response_model=RedditAccountDetailResponse)
@@ -51,11 +57,8 @@ async def get_account(
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    return RedditAccountDetailResponse(
-        **account.__dict__,
-        can_post=account.can_post,
-        selection_score=account.selection_score,
-    )
+    # Read via attributes: rate counters and can_post/selection_score are properties
+    return RedditAccountDetailResponse.model_validate(account)
 
 
 @router.put("/{account_id}", response_model=RedditAccountResponse)
@@ -4,10 +4,11 @@ User management API endpoints.
 from typing import Optional, List
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, EmailStr
+from sqlalchemy.orm import Session, raiseload, selectinload
+from pydantic import BaseModel, EmailStr, ConfigDict, TypeAdapter
 
 from app.api.deps import get_db, get_current_user, require_admin
+from app.api.responses import schema_response
 from app.models.user import User, UserRole
 from app.core.security import verify_password, get_password_hash, create_access_token
 
@@ -45,8 +46,7 @@ class UserResponse(BaseModel):
     updated_at: datetime
     last_login_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenResponse(BaseModel):
@@ -60,6 +60,16 @@ class UsersListResponse(BaseModel):
     total: int
 
 
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
+
+def _get_user_with_credentials(db: Session, user_id: int) -> Optional[User]:
+    """Load a user together with its credentials row (name, last login) for UserResponse."""
+    return db.query(User).options(
+        selectinload(User.credentials)
+    ).filter(User.id == user_id).first()
+
+
 # Authentication endpoints
 @router.post("/login", response_model=TokenResponse)
 async def login(
@@ -67,7 +77,9 @@ async def login(
     db: Session = Depends(get_db)
 ):
     """Authenticate user and return JWT token."""
-    user = db.query(User).filter(User.email == credentials.email).first()
+    user = db.query(User).options(
+        selectinload(User.credentials)
+    ).filter(User.email == credentials.email).first()
 
     if not user or not verify_password(credentials.password, user.password_hash):
         raise HTTPException(
@@ -84,6 +96,7 @@ async def login(
     # Update last login
     user.last_login_at = datetime.utcnow()
     db.commit()
+    user = _get_user_with_credentials(db, user.id)
 
     # Create token
     token = create_access_token(data={
@@ -100,10 +113,11 @@ async def login(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """Get current user information."""
-    return UserResponse.model_validate(current_user)
+    return UserResponse.model_validate(_get_user_with_credentials(db, current_user.id))
 
 
 @router.put("/me", response_model=UserResponse)
@@ -113,6 +127,8 @@ async def update_current_user(
     db: Session = Depends(get_db)
 ):
     """Update current user's own information (cannot change role)."""
+    current_user = _get_user_with_credentials(db, current_user.id)
+
     if update_data.email and update_data.email != current_user.email:
         existing = db.query(User).filter(User.email == update_data.email).first()
         if existing:
@@ -130,9 +146,8 @@ async def update_current_user(
 
     # Users cannot change their own role
     db.commit()
-    db.refresh(current_user)
 
-    return UserResponse.model_validate(current_user)
+    return UserResponse.model_validate(_get_user_with_credentials(db, current_user.id))
 
 
 # Admin-only endpoints
@@ -146,7 +161,7 @@ async def list_users(
     db: Session = Depends(get_db)
 ):
     """List all users (admin only)."""
-    query = db.query(User)
+    query = db.query(User).options(selectinload(User.credentials), raiseload("*"))
 
     if role:
         query = query.filter(User.role == role)
@@ -156,10 +171,11 @@ async def list_users(
     total = query.count()
     users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
 
-    return UsersListResponse(
-        items=[UserResponse.model_validate(u) for u in users],
+    response = UsersListResponse(
+        items=USER_LIST_ADAPTER.validate_python(users, from_attributes=True),
         total=total
     )
+    return schema_response(response)
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -193,9 +209,8 @@ async def create_user(
 
     db.add(user)
     db.commit()
-    db.refresh(user)
 
-    return UserResponse.model_validate(user)
+    return UserResponse.model_validate(_get_user_with_credentials(db, user.id))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -205,7 +220,7 @@ async def get_user(
     db: Session = Depends(get_db)
 ):
     """Get a specific user (admin only)."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _get_user_with_credentials(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -222,7 +237,7 @@ async def update_user(
     db: Session = Depends(get_db)
 ):
     """Update a user (admin only)."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _get_user_with_credentials(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -270,9 +285,8 @@ async def update_user(
         user.is_active = update_data.is_active
 
     db.commit()
-    db.refresh(user)
 
-    return UserResponse.model_validate(user)
+    return UserResponse.model_validate(_get_user_with_credentials(db, user.id))
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,27 @@
+"""
+Response helpers for FastAPI endpoints.
+"""
+from typing import Any, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def schema_response(data: Any, adapter: Optional[TypeAdapter] = None) -> Response:
+    """
+    JSON response serialized by pydantic-core directly.
+
+    Returning a Response skips FastAPI's jsonable_encoder pass over data that
+    has already been validated into response schemas.
+
+    Args:
+        data: A schema instance, or a value matching adapter's type
+        adapter: TypeAdapter to serialize data with (for lists of schemas)
+
+    Returns:
+        Response: application/json response
+    """
+    if adapter is not None:
+        content = adapter.dump_json(data)
+    else:
+        content = data.model_dump_json()
+    return Response(content=content, media_type="application/json")
@@ -57,6 +57,13 @@ celery_app.conf.update(
             "options": {"queue": "opportunity-mining"},
         },
 
+        # Collect finished OpenAI Batch API generations
+        "collect-content-batches-periodic": {
+            "task": "tasks.collect_content_batches",
+            "schedule": crontab(minute=f"*/{settings.OPENAI_BATCH_COLLECT_INTERVAL_MINUTES}"),
+            "options": {"queue": "content-generation"},
+        },
+
         # Collect analytics every 30 minutes
         "collect-analytics-periodic": {
             "task": "app.tasks.collect_analytics.collect_all_analytics",
@@ -27,6 +27,12 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "reddit_platform"
     DATABASE_URL: Optional[str] = None
 
+    # Connection pool
+    DB_POOL_SIZE: int = 30
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    DB_POOL_PRE_PING: bool = True
+
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
     def assemble_db_url(cls, v, info):
@@ -103,6 +109,26 @@ class Settings(BaseSettings):
     DEFAULT_LLM_MODEL_FAST: str = "gpt-4o-mini"  # For simpler tasks and fallback
     DEFAULT_LLM_TEMPERATURE: float = 0.8  # Slightly higher for more natural variation
     DEFAULT_LLM_MAX_TOKENS: int = 800  # Concise is better for Reddit
+    MAX_POST_CONTENT_TOKENS: int = 600  # Post body budget in generation prompts
+    LLM_MAX_CONCURRENCY: int = 5  # Max in-flight LLM calls per event loop
+    LLM_REQUESTS_PER_MINUTE: int = 500  # Per provider, per process
+    LLM_MAX_RETRIES: int = 3  # SDK retries with backoff on 429s and 5xx
+    LLM_HTTP_MAX_CONNECTIONS: int = 200  # Shared by the OpenAI and Anthropic clients
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 100
+    LLM_HTTP2: bool = True  # Multiplex concurrent variant requests over one connection
+    LLM_HTTP_TIMEOUT_SECONDS: float = 120.0
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive failures before fast-failing
+    LLM_CIRCUIT_RESET_SECONDS: int = 60  # Open time before a probe call is allowed
+    OPENAI_BATCH_COLLECT_INTERVAL_MINUTES: int = 5  # How often finished Batch API jobs are collected
+    LLM_RESPONSE_CACHE_SIZE: int = 4096  # In-process exact-prompt response cache
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = 60 * 60  # 1 hour
+
+    # Semantic response cache (Redis-backed, keyed per project, style and mention strategy)
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92  # Min cosine similarity for a hit
+    SEMANTIC_CACHE_TTL_SECONDS: int = 60 * 60 * 24  # 24 hours
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 200  # Per (project, style, mention strategy)
+    EMBEDDING_MODEL: str = "text-embedding-3-small"
 
     # Security
     SECRET_KEY: str = "change_this_to_a_secure_secret_key"
@@ -125,6 +151,8 @@ class Settings(BaseSettings):
     # Mining Settings
     MINING_INTERVAL_MINUTES: int = 15
     MAX_OPPORTUNITIES_PER_MINE: int = 100
+    MINING_MAX_WORKERS: int = 4  # Subreddits fetched in parallel per mining run
+    REDDIT_READ_REQUESTS_PER_MINUTE: int = 100  # Read-only API budget shared by a process's clients
     OPPORTUNITY_EXPIRY_HOURS: int = 24
 
     # Content Generation Settings
@@ -9,8 +9,11 @@ from app.models.opportunity import Opportunity
 from app.models.generated_content import GeneratedContent
 from app.models.content_performance import ContentPerformance
 from app.models.reddit_account import RedditAccount
+from app.models.reddit_account_rate import RedditAccountRate
 from app.models.subreddit_config import SubredditConfig
 from app.models.learning_feature import LearningFeature
+from app.models.user import User
+from app.models.user_credentials import UserCredentials
 
 # Export Base for Alembic
 __all__ = [
@@ -20,6 +23,9 @@ __all__ = [
     "GeneratedContent",
     "ContentPerformance",
     "RedditAccount",
+    "RedditAccountRate",
     "SubredditConfig",
     "LearningFeature",
+    "User",
+    "UserCredentials",
 ]
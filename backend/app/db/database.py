@@ -11,10 +11,10 @@ from app.core.config import settings
 # Create database engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,  # Enable connection health checks
-    pool_recycle=3600,   # Recycle connections after 1 hour
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,  # Enable connection health checks
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,  # Recycle connections before server idle timeouts
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
@@ -0,0 +1,59 @@
+"""
+Custom SQLAlchemy column types.
+"""
+import enum
+from typing import Any, Optional, Type
+
+from sqlalchemy import JSON, SmallInteger, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+# JSONB on PostgreSQL (binary storage, GIN-indexable), plain JSON elsewhere
+# so the SQLite test database keeps working.
+JSONBType = JSON().with_variant(JSONB(astext_type=Text()), "postgresql")
+
+
+def array_type(item_type: TypeEngine) -> TypeEngine:
+    """Native ARRAY of item_type on PostgreSQL, a JSON list elsewhere."""
+    return JSON().with_variant(ARRAY(item_type), "postgresql")
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a string enum as a SMALLINT code.
+
+    Codes follow the declaration order of the enum members, so new members
+    must only ever be appended. Python code keeps working with the string
+    values (``ContentStatus.PUBLISHED.value`` or ``"published"``); the
+    translation to and from the integer code happens on bind and on load,
+    which also applies to literals in filters such as ``status == "published"``.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[enum.Enum], *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        self._to_code = {member.value: code for code, member in enumerate(enum_class)}
+        self._from_code = {code: member.value for code, member in enumerate(enum_class)}
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, self.enum_class):
+            value = value.value
+        try:
+            return self._to_code[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {self.enum_class.__name__}")
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self._from_code[value]
+
+    @property
+    def python_type(self) -> type:
+        return str
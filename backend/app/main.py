@@ -5,7 +5,7 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.core.config import settings
 from app.db.database import engine
@@ -38,6 +38,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Adkuu Content Platform...")
+
+    # Close the shared LLM connection pool if a generator was created
+    from app.api.deps import get_content_generator
+    if get_content_generator.cache_info().currsize:
+        await get_content_generator().aclose()
+
     logger.info("Application shutdown complete")
 
 
@@ -50,6 +56,7 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson serializes the large list responses much faster
 )
 
 # Add CORS middleware
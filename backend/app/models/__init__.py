@@ -6,9 +6,11 @@ from app.models.opportunity import Opportunity, OpportunityStatus, OpportunityUr
 from app.models.generated_content import GeneratedContent, ContentStatus, ContentType, ContentStyle
 from app.models.content_performance import ContentPerformance
 from app.models.reddit_account import RedditAccount, AccountStatus
+from app.models.reddit_account_rate import RedditAccountRate
 from app.models.subreddit_config import SubredditConfig
 from app.models.learning_feature import LearningFeature, FeatureType
 from app.models.user import User, UserRole
+from app.models.user_credentials import UserCredentials
 
 __all__ = [
     # Models
@@ -17,9 +19,11 @@ __all__ = [
     "GeneratedContent",
     "ContentPerformance",
     "RedditAccount",
+    "RedditAccountRate",
     "SubredditConfig",
     "LearningFeature",
     "User",
+    "UserCredentials",
     # Enums
     "ProjectStatus",
     "AutomationLevel",
@@ -3,11 +3,12 @@ GeneratedContent model - represents LLM-generated content for opportunities.
 """
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped
 import enum
 
 from app.db.base_class import Base
+from app.db.types import JSONBType, SmallIntEnum
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -65,11 +66,11 @@ class GeneratedContent(Base):
         nullable=True,
         index=True
     )
+    # Covered by idx_content_project_status
     project_id: Mapped[int] = Column(
         Integer,
         ForeignKey("projects.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Content
@@ -83,12 +84,13 @@ class GeneratedContent(Base):
 
     # Quality assessment
     quality_score: Mapped[Optional[float]] = Column(Float, nullable=True)  # 0-1
-    quality_checks: Mapped[dict] = Column(JSON, default=dict, nullable=False)
+    quality_checks: Mapped[dict] = Column(JSONBType, default=dict, nullable=False)
     passed_quality_gates: Mapped[bool] = Column(Boolean, default=False, nullable=False)
 
     # Status tracking
+    # Stored as a SMALLINT code, exposed as the ContentStatus string value
     status: Mapped[str] = Column(
-        String(50),
+        SmallIntEnum(ContentStatus),
         default=ContentStatus.DRAFT.value,
         nullable=False,
         index=True
@@ -107,10 +109,15 @@ class GeneratedContent(Base):
 
     # Versioning (for regenerations)
     version: Mapped[int] = Column(Integer, default=1, nullable=False)
-    parent_content_id: Mapped[Optional[int]] = Column(Integer, nullable=True)
+    parent_content_id: Mapped[Optional[int]] = Column(
+        Integer,
+        ForeignKey("generated_contents.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True
+    )
 
     # LLM metadata
-    content_metadata: Mapped[dict] = Column(JSON, default=dict, nullable=False)
+    content_metadata: Mapped[dict] = Column(JSONBType, default=dict, nullable=False)
     # Stores: model_used, temperature, prompt_tokens, completion_tokens, etc.
 
     # Timestamps
@@ -141,6 +148,18 @@ class GeneratedContent(Base):
         back_populates="content",
         cascade="all, delete-orphan"
     )
+    parent: Mapped[Optional["GeneratedContent"]] = relationship(
+        "GeneratedContent",
+        remote_side=[id]
+    )
+
+    # Indexes for common queries; JSONB indexes are PostgreSQL only
+    __table_args__ = (
+        Index('idx_content_project_status', 'project_id', 'status'),
+        Index('idx_content_metadata_gin', content_metadata, postgresql_using='gin').ddl_if(dialect='postgresql'),
+        Index('idx_content_quality_checks_gin', quality_checks, postgresql_using='gin').ddl_if(dialect='postgresql'),
+        Index('idx_content_model', content_metadata['model'].as_string()).ddl_if(dialect='postgresql'),
+    )
 
     def __repr__(self) -> str:
         return f"<GeneratedContent(id={self.id}, status='{self.status}', version={self.version})>"
@@ -148,7 +167,7 @@ class GeneratedContent(Base):
     @property
     def is_published(self) -> bool:
         """Check if content has been published."""
-        return self.status == ContentStatus.PUBLISHED.value and self.published_reddit_id is not None
+        return self.status == ContentStatus.PUBLISHED and self.published_reddit_id is not None
 
     @property
     def word_count(self) -> int:
@@ -3,14 +3,19 @@ LearningFeature model - stores aggregated learning data for ML and optimization.
 """
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, UniqueConstraint
+import numpy as np
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship, Mapped
 
 from app.db.base_class import Base
+from app.db.types import JSONBType
 
 if TYPE_CHECKING:
     from app.models.project import Project
 
+# Shared generator for Thompson sampling (PCG64, no legacy global-state lock)
+_rng = np.random.default_rng()
+
 
 class FeatureType(str):
     """Types of learning features."""
@@ -38,7 +43,7 @@ class LearningFeature(Base):
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
 
     # Feature identification
-    feature_type: Mapped[str] = Column(String(50), nullable=False, index=True)
+    feature_type: Mapped[str] = Column(String(50), nullable=False)  # Covered by uq_feature_type_key_project
     feature_key: Mapped[str] = Column(String(255), nullable=False, index=True)
 
     # Optional project scope (None = global)
@@ -65,7 +70,7 @@ class LearningFeature(Base):
     confidence: Mapped[Optional[float]] = Column(Float, nullable=True)
 
     # Feature-specific detailed data
-    feature_data: Mapped[dict] = Column(JSON, default=dict, nullable=False)
+    feature_data: Mapped[dict] = Column(JSONBType, default=dict, nullable=False)
     # Structure depends on feature_type:
     # - subreddit: {"best_hours": [...], "best_days": [...], "topic_affinity": {...}}
     # - keyword: {"contexts": [...], "avg_relevance": float}
@@ -96,9 +101,10 @@ class LearningFeature(Base):
     # Relationships
     project: Mapped[Optional["Project"]] = relationship("Project")
 
-    # Unique constraint
+    # Unique constraint and JSONB index (PostgreSQL only)
     __table_args__ = (
         UniqueConstraint('feature_type', 'feature_key', 'project_id', name='uq_feature_type_key_project'),
+        Index('idx_feature_data_gin', feature_data, postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
 
     def __repr__(self) -> str:
@@ -146,8 +152,7 @@ class LearningFeature(Base):
         Returns:
             float: Sampled success probability
         """
-        import numpy as np
-        return np.random.beta(self.bandit_alpha, self.bandit_beta)
+        return float(_rng.beta(self.bandit_alpha, self.bandit_beta))
 
     def apply_decay(self, decay_rate: float = 0.99) -> None:
         """
@@ -3,11 +3,12 @@ Opportunity model - represents a Reddit post that's a potential advertising oppo
 """
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, JSON, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped
 import enum
 
 from app.db.base_class import Base
+from app.db.types import JSONBType, SmallIntEnum
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -50,12 +51,11 @@ class Opportunity(Base):
 
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
 
-    # Foreign key to project
+    # Foreign key to project (covered by idx_opp_project_status)
     project_id: Mapped[int] = Column(
         Integer,
         ForeignKey("projects.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Reddit post identification
@@ -65,7 +65,9 @@ class Opportunity(Base):
     # Post content
     post_title: Mapped[str] = Column(Text, nullable=False)
     post_content: Mapped[Optional[str]] = Column(Text, nullable=True)
-    post_url: Mapped[str] = Column(String(500), nullable=False)
+    # Deprecated: responses derive the URL (reddit_post_url). Still written so
+    # readers of the column keep working until it is dropped in a later release.
+    post_url: Mapped[Optional[str]] = Column(String(500), nullable=True)
     post_author: Mapped[Optional[str]] = Column(String(100), nullable=True)
 
     # Post metrics at discovery time
@@ -88,8 +90,9 @@ class Opportunity(Base):
     velocity_threshold: Mapped[Optional[float]] = Column(Float, nullable=True)
 
     # Status tracking
+    # Stored as a SMALLINT code, exposed as the OpportunityStatus string value
     status: Mapped[str] = Column(
-        String(50),
+        SmallIntEnum(OpportunityStatus),
         default=OpportunityStatus.PENDING.value,
         nullable=False,
         index=True
@@ -108,7 +111,7 @@ class Opportunity(Base):
     processed_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
 
     # Additional metadata (flexible storage)
-    opportunity_metadata: Mapped[dict] = Column(JSON, default=dict, nullable=False)
+    opportunity_metadata: Mapped[dict] = Column(JSONBType, default=dict, nullable=False)
 
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="opportunities")
@@ -121,8 +124,10 @@ class Opportunity(Base):
     # Indexes for common queries
     __table_args__ = (
         Index('idx_opp_project_status', 'project_id', 'status'),
+        Index('idx_opp_project_post', 'project_id', 'reddit_post_id'),
         Index('idx_opp_composite_desc', composite_score.desc()),
         Index('idx_opp_discovered', 'discovered_at'),
+        Index('idx_opp_metadata_gin', opportunity_metadata, postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
 
     def __repr__(self) -> str:
@@ -3,11 +3,12 @@ Project model - represents a product/service to advertise.
 """
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped
 import enum
 
 from app.db.base_class import Base
+from app.db.types import JSONBType
 
 if TYPE_CHECKING:
     from app.models.opportunity import Opportunity
@@ -100,7 +101,7 @@ class Project(Base):
     )
 
     # Additional settings (flexible JSON storage)
-    settings: Mapped[dict] = Column(JSON, default=dict, nullable=False)
+    settings: Mapped[dict] = Column(JSONBType, default=dict, nullable=False)
 
     # Timestamps
     created_at: Mapped[datetime] = Column(
@@ -135,7 +136,9 @@ class Project(Base):
     subreddit_configs: Mapped[List["SubredditConfig"]] = relationship(
         "SubredditConfig",
         back_populates="project",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        passive_deletes=True
     )
     generated_contents: Mapped[List["GeneratedContent"]] = relationship(
         "GeneratedContent",
@@ -143,5 +146,10 @@ class Project(Base):
         cascade="all, delete-orphan"
     )
 
+    # JSONB index (PostgreSQL only)
+    __table_args__ = (
+        Index('idx_project_settings_gin', settings, postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
+
     def __repr__(self) -> str:
         return f"<Project(id={self.id}, name='{self.name}', status='{self.status}')>"
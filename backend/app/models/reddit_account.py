@@ -3,15 +3,18 @@ RedditAccount model - manages Reddit accounts for multi-account publishing.
 """
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship, Mapped
 import enum
 
+from app.core.config import settings
 from app.db.base_class import Base
+from app.db.types import JSONBType
 
 if TYPE_CHECKING:
     from app.models.project import Project
     from app.models.generated_content import GeneratedContent
+    from app.models.reddit_account_rate import RedditAccountRate
 
 
 class AccountStatus(str, enum.Enum):
@@ -68,11 +71,6 @@ class RedditAccount(Base):
     account_age_days: Mapped[Optional[int]] = Column(Integer, nullable=True)
     account_created_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
 
-    # Rate limiting
-    last_action_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
-    daily_actions_count: Mapped[int] = Column(Integer, default=0, nullable=False)
-    daily_actions_reset_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
-
     # Health metrics
     status: Mapped[str] = Column(
         String(50),
@@ -90,7 +88,7 @@ class RedditAccount(Base):
     removal_rate: Mapped[float] = Column(Float, default=0.0, nullable=False)
 
     # Subreddit activity tracking (for selection)
-    subreddit_activity: Mapped[dict] = Column(JSON, default=dict, nullable=False)
+    subreddit_activity: Mapped[dict] = Column(JSONBType, default=dict, nullable=False)
     # Structure: {"subreddit_name": {"posts": N, "karma": N, "last_activity": timestamp}}
 
     # Additional metadata
@@ -119,10 +117,54 @@ class RedditAccount(Base):
         "GeneratedContent",
         back_populates="reddit_account"
     )
+    # Rate limiting counters live in reddit_account_rates (see RedditAccountRate)
+    rate: Mapped[Optional["RedditAccountRate"]] = relationship(
+        "RedditAccountRate",
+        back_populates="account",
+        uselist=False,
+        lazy="joined",
+        cascade="all, delete-orphan"
+    )
+
+    # JSONB index (PostgreSQL only)
+    __table_args__ = (
+        Index('idx_account_subreddit_activity_gin', subreddit_activity, postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
 
     def __repr__(self) -> str:
         return f"<RedditAccount(id={self.id}, username='{self.username}', status='{self.status}')>"
 
+    def _ensure_rate(self) -> "RedditAccountRate":
+        """Get the rate-limit row, creating it on first write."""
+        if self.rate is None:
+            from app.models.reddit_account_rate import RedditAccountRate
+            self.rate = RedditAccountRate(daily_actions_count=0)
+        return self.rate
+
+    @property
+    def last_action_at(self) -> Optional[datetime]:
+        return self.rate.last_action_at if self.rate else None
+
+    @last_action_at.setter
+    def last_action_at(self, value: Optional[datetime]) -> None:
+        self._ensure_rate().last_action_at = value
+
+    @property
+    def daily_actions_count(self) -> int:
+        return (self.rate.daily_actions_count or 0) if self.rate else 0
+
+    @daily_actions_count.setter
+    def daily_actions_count(self, value: int) -> None:
+        self._ensure_rate().daily_actions_count = value
+
+    @property
+    def daily_actions_reset_at(self) -> Optional[datetime]:
+        return self.rate.daily_actions_reset_at if self.rate else None
+
+    @daily_actions_reset_at.setter
+    def daily_actions_reset_at(self, value: Optional[datetime]) -> None:
+        self._ensure_rate().daily_actions_reset_at = value
+
     @property
     def is_active(self) -> bool:
         """Check if account is active and usable."""
@@ -131,8 +173,6 @@ class RedditAccount(Base):
     @property
     def can_post(self) -> bool:
         """Check if account can make a post right now."""
-        from app.core.config import settings
-
         if not self.is_active:
             return False
 
@@ -174,7 +214,6 @@ class RedditAccount(Base):
         score *= self.health_score
 
         # Penalize if close to daily limit
-        from app.core.config import settings
         remaining = settings.MAX_DAILY_POSTS_PER_ACCOUNT - self.daily_actions_count
         if remaining <= 2:
             score -= 10
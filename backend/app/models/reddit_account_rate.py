@@ -0,0 +1,48 @@
+"""
+RedditAccountRate model - high-frequency rate-limit counters for a Reddit account.
+"""
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.orm import relationship, Mapped
+
+from app.db.base_class import Base
+
+if TYPE_CHECKING:
+    from app.models.reddit_account import RedditAccount
+
+
+class RedditAccountRate(Base):
+    """
+    Rate-limit counters for a RedditAccount.
+
+    Kept in a narrow side table so that the per-action updates don't
+    rewrite the wide reddit_accounts row (tokens, JSON activity, metadata).
+
+    Rows are versioned for optimistic concurrency: an UPDATE only applies if
+    the version it read is still current, otherwise StaleDataError is raised
+    and the caller re-reads and retries instead of holding a row lock.
+    """
+
+    __tablename__ = "reddit_account_rates"
+
+    account_id: Mapped[int] = Column(
+        Integer,
+        ForeignKey("reddit_accounts.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    last_action_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
+    daily_actions_count: Mapped[int] = Column(Integer, default=0, nullable=False)
+    daily_actions_reset_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
+
+    # Optimistic concurrency counter (managed by SQLAlchemy)
+    version: Mapped[int] = Column(Integer, nullable=False)
+
+    # Relationships
+    account: Mapped["RedditAccount"] = relationship("RedditAccount", back_populates="rate")
+
+    __mapper_args__ = {"version_id_col": version}
+
+    def __repr__(self) -> str:
+        return f"<RedditAccountRate(account_id={self.account_id}, daily_actions_count={self.daily_actions_count})>"
@@ -3,15 +3,40 @@ SubredditConfig model - stores configuration and metadata for target subreddits.
 """
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON, ForeignKey, Text, UniqueConstraint
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy import Integer, String, Float, DateTime, Boolean, ForeignKey, Text, UniqueConstraint, Index, Computed, func, text
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.db.base_class import Base
+from app.db.types import JSONBType, array_type
 
 if TYPE_CHECKING:
     from app.models.project import Project
 
 
+# Default velocity thresholds for small / medium / large / massive subreddits;
+# subreddits of unknown size use the medium value.
+_VELOCITY_DEFAULTS = (5.0, 15.0, 50.0, 200.0)
+
+# SQL mirrors of size_category / get_velocity_threshold() for the generated columns.
+# PostgreSQL doesn't let a generated column reference another, so the CASE is repeated.
+_SIZE_CATEGORY_SQL = (
+    "CASE WHEN subscribers IS NULL OR subscribers = 0 THEN 'unknown' "
+    "WHEN subscribers < 50000 THEN 'small' "
+    "WHEN subscribers < 500000 THEN 'medium' "
+    "WHEN subscribers < 2000000 THEN 'large' "
+    "ELSE 'massive' END"
+)
+_VELOCITY_THRESHOLD_SQL = (
+    "COALESCE(NULLIF(velocity_threshold, 0), "
+    "CASE WHEN subscribers IS NULL OR subscribers = 0 THEN 15.0 "
+    "WHEN subscribers < 50000 THEN 5.0 "
+    "WHEN subscribers < 500000 THEN 15.0 "
+    "WHEN subscribers < 2000000 THEN 50.0 "
+    "ELSE 200.0 END)"
+)
+
+
 class SubredditConfig(Base):
     """
     SubredditConfig model for storing subreddit-specific configuration.
@@ -25,83 +50,114 @@ class SubredditConfig(Base):
 
     __tablename__ = "subreddit_configs"
 
-    id: Mapped[int] = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
-    # Foreign key to project
-    project_id: Mapped[int] = Column(
+    # Foreign key to project (covered by uq_project_subreddit)
+    project_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("projects.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Subreddit identification
-    subreddit_name: Mapped[str] = Column(String(100), nullable=False, index=True)
+    subreddit_name: Mapped[str] = mapped_column(String(32), nullable=False, index=True)  # Reddit caps names at 21 chars
 
     # Subreddit metadata
-    subscribers: Mapped[Optional[int]] = Column(Integer, nullable=True)
-    active_users: Mapped[Optional[int]] = Column(Integer, nullable=True)
-    posts_per_day: Mapped[Optional[float]] = Column(Float, nullable=True)
-    subreddit_type: Mapped[Optional[str]] = Column(String(50), nullable=True)  # public, restricted, private
+    subscribers: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    active_users: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    posts_per_day: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    subreddit_type: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)  # public, restricted, private
 
     # Posting requirements
-    min_account_age_days: Mapped[Optional[int]] = Column(Integer, nullable=True)
-    min_karma: Mapped[Optional[int]] = Column(Integer, nullable=True)
-    min_comment_karma: Mapped[Optional[int]] = Column(Integer, nullable=True)
-    allowed_content_types: Mapped[Optional[list]] = Column(JSON, nullable=True)  # ['text', 'link', 'image']
+    min_account_age_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    min_karma: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    min_comment_karma: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    allowed_content_types: Mapped[Optional[list]] = mapped_column(array_type(String(16)), nullable=True)  # ['text', 'link', 'image']
 
     # Rules and guidelines
-    posting_rules: Mapped[Optional[str]] = Column(Text, nullable=True)
-    rules_summary: Mapped[Optional[str]] = Column(Text, nullable=True)
+    # Full rules text can run to several KB; only loaded when accessed
+    posting_rules: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
+    rules_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Performance history
-    avg_post_score: Mapped[Optional[float]] = Column(Float, nullable=True)
-    avg_comment_score: Mapped[Optional[float]] = Column(Float, nullable=True)
-    our_avg_score: Mapped[Optional[float]] = Column(Float, nullable=True)  # Our content's avg score
-    our_removal_rate: Mapped[Optional[float]] = Column(Float, nullable=True)
+    avg_post_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_comment_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    our_avg_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Our content's avg score
+    our_removal_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # Optimal timing
-    best_posting_hours: Mapped[Optional[list]] = Column(JSON, nullable=True)  # List of UTC hours
-    best_posting_days: Mapped[Optional[list]] = Column(JSON, nullable=True)   # List of weekday numbers
+    best_posting_hours: Mapped[Optional[list]] = mapped_column(array_type(Integer), nullable=True)  # List of UTC hours
+    best_posting_days: Mapped[Optional[list]] = mapped_column(array_type(Integer), nullable=True)   # List of weekday numbers
 
     # Velocity thresholds (for rising post detection)
-    velocity_threshold: Mapped[Optional[float]] = Column(Float, nullable=True)
+    velocity_threshold: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    # Denormalized, database-generated copies of size_category / get_velocity_threshold()
+    # so they can be filtered and indexed in SQL
+    size_category_stored: Mapped[Optional[str]] = mapped_column(
+        "size_category",
+        String(16),
+        Computed(_SIZE_CATEGORY_SQL, persisted=True),
+        index=True
+    )
+    effective_velocity_threshold: Mapped[Optional[float]] = mapped_column(
+        Float,
+        Computed(_VELOCITY_THRESHOLD_SQL, persisted=True)
+    )
 
     # Status
-    is_enabled: Mapped[bool] = Column(Boolean, default=True, nullable=False)
-    last_analyzed_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
-    last_mined_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
+    is_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    last_analyzed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_mined_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Additional configuration
-    config_metadata: Mapped[dict] = Column(JSON, default=dict, nullable=False)
+    config_metadata: Mapped[dict] = mapped_column(JSONBType, server_default=text("'{}'"), nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = Column(
-        DateTime,
-        default=datetime.utcnow,
+    # Stamped by the database rather than in Python
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False
     )
-    updated_at: Mapped[datetime] = Column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
     # Relationships
-    project: Mapped["Project"] = relationship("Project", back_populates="subreddit_configs")
+    # Lazy: joining it would also pull in Project.preferred_account and its rate row
+    project: Mapped["Project"] = relationship("Project", back_populates="subreddit_configs", lazy="select")
 
-    # Unique constraint
+    # Unique constraint; array/JSONB indexes are PostgreSQL only
     __table_args__ = (
         UniqueConstraint('project_id', 'subreddit_name', name='uq_project_subreddit'),
+        # "Enabled configs for project X, ordered by name" as an index-only scan
+        Index(
+            'ix_subreddit_cfg_project_enabled',
+            'project_id', 'is_enabled', 'subreddit_name',
+            postgresql_include=['subscribers', 'velocity_threshold']
+        ),
+        Index('ix_subreddit_best_hours_gin', best_posting_hours, postgresql_using='gin').ddl_if(dialect='postgresql'),
+        Index('ix_subreddit_cfg_meta_gin', config_metadata, postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
 
+    # Fetch server-generated values (timestamps, computed columns) in the INSERT/UPDATE itself
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<SubredditConfig(id={self.id}, subreddit='{self.subreddit_name}')>"
 
-    @property
+    @hybrid_property
     def size_category(self) -> str:
-        """Categorize subreddit by size."""
+        """
+        Categorize subreddit by size.
+
+        Computed in Python on instances (also correct before flush); in
+        queries it maps to the stored size_category column.
+        """
         if not self.subscribers:
             return "unknown"
         elif self.subscribers < 50000:
@@ -113,17 +169,24 @@ class SubredditConfig(Base):
         else:
             return "massive"
 
+    @size_category.inplace.expression
+    @classmethod
+    def _size_category_expression(cls):
+        return cls.size_category_stored
+
     def get_velocity_threshold(self) -> float:
         """Get velocity threshold based on subreddit size."""
         if self.velocity_threshold:
             return self.velocity_threshold
 
-        # Default thresholds by size
-        thresholds = {
-            "small": 5.0,
-            "medium": 15.0,
-            "large": 50.0,
-            "massive": 200.0,
-            "unknown": 15.0
-        }
-        return thresholds.get(self.size_category, 15.0)
+        # Default thresholds by size (same bands as size_category)
+        subscribers = self.subscribers
+        if not subscribers:
+            return _VELOCITY_DEFAULTS[1]
+        if subscribers < 50000:
+            return _VELOCITY_DEFAULTS[0]
+        if subscribers < 500000:
+            return _VELOCITY_DEFAULTS[1]
+        if subscribers < 2000000:
+            return _VELOCITY_DEFAULTS[2]
+        return _VELOCITY_DEFAULTS[3]
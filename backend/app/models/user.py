@@ -2,13 +2,16 @@
 User model with role-based access control.
 """
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum
-from sqlalchemy.orm import Mapped
+from typing import Optional, TYPE_CHECKING
+from sqlalchemy import Integer, String, DateTime, Boolean, Enum as SQLEnum, Index, func, text
+from sqlalchemy.orm import relationship, Mapped, mapped_column
 import enum
 
 from app.db.base_class import Base
 
+if TYPE_CHECKING:
+    from app.models.user_credentials import UserCredentials
+
 
 class UserRole(str, enum.Enum):
     """User role enum."""
@@ -27,39 +30,99 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id: Mapped[int] = Column(Integer, primary_key=True, index=True)
-    email: Mapped[str] = Column(String(255), unique=True, nullable=False, index=True)
-    name: Mapped[str] = Column(String(255), nullable=False)
-    password_hash: Mapped[str] = Column(String(255), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
 
     # Role-based access
-    role: Mapped[str] = Column(
-        String(50),
+    # Native PostgreSQL ENUM storing the enum values ('admin', 'user')
+    role: Mapped[str] = mapped_column(
+        SQLEnum(
+            UserRole,
+            name="user_role",
+            native_enum=True,
+            values_callable=lambda roles: [r.value for r in roles],
+        ),
         default=UserRole.USER.value,
         nullable=False,
         index=True
     )
 
     # Account status
-    is_active: Mapped[bool] = Column(Boolean, default=True, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = Column(
-        DateTime,
-        default=datetime.utcnow,
+    # Stamped by the database rather than in Python
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False
     )
-    updated_at: Mapped[datetime] = Column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
-    last_login_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
+
+    # Name, password hash and last login live in user_credentials (see UserCredentials).
+    # Never lazy loaded: callers that need them must selectinload(User.credentials).
+    credentials: Mapped[Optional["UserCredentials"]] = relationship(
+        "UserCredentials",
+        back_populates="user",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Partial index over active accounts only (PostgreSQL only); the global
+    # unique index on email still guards against reusing a deactivated address
+    __table_args__ = (
+        Index(
+            'uq_users_email_active',
+            'email',
+            unique=True,
+            postgresql_where=text('is_active')
+        ).ddl_if(dialect='postgresql'),
+    )
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email='{self.email}', role='{self.role}')>"
 
+    def _ensure_credentials(self) -> "UserCredentials":
+        """Get the credentials row, creating it on first write."""
+        if self.credentials is None:
+            from app.models.user_credentials import UserCredentials
+            self.credentials = UserCredentials()
+        return self.credentials
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.credentials.name if self.credentials else None
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._ensure_credentials().name = value
+
+    @property
+    def password_hash(self) -> Optional[str]:
+        return self.credentials.password_hash if self.credentials else None
+
+    @password_hash.setter
+    def password_hash(self, value: str) -> None:
+        self._ensure_credentials().password_hash = value
+
+    @property
+    def last_login_at(self) -> Optional[datetime]:
+        return self.credentials.last_login_at if self.credentials else None
+
+    @last_login_at.setter
+    def last_login_at(self, value: Optional[datetime]) -> None:
+        self._ensure_credentials().last_login_at = value
+
     @property
     def is_admin(self) -> bool:
         """Check if user has admin role."""
@@ -0,0 +1,40 @@
+"""
+UserCredentials model - cold profile and login fields for a User.
+"""
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+from sqlalchemy import Integer, String, DateTime, ForeignKey
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+
+from app.db.base_class import Base
+
+if TYPE_CHECKING:
+    from app.models.user import User
+
+
+class UserCredentials(Base):
+    """
+    Password hash and profile fields for a User.
+
+    Kept out of the users table so the row read on every authenticated
+    request (id, email, role, is_active) stays narrow. Only login and the
+    user management endpoints load it.
+    """
+
+    __tablename__ = "user_credentials"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Relationships
+    user: Mapped["User"] = relationship("User", back_populates="credentials")
+
+    def __repr__(self) -> str:
+        return f"<UserCredentials(user_id={self.user_id})>"
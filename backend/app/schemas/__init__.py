@@ -12,6 +12,7 @@ from app.schemas.project import (
     SubredditConfigResponse,
 )
 from app.schemas.opportunity import (
+    OpportunityMetadata,
     OpportunityCreate,
     OpportunityResponse,
     OpportunityDetailResponse,
@@ -22,6 +23,8 @@ from app.schemas.opportunity import (
     ApproveRejectRequest,
 )
 from app.schemas.content import (
+    QualityChecks,
+    ContentMetadata,
     ContentCreate,
     ContentUpdate,
     ContentResponse,
@@ -67,6 +70,7 @@ __all__ = [
     "SubredditConfigUpdate",
     "SubredditConfigResponse",
     # Opportunity
+    "OpportunityMetadata",
     "OpportunityCreate",
     "OpportunityResponse",
     "OpportunityDetailResponse",
@@ -76,6 +80,8 @@ __all__ = [
     "MiningResult",
     "ApproveRejectRequest",
     # Content
+    "QualityChecks",
+    "ContentMetadata",
     "ContentCreate",
     "ContentUpdate",
     "ContentResponse",
@@ -3,7 +3,7 @@ Pydantic schemas for Analytics endpoints.
 """
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 class ProjectAnalytics(BaseModel):
@@ -93,8 +93,11 @@ class LearningFeatureResponse(BaseModel):
     feature_data: Dict[str, Any] = Field(default_factory=dict)
     last_updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validates a whole page of ORM rows in one call (from_attributes=True)
+LEARNING_FEATURE_LIST_ADAPTER = TypeAdapter(List[LearningFeatureResponse])
 
 
 class LearningInsights(BaseModel):
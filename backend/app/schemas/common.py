@@ -0,0 +1,22 @@
+"""
+Shared Pydantic building blocks for the endpoint schemas.
+"""
+from pydantic import BaseModel, ConfigDict, SerializerFunctionWrapHandler, model_serializer
+
+
+class StoredMetadata(BaseModel):
+    """
+    Typed view of a JSON metadata column.
+
+    Declared keys are optional and unknown keys are passed through. Only the
+    keys actually stored are serialized, so a response doesn't gain null
+    entries for declared keys the row never had.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    # No return annotation: it would replace the declared fields in the JSON schema
+    @model_serializer(mode="wrap")
+    def _serialize_stored_keys(self, handler: SerializerFunctionWrapHandler):
+        data = handler(self)
+        return {key: value for key, value in data.items() if key in self.model_fields_set}
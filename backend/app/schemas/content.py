@@ -3,7 +3,34 @@ Pydantic schemas for Content endpoints.
 """
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+
+from app.schemas.common import StoredMetadata
+
+
+class QualityChecks(StoredMetadata):
+    """Known keys of GeneratedContent.quality_checks (QualityCheckResult.to_dict()); unknown keys are passed through."""
+    passed: Optional[bool] = None
+    overall_score: Optional[float] = None
+    checks: Optional[List[Dict[str, Any]]] = None
+    blocking_issues: Optional[List[str]] = None
+    warnings: Optional[List[str]] = None
+
+
+class ContentMetadata(StoredMetadata):
+    """Known keys of GeneratedContent.content_metadata; unknown keys are passed through."""
+    model: Optional[str] = None
+    provider: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    style: Optional[str] = None
+    mention_strategy: Optional[str] = None
+    strategy_reason: Optional[str] = None
+    regenerated_from: Optional[int] = None
+    feedback: Optional[str] = None
+    generated_at: Optional[str] = None
 
 
 class ContentBase(BaseModel):
@@ -37,7 +64,7 @@ class ContentResponse(ContentBase):
 
     # Quality
     quality_score: Optional[float] = None
-    quality_checks: Dict[str, Any] = Field(default_factory=dict)
+    quality_checks: QualityChecks = Field(default_factory=QualityChecks)
     passed_quality_gates: bool
 
     # Status
@@ -55,14 +82,13 @@ class ContentResponse(ContentBase):
     parent_content_id: Optional[int] = None
 
     # Metadata
-    content_metadata: Dict[str, Any] = Field(default_factory=dict)
+    content_metadata: ContentMetadata = Field(default_factory=ContentMetadata)
 
     # Timestamps
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ContentDetailResponse(ContentResponse):
@@ -82,6 +108,10 @@ class ContentListResponse(BaseModel):
     limit: int
 
 
+# Validates a whole page of ORM rows in one call (from_attributes=True)
+CONTENT_LIST_ADAPTER = TypeAdapter(List[ContentResponse])
+
+
 class ContentFilter(BaseModel):
     """Schema for filtering content."""
     project_id: Optional[int] = None
@@ -132,8 +162,7 @@ class PerformanceSnapshot(BaseModel):
     is_removed: bool
     removal_reason: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ContentPerformanceResponse(BaseModel):
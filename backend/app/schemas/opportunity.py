@@ -3,7 +3,18 @@ Pydantic schemas for Opportunity endpoints.
 """
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, computed_field
+
+from app.schemas.common import StoredMetadata
+from app.utils.reddit_helpers import reddit_post_url
+
+
+class OpportunityMetadata(StoredMetadata):
+    """Known keys of Opportunity.opportunity_metadata; unknown keys are passed through."""
+    is_self: Optional[bool] = None
+    link_flair_text: Optional[str] = None
+    over_18: Optional[bool] = None
+    rejection_reason: Optional[str] = None
 
 
 class OpportunityBase(BaseModel):
@@ -12,7 +23,6 @@ class OpportunityBase(BaseModel):
     subreddit: str
     post_title: str
     post_content: Optional[str] = None
-    post_url: str
     post_author: Optional[str] = None
 
 
@@ -56,10 +66,15 @@ class OpportunityResponse(OpportunityBase):
     processed_at: Optional[datetime] = None
 
     # Metadata
-    opportunity_metadata: Dict[str, Any] = Field(default_factory=dict)
+    opportunity_metadata: OpportunityMetadata = Field(default_factory=OpportunityMetadata)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @computed_field
+    @property
+    def post_url(self) -> str:
+        """Reddit URL of the post, derived rather than stored per row."""
+        return reddit_post_url(self.subreddit, self.reddit_post_id)
 
 
 class OpportunityDetailResponse(OpportunityResponse):
@@ -77,6 +92,10 @@ class OpportunityListResponse(BaseModel):
     limit: int
 
 
+# Validates a whole page of ORM rows in one call (from_attributes=True)
+OPPORTUNITY_LIST_ADAPTER = TypeAdapter(List[OpportunityResponse])
+
+
 class OpportunityFilter(BaseModel):
     """Schema for filtering opportunities."""
     project_id: Optional[int] = None
@@ -2,8 +2,11 @@
 Pydantic schemas for Project endpoints.
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Annotated, Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, Field, HttpUrl, ConfigDict, StringConstraints, TypeAdapter
+
+# Same bounds as SubredditConfig.subreddit_name
+SubredditName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=32)]
 
 
 class ProjectBase(BaseModel):
@@ -35,7 +38,7 @@ class ProjectBase(BaseModel):
 
 class ProjectCreate(ProjectBase):
     """Schema for creating a Project."""
-    pass
+    target_subreddits: List[SubredditName] = Field(default_factory=list)
 
 
 class ProjectUpdate(BaseModel):
@@ -45,7 +48,7 @@ class ProjectUpdate(BaseModel):
     brand_voice: Optional[str] = None
     product_context: Optional[str] = None
     website_url: Optional[str] = None
-    target_subreddits: Optional[List[str]] = None
+    target_subreddits: Optional[List[SubredditName]] = None
     keywords: Optional[List[str]] = None
     negative_keywords: Optional[List[str]] = None
     automation_level: Optional[int] = Field(None, ge=1, le=4)
@@ -64,8 +67,7 @@ class ProjectResponse(ProjectBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProjectDetailResponse(ProjectResponse):
@@ -84,10 +86,14 @@ class ProjectListResponse(BaseModel):
     limit: int
 
 
+# Validates a whole page of ORM rows in one call (from_attributes=True)
+PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectResponse])
+
+
 # Subreddit config schemas
 class SubredditConfigBase(BaseModel):
     """Base schema for SubredditConfig."""
-    subreddit_name: str = Field(..., min_length=1, max_length=100)
+    subreddit_name: str = Field(..., min_length=1, max_length=32)
     min_account_age_days: Optional[int] = None
     min_karma: Optional[int] = None
     posting_rules: Optional[str] = None
@@ -124,5 +130,7 @@ class SubredditConfigResponse(SubredditConfigBase):
     last_analyzed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+SUBREDDIT_CONFIG_LIST_ADAPTER = TypeAdapter(List[SubredditConfigResponse])
@@ -3,7 +3,7 @@ Pydantic schemas for Reddit Account endpoints.
 """
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class RedditAccountBase(BaseModel):
@@ -60,8 +60,17 @@ class RedditAccountResponse(RedditAccountBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, account: Any) -> "RedditAccountResponse":
+        """
+        Build from a RedditAccount row without validation.
+
+        Only for trusted ORM objects - column types are already guaranteed
+        by the database. Never use for request data.
+        """
+        return cls.model_construct(**{name: getattr(account, name) for name in cls.model_fields})
 
 
 class RedditAccountDetailResponse(RedditAccountResponse):
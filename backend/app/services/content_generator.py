@@ -5,19 +5,206 @@ Philosophy: Every comment must genuinely help the reader. Product mentions are
 rare and only when truly relevant. The account username IS the product -
 interested users will discover it naturally by clicking the profile.
 """
+import asyncio
+import hashlib
+import json
 import logging
 import re
-from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime
-from openai import OpenAI
-from anthropic import Anthropic
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
+from datetime import datetime, timezone
+import httpx
+from openai import AsyncOpenAI
+from anthropic import AsyncAnthropic
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 
 from app.core.config import settings
 from app.models import Opportunity, Project, GeneratedContent, ContentStatus, ContentStyle
+from app.services.semantic_cache import SemanticCache
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
 
+class LLMResponseCache:
+    """
+    Process-local LRU of LLM responses with a TTL.
+
+    Keyed on a blake2b digest of (system prompt, user prompt, model,
+    temperature); values are the post-processed text and provider metadata
+    of the generation. Only touched between awaits, so no lock is needed.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def cache_key(system_prompt: str, user_prompt: str, model: str) -> str:
+        """Digest of everything that determines an LLM response."""
+        return hashlib.blake2b(
+            b"\0".join((
+                system_prompt.encode(),
+                user_prompt.encode(),
+                model.encode(),
+                str(settings.DEFAULT_LLM_TEMPERATURE).encode(),
+            )),
+            digest_size=16,
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def set(self, key: str, content_text: str, metadata: Dict[str, Any]) -> None:
+        _lru_put(self._entries, key, (time.monotonic(), content_text, metadata), self.maxsize)
+
+
+# Process-local caches of built prompts.
+# System prompts are keyed on (project id, project updated_at, subreddit, style,
+# mention strategy); the style-independent part of user prompts on
+# (opportunity id, score, comment count).
+# Any edit to the project bumps updated_at, so stale prompts stop being looked up.
+_PROMPT_CACHE_SIZE = 256
+_system_prompt_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_user_prompt_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+# Process-wide circuit breakers, so an outage seen by one request fast-fails the rest
+_openai_breaker = CircuitBreaker(
+    "openai",
+    failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.LLM_CIRCUIT_RESET_SECONDS,
+)
+_anthropic_breaker = CircuitBreaker(
+    "anthropic",
+    failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.LLM_CIRCUIT_RESET_SECONDS,
+)
+
+# Process-wide request-rate limits, so concurrent bulk callers stay under the
+# provider RPM limit instead of triggering 429 storms
+_openai_limiter = RateLimiter("openai", settings.LLM_REQUESTS_PER_MINUTE)
+_anthropic_limiter = RateLimiter("anthropic", settings.LLM_REQUESTS_PER_MINUTE)
+
+# In-flight LLM call slots. Semaphores bind to an event loop, so there is one
+# per loop: the API server's loop and each Celery worker's persistent loop
+# (_run_async in app.tasks.generate_content), which lives as long as the worker.
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Concurrency cap for LLM calls on the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+    return semaphore
+
+
+def _lru_put(cache: OrderedDict, key: Any, value: Any, maxsize: int) -> None:
+    """Insert into an OrderedDict-backed LRU, evicting the oldest entry."""
+    cache[key] = value
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+# Leading block of every system prompt. It never varies, so it stays byte-identical
+# across calls and forms the prefix that OpenAI caches automatically and that
+# Anthropic caches via cache_control. Anything per-project or per-post goes after it.
+_STATIC_SYSTEM_PREFIX = """You are a real Reddit user. You have genuine knowledge and experience in your field. You're here because you enjoy helping people and being part of the community - NOT to promote anything.
+
+AUTHENTICITY RULES (CRITICAL):
+1. Write like a REAL person - use natural language, occasional imperfections are OK
+2. Your comment must be GENUINELY HELPFUL even if the reader never learns about any product
+3. Share real insights, not generic advice anyone could Google
+4. Match the subreddit's culture - read the room
+5. Be concise - Reddit rewards density of value, not length
+6. If you don't know something, say so or don't comment on that aspect
+7. React naturally to the post - empathy for frustrations, enthusiasm for wins
+
+OUTPUT: Write ONLY the Reddit comment. No meta-text, no "Here's a comment:", no explanations. Just the authentic comment a real user would post.
+
+"""
+
+
+# Character cap used when tiktoken is unavailable (~600 English tokens)
+_POST_CONTENT_MAX_CHARS = 2500
+# Generous upper bound on characters per token, used to avoid tokenizing the
+# whole of a very long post only to keep its first few hundred tokens
+_MAX_CHARS_PER_TOKEN = 16
+_token_encoding = None
+
+
+def _get_token_encoding():
+    """Load the tokenizer for the default model on first use (it may download BPE files)."""
+    global _token_encoding
+    if _token_encoding is None:
+        try:
+            _token_encoding = tiktoken.encoding_for_model(settings.DEFAULT_LLM_MODEL)
+        except KeyError:
+            _token_encoding = tiktoken.get_encoding("o200k_base")
+    return _token_encoding
+
+
+def _truncate_post_content(content: str) -> str:
+    """
+    Cap post content at MAX_POST_CONTENT_TOKENS tokens.
+
+    A character cap lets non-English posts (Estonian, Japanese, ...) cost
+    several times more tokens than English ones; a token cap keeps the
+    prompt size predictable. Falls back to the character cap without tiktoken.
+    """
+    max_tokens = settings.MAX_POST_CONTENT_TOKENS
+    if len(content) <= max_tokens:
+        # Every token covers at least one character
+        return content
+
+    if not TIKTOKEN_AVAILABLE:
+        return content[:_POST_CONTENT_MAX_CHARS]
+
+    try:
+        encoding = _get_token_encoding()
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, truncating by characters: {e}")
+        return content[:_POST_CONTENT_MAX_CHARS]
+
+    bounded = content[:max_tokens * _MAX_CHARS_PER_TOKEN]
+    tokens = encoding.encode(bounded)
+    if len(tokens) <= max_tokens:
+        return bounded
+    return encoding.decode(tokens[:max_tokens])
+
+
+_response_cache = LLMResponseCache(
+    maxsize=settings.LLM_RESPONSE_CACHE_SIZE,
+    ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
 class MentionStrategy:
     """Determines if/how to mention the product based on context."""
 
@@ -26,62 +213,78 @@ class MentionStrategy:
     NATURAL = "natural"       # Can mention if flows naturally
     DIRECT = "direct"         # Direct recommendation appropriate
 
-    @staticmethod
-    def analyze_opportunity(opportunity: Opportunity, project: Project) -> Tuple[str, str]:
-        """
-        Analyze the opportunity to determine appropriate mention strategy.
-
-        Returns:
-            Tuple of (strategy, reasoning)
-        """
-        title_lower = opportunity.post_title.lower()
-        content_lower = (opportunity.post_content or "").lower()
-        combined = f"{title_lower} {content_lower}"
-
+    # Signal phrases per strategy, highest intent first. Within a category the
+    # earlier phrase is the one quoted in the reasoning.
+    SIGNAL_CATEGORIES = (
         # Direct recommendation requests - can mention product
-        recommendation_signals = [
+        (NATURAL, "User is actively seeking recommendations ('{signal}')", (
             "recommend", "suggestion", "what do you use", "what should i",
             "looking for", "any good", "best way to", "how do you",
             "what's the best", "alternatives to", "similar to",
-            "does anyone know", "help me find", "need advice on"
-        ]
-
+            "does anyone know", "help me find", "need advice on",
+        )),
         # Questions seeking help - be helpful, maybe subtle hint
-        help_signals = [
+        (SUBTLE, "User needs help ('{signal}') - focus on solving their problem", (
             "how do i", "how can i", "help with", "struggling with",
             "can't figure out", "problem with", "issue with", "doesn't work",
-            "any tips", "advice", "question about"
-        ]
-
+            "any tips", "advice", "question about",
+        )),
         # Discussion/opinion threads - pure value, no mention
-        discussion_signals = [
+        (NEVER, "Discussion thread ('{signal}') - contribute genuine perspective", (
             "what do you think", "opinion on", "thoughts on", "discuss",
-            "debate", "unpopular opinion", "hot take", "rant"
-        ]
+            "debate", "unpopular opinion", "hot take", "rant",
+        )),
+    )
+
+    # (strategy, reason template, signal) in priority order
+    _SIGNAL_RANKING = tuple(
+        (strategy, reason, signal)
+        for strategy, reason, signals in SIGNAL_CATEGORIES
+        for signal in signals
+    )
+
+    # All signals in one pass over the text. The lookahead reports a match at
+    # every position, overlapping ones included, and one group per signal tells
+    # which signal it was; at a given position the highest-ranked signal wins
+    # because alternatives are tried in ranking order. Matching ignores case so
+    # the post never has to be lowercased.
+    _SIGNAL_PATTERN = re.compile(
+        "(?=" + "|".join(f"({re.escape(signal)})" for _, _, signal in _SIGNAL_RANKING) + ")",
+        re.IGNORECASE,
+    )
 
-        # Check for recommendation requests first (highest intent)
-        for signal in recommendation_signals:
-            if signal in combined:
-                return (
-                    MentionStrategy.NATURAL,
-                    f"User is actively seeking recommendations ('{signal}')"
-                )
+    @staticmethod
+    def analyze_opportunity(opportunity: Opportunity, project: Project) -> Tuple[str, str]:
+        """
+        Analyze the opportunity to determine appropriate mention strategy.
 
-        # Check for help requests
-        for signal in help_signals:
-            if signal in combined:
-                return (
-                    MentionStrategy.SUBTLE,
-                    f"User needs help ('{signal}') - focus on solving their problem"
-                )
+        Returns:
+            Tuple of (strategy, reasoning)
+        """
+        return MentionStrategy.analyze(opportunity.post_title, opportunity.post_content or "")
 
-        # Discussion threads - pure value
-        for signal in discussion_signals:
-            if signal in combined:
-                return (
-                    MentionStrategy.NEVER,
-                    f"Discussion thread ('{signal}') - contribute genuine perspective"
-                )
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def analyze(title: str, content: str) -> Tuple[str, str]:
+        """
+        Mention strategy for a post's text.
+
+        Only depends on the text, so the result is cached across generate,
+        variant and regenerate calls for the same opportunity.
+
+        Returns:
+            Tuple of (strategy, reasoning)
+        """
+        combined = f"{title} {content}" if content else title
+
+        # Best-ranked signal anywhere in the post (group index - 1 is the rank)
+        best_rank = min(
+            (match.lastindex for match in MentionStrategy._SIGNAL_PATTERN.finditer(combined)),
+            default=None,
+        )
+        if best_rank is not None:
+            strategy, reason, signal = MentionStrategy._SIGNAL_RANKING[best_rank - 1]
+            return strategy, reason.format(signal=signal)
 
         # Default: be helpful without any mention
         return (
@@ -90,6 +293,76 @@ class MentionStrategy:
         )
 
 
+# Meta-commentary stripped from generated comments by ContentGenerator._post_process
+_META_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r'^(Here\'s|Here is|I\'ll write|Let me write|My comment:?)[\s:]*\n*',
+        r'\n*(Note:|P\.S\.|Edit:|---|\*\*\*|Hope this helps!?).*$',
+        r'^["\']|["\']$',  # Surrounding quotes
+    )
+)
+_EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+
+# Static lead of every user prompt; the post being answered follows it
+_USER_PROMPT_INSTRUCTIONS = """Write a single Reddit comment responding to the post below. Remember:
+- Be genuinely helpful - this person has a real question or situation
+- Your comment should add value whether or not anyone ever clicks your profile
+- Sound like a real human, not a polished corporate response
+- If you have relevant experience or knowledge, share specific insights"""
+
+# Static system-prompt fragments, assembled by ContentGenerator._compose_system_prompt
+_PERSONALITY_TEMPLATE = """YOUR PERSONALITY:
+- {description}
+- Voice: {voice}
+- Approach: {approach}
+- Avoid: {avoid}
+
+"""
+
+_MENTION_STRATEGY_BLOCKS = {
+    MentionStrategy.NEVER: """PRODUCT MENTIONS: DO NOT mention any product, service, or brand. Focus purely on helping with valuable advice or perspective. Your username already indicates your expertise area.
+
+""",
+    MentionStrategy.SUBTLE: """PRODUCT MENTIONS: Do NOT directly mention any product or service. Just be helpful. If your advice naturally relates to your area of expertise, that's fine - but never name-drop. Interested readers will check your profile.
+
+""",
+    MentionStrategy.NATURAL: """PRODUCT MENTIONS: You MAY mention a product/service IF AND ONLY IF:
+- The user is explicitly asking for recommendations
+- It genuinely fits their specific need (not just tangentially related)
+- You frame it as one option among others, not THE answer
+- You acknowledge it might not be perfect for everyone
+- The mention feels like natural conversation, not a pitch
+
+If these conditions aren't clearly met, don't mention anything. Being helpful without a mention is ALWAYS better than a forced mention.
+
+""",
+    MentionStrategy.DIRECT: """PRODUCT MENTIONS: The user is actively seeking recommendations. You may suggest relevant solutions including products you know well. Be honest about pros AND cons. Compare with alternatives if relevant. Never oversell or make unrealistic claims.
+
+""",
+}
+
+_PRODUCT_CONTEXT_STRATEGIES = frozenset((MentionStrategy.NATURAL, MentionStrategy.DIRECT))
+
+_PRODUCT_CONTEXT_TEMPLATE = """YOUR KNOWLEDGE (use naturally only when genuinely helpful):
+{product_context}
+
+Remember: Only mention this if the user's situation genuinely calls for it. Most comments should NOT mention it.
+
+"""
+
+_BRAND_VOICE_TEMPLATE = """COMMUNICATION STYLE:
+{brand_voice}
+
+"""
+
+_LANGUAGE_TEMPLATE = """LANGUAGE: Write entirely in {language_name}. Use natural {language_name} Reddit vernacular.
+
+"""
+
+_COMMUNITY_TEMPLATE = """COMMUNITY: You are commenting on r/{subreddit}. Match r/{subreddit}'s culture."""
+
+
 class ContentGenerator:
     """
     Service for generating authentic Reddit content.
@@ -139,25 +412,113 @@ class ContentGenerator:
         "lv": "Latvian", "lt": "Lithuanian",
     }
 
-    def __init__(self):
-        self.openai_client = None
-        self.anthropic_client = None
+    # Hot-path views of the tables above: interned keys, style fields as
+    # (description, voice, approach, avoid) tuples
+    _STYLE_FIELDS = {
+        sys.intern(key): (info["description"], info["voice"], info["approach"], info["avoid"])
+        for key, info in STYLES.items()
+    }
+    _DEFAULT_STYLE_FIELDS = _STYLE_FIELDS[ContentStyle.HELPFUL_EXPERT.value]
+    _LANGUAGE_LOOKUP = {sys.intern(code): name for code, name in LANGUAGE_NAMES.items()}
+
+    # Output budget per style; Reddit comments are short, and decode time is linear in tokens
+    _MAX_TOKENS = {
+        ContentStyle.CASUAL.value: 200,
+        ContentStyle.HELPFUL_EXPERT.value: 400,
+        ContentStyle.TECHNICAL.value: 600,
+        ContentStyle.STORYTELLING.value: 500,
+    }
 
-        if settings.OPENAI_API_KEY:
-            self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    # Styles routed to DEFAULT_LLM_MODEL_FAST when the user prompt is short
+    _FAST_MODEL_STYLES = frozenset((ContentStyle.CASUAL.value,))
+    FAST_MODEL_MAX_PROMPT_TOKENS = 400
 
-        if settings.ANTHROPIC_API_KEY:
-            self.anthropic_client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+    # Styles generate_variants uses when none are requested
+    DEFAULT_VARIANT_STYLES = (
+        ContentStyle.HELPFUL_EXPERT.value,
+        ContentStyle.CASUAL.value,
+        ContentStyle.STORYTELLING.value,
+    )
+
+    def __init__(
+        self,
+        semantic_cache: Optional[SemanticCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        # SDK clients are created on first use; see the properties below
+        self._openai_client: Optional[AsyncOpenAI] = None
+        self._anthropic_client: Optional[AsyncAnthropic] = None
+
+        # One connection pool shared by both SDK clients; closed by aclose() if we built it
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+
+        # Embeddings come from OpenAI, so the cache needs an OpenAI key
+        self.semantic_cache = semantic_cache
+        if self.semantic_cache is None and settings.SEMANTIC_CACHE_ENABLED and settings.OPENAI_API_KEY:
+            self.semantic_cache = SemanticCache()
+
+    @property
+    def openai_client(self) -> Optional[AsyncOpenAI]:
+        """OpenAI client, or None if no API key is configured."""
+        if self._openai_client is None and settings.OPENAI_API_KEY:
+            self._openai_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self.http_client,
+                max_retries=settings.LLM_MAX_RETRIES,
+            )
+        return self._openai_client
+
+    @property
+    def anthropic_client(self) -> Optional[AsyncAnthropic]:
+        """Anthropic client, or None if no API key is configured."""
+        if self._anthropic_client is None and settings.ANTHROPIC_API_KEY:
+            self._anthropic_client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                http_client=self.http_client,
+                max_retries=settings.LLM_MAX_RETRIES,
+            )
+        return self._anthropic_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Keep-alive connection pool shared by the OpenAI and Anthropic clients."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=httpx.Timeout(settings.LLM_HTTP_TIMEOUT_SECONDS, connect=5.0),
+                http2=settings.LLM_HTTP2,
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the connection pool if this generator created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._openai_client = None
+            self._anthropic_client = None
 
     async def generate_content(
         self,
         opportunity: Opportunity,
         project: Project,
-        style: str = ContentStyle.HELPFUL_EXPERT.value
+        style: str = ContentStyle.HELPFUL_EXPERT.value,
+        user_prompt_base: Optional[str] = None,
+        generated_at: Optional[str] = None
     ) -> GeneratedContent:
         """
         Generate authentic, valuable content for an opportunity.
+
+        user_prompt_base lets generate_variants share one
+        _build_user_prompt_base result across styles, and generated_at one
+        timestamp.
         """
+        generated_at = generated_at or datetime.now(timezone.utc).isoformat()
+
         # Analyze what mention strategy is appropriate
         mention_strategy, strategy_reason = MentionStrategy.analyze_opportunity(
             opportunity, project
@@ -172,9 +533,52 @@ class ContentGenerator:
         system_prompt = self._build_system_prompt(
             project, opportunity.subreddit, style, mention_strategy
         )
-        user_prompt = self._build_user_prompt(
-            opportunity, project, style, mention_strategy
-        )
+        if user_prompt_base is None:
+            user_prompt_base = self._build_user_prompt_base(opportunity)
+        user_prompt = self._build_user_prompt_styled(user_prompt_base, style)
+
+        model = self._select_model(style, user_prompt)
+        max_tokens = self._max_tokens_for(style)
+
+        # At temperature 0 identical prompts give identical responses, so they
+        # skip both the embedding and the LLM call
+        deterministic = settings.DEFAULT_LLM_TEMPERATURE == 0
+        exact_key = LLMResponseCache.cache_key(system_prompt, user_prompt, model)
+        cached = _response_cache.get(exact_key) if deterministic else None
+        if cached is not None:
+            cached_text, cached_metadata = cached
+            logger.info(f"Exact prompt cache hit for opportunity {opportunity.id}")
+            return self._build_generated_content(
+                opportunity, project, style, cached_text,
+                {**cached_metadata, "cache_hit": True},
+                mention_strategy, strategy_reason, generated_at
+            )
+
+        # Reuse a cached generation for a near-duplicate post
+        prompt_embedding = None
+        if self.semantic_cache:
+            try:
+                prompt_embedding = await self._embed_opportunity(
+                    opportunity, style, mention_strategy
+                )
+            except Exception as e:
+                logger.warning(f"Opportunity embedding failed, skipping semantic cache: {e}")
+
+        if prompt_embedding is not None:
+            cached = await self.semantic_cache.lookup(
+                project.id, opportunity.subreddit, style, mention_strategy, prompt_embedding
+            )
+            if cached:
+                cached_text, cached_metadata, similarity = cached
+                logger.info(
+                    f"Semantic cache hit for opportunity {opportunity.id} "
+                    f"(similarity={similarity:.3f})"
+                )
+                return self._build_generated_content(
+                    opportunity, project, style, cached_text,
+                    {**cached_metadata, "cache_hit": True, "cache_similarity": similarity},
+                    mention_strategy, strategy_reason, generated_at
+                )
 
         # Generate with GPT-5.2 (primary) or fallback
         content_text = None
@@ -182,9 +586,13 @@ class ContentGenerator:
 
         try:
             if self.openai_client:
-                content_text, metadata = await self._generate_openai(system_prompt, user_prompt)
+                content_text, metadata = await self._generate_openai(
+                    system_prompt, user_prompt, model, max_tokens
+                )
             elif self.anthropic_client:
-                content_text, metadata = await self._generate_anthropic(system_prompt, user_prompt)
+                content_text, metadata = await self._generate_anthropic(
+                    system_prompt, user_prompt, max_tokens
+                )
             else:
                 raise ValueError("No LLM client configured")
 
@@ -192,7 +600,9 @@ class ContentGenerator:
             logger.error(f"Primary LLM failed: {e}, trying fallback")
             if self.anthropic_client and self.openai_client:
                 try:
-                    content_text, metadata = await self._generate_anthropic(system_prompt, user_prompt)
+                    content_text, metadata = await self._generate_anthropic(
+                        system_prompt, user_prompt, max_tokens
+                    )
                 except Exception as e2:
                     logger.error(f"Fallback LLM also failed: {e2}")
                     raise
@@ -203,8 +613,33 @@ class ContentGenerator:
         # Post-process to ensure quality
         content_text = self._post_process(content_text)
 
-        # Create content object
-        generated_content = GeneratedContent(
+        if deterministic:
+            _response_cache.set(exact_key, content_text, metadata)
+
+        if prompt_embedding is not None:
+            await self.semantic_cache.store(
+                project.id, opportunity.subreddit, style, mention_strategy,
+                prompt_embedding, content_text, metadata
+            )
+
+        return self._build_generated_content(
+            opportunity, project, style, content_text, metadata,
+            mention_strategy, strategy_reason, generated_at
+        )
+
+    def _build_generated_content(
+        self,
+        opportunity: Opportunity,
+        project: Project,
+        style: str,
+        content_text: str,
+        metadata: Dict[str, Any],
+        mention_strategy: str,
+        strategy_reason: str,
+        generated_at: str
+    ) -> GeneratedContent:
+        """Create the draft content object for a generation."""
+        return GeneratedContent(
             opportunity_id=opportunity.id,
             project_id=project.id,
             content_text=content_text,
@@ -216,70 +651,211 @@ class ContentGenerator:
                 "style": style,
                 "mention_strategy": mention_strategy,
                 "strategy_reason": strategy_reason,
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": generated_at,
             }
         )
 
-        return generated_content
+    async def _embed_opportunity(
+        self,
+        opportunity: Opportunity,
+        style: str,
+        mention_strategy: str
+    ) -> List[float]:
+        """
+        Embed a post for semantic cache lookups.
+
+        Only the post itself is embedded: the system prompt is shared by every
+        opportunity of a project and would pull all similarities towards 1.
+        """
+        response = await self.openai_client.embeddings.create(
+            model=settings.EMBEDDING_MODEL,
+            input=(
+                f"{opportunity.post_title}\n{(opportunity.post_content or '')[:2000]}\n"
+                f"{style}\n{mention_strategy}"
+            ),
+        )
+        return response.data[0].embedding
+
+    def _select_model(self, style: str, user_prompt: str) -> str:
+        """
+        Pick the OpenAI model for a generation.
+
+        Casual replies to short posts don't need the default model; route them
+        to the fast one. Prompt size is estimated at ~4 characters per token to
+        avoid tokenizing the prompt a second time.
+        """
+        if (
+            style in self._FAST_MODEL_STYLES
+            and len(user_prompt) // 4 < self.FAST_MODEL_MAX_PROMPT_TOKENS
+        ):
+            return settings.DEFAULT_LLM_MODEL_FAST
+        return settings.DEFAULT_LLM_MODEL
+
+    def _max_tokens_for(self, style: str) -> int:
+        """Output token budget for a style, never above DEFAULT_LLM_MAX_TOKENS."""
+        return min(
+            self._MAX_TOKENS.get(style, settings.DEFAULT_LLM_MAX_TOKENS),
+            settings.DEFAULT_LLM_MAX_TOKENS
+        )
 
     async def _generate_openai(
         self,
         system_prompt: str,
-        user_prompt: str
+        user_prompt: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """Generate content using OpenAI Chat Completions API."""
+        metadata: Dict[str, Any] = {}
+        chunks = [
+            chunk async for chunk in self._stream_openai(
+                system_prompt, user_prompt, model, metadata, max_tokens
+            )
+        ]
+        return "".join(chunks), metadata
 
-        response = self.openai_client.chat.completions.create(
-            model=settings.DEFAULT_LLM_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=settings.DEFAULT_LLM_TEMPERATURE,
-            max_tokens=settings.DEFAULT_LLM_MAX_TOKENS,
-        )
-
-        content = response.choices[0].message.content
+    async def _stream_openai(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream content from the OpenAI Chat Completions API.
 
-        metadata = {
-            "model": settings.DEFAULT_LLM_MODEL,
+        Text is yielded as it arrives, unmodified. If metadata is given it is
+        filled in once the stream ends.
+        """
+        model = model or settings.DEFAULT_LLM_MODEL
+        if metadata is None:
+            metadata = {}
+        metadata.update({
+            "model": model,
             "provider": "openai",
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-        }
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cached_tokens": 0,
+        })
+
+        # Hold a call slot for the whole stream; the SDK retries 429s and 5xx
+        # with backoff inside the breaker, so only exhausted retries count as failures
+        async with _llm_semaphore():
+            await _openai_limiter.acquire()
+            stream = await _openai_breaker.call(
+                self.openai_client.chat.completions.create,
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=settings.DEFAULT_LLM_TEMPERATURE,
+                max_tokens=max_tokens or settings.DEFAULT_LLM_MAX_TOKENS,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+
+            async for chunk in stream:
+                if chunk.usage:
+                    prompt_details = getattr(chunk.usage, "prompt_tokens_details", None)
+                    metadata["prompt_tokens"] = chunk.usage.prompt_tokens
+                    metadata["completion_tokens"] = chunk.usage.completion_tokens
+                    metadata["cached_tokens"] = getattr(prompt_details, "cached_tokens", None) or 0
+
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    async def stream_content(
+        self,
+        opportunity: Opportunity,
+        project: Project,
+        style: str = ContentStyle.HELPFUL_EXPERT.value
+    ) -> AsyncIterator[str]:
+        """
+        Stream raw comment text for an opportunity as it is generated.
 
-        return content, metadata
+        For progressive rendering (SSE/WebSocket). The text is not
+        post-processed or persisted; use generate_content for a draft.
+        """
+        if not self.openai_client:
+            raise ValueError("OpenAI client required for streaming")
+
+        mention_strategy, _ = MentionStrategy.analyze_opportunity(opportunity, project)
+        system_prompt = self._build_system_prompt(
+            project, opportunity.subreddit, style, mention_strategy
+        )
+        user_prompt = self._build_user_prompt_styled(
+            self._build_user_prompt_base(opportunity), style
+        )
+
+        async for chunk in self._stream_openai(
+            system_prompt, user_prompt, self._select_model(style, user_prompt),
+            max_tokens=self._max_tokens_for(style)
+        ):
+            yield chunk
 
     async def _generate_anthropic(
         self,
         system_prompt: str,
-        user_prompt: str
+        user_prompt: str,
+        max_tokens: Optional[int] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """Generate content using Anthropic Claude (fallback)."""
-        response = self.anthropic_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=settings.DEFAULT_LLM_MAX_TOKENS,
-            system=system_prompt,
-            messages=[
-                {"role": "user", "content": user_prompt}
-            ]
-        )
+        async with _llm_semaphore():
+            await _anthropic_limiter.acquire()
+            response = await _anthropic_breaker.call(
+                self.anthropic_client.messages.create,
+                model="claude-sonnet-4-20250514",
+                max_tokens=max_tokens or settings.DEFAULT_LLM_MAX_TOKENS,
+                system=self._anthropic_system_blocks(system_prompt),
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            )
 
         content = response.content[0].text
+        usage = response.usage
         metadata = {
             "model": "claude-sonnet-4",
             "provider": "anthropic",
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
         }
 
         return content, metadata
 
+    @staticmethod
+    def _anthropic_system_blocks(system_prompt: str) -> List[Dict[str, Any]]:
+        """
+        Split the system prompt into cacheable blocks for Anthropic.
+
+        The static prefix gets its own cache breakpoint; the project/style
+        suffix gets a second one, since it repeats across a project's posts.
+        """
+        if not system_prompt.startswith(_STATIC_SYSTEM_PREFIX):
+            return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+        return [
+            {"type": "text", "text": _STATIC_SYSTEM_PREFIX, "cache_control": {"type": "ephemeral"}},
+            {
+                "type": "text",
+                "text": system_prompt[len(_STATIC_SYSTEM_PREFIX):],
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
+
     def _get_language_name(self, code: str) -> str:
         """Get full language name from ISO code."""
         if not code:
             return "English"
-        return self.LANGUAGE_NAMES.get(code.lower(), code)
+        # Codes are normally stored lowercase; only lower() on a miss
+        return self._LANGUAGE_LOOKUP.get(code) or self._LANGUAGE_LOOKUP.get(code.lower(), code)
 
     def _build_system_prompt(
         self,
@@ -288,83 +864,63 @@ class ContentGenerator:
         style: str,
         mention_strategy: str
     ) -> str:
-        """Build system prompt optimized for authentic, valuable content."""
-
-        style_info = self.STYLES.get(style, self.STYLES[ContentStyle.HELPFUL_EXPERT.value])
-        language_name = self._get_language_name(project.language) if project.language else None
-
-        # Core identity prompt
-        prompt = f"""You are a real Reddit user on r/{subreddit}. You have genuine knowledge and experience in your field. You're here because you enjoy helping people and being part of the community - NOT to promote anything.
-
-YOUR PERSONALITY:
-- {style_info['description']}
-- Voice: {style_info['voice']}
-- Approach: {style_info['approach']}
-- Avoid: {style_info['avoid']}
-
-AUTHENTICITY RULES (CRITICAL):
-1. Write like a REAL person - use natural language, occasional imperfections are OK
-2. Your comment must be GENUINELY HELPFUL even if the reader never learns about any product
-3. Share real insights, not generic advice anyone could Google
-4. Match r/{subreddit}'s culture - read the room
-5. Be concise - Reddit rewards density of value, not length
-6. If you don't know something, say so or don't comment on that aspect
-7. React naturally to the post - empathy for frustrations, enthusiasm for wins
-
-"""
-
-        # Mention strategy instructions
-        if mention_strategy == MentionStrategy.NEVER:
-            prompt += """PRODUCT MENTIONS: DO NOT mention any product, service, or brand. Focus purely on helping with valuable advice or perspective. Your username already indicates your expertise area.
-
-"""
-        elif mention_strategy == MentionStrategy.SUBTLE:
-            prompt += """PRODUCT MENTIONS: Do NOT directly mention any product or service. Just be helpful. If your advice naturally relates to your area of expertise, that's fine - but never name-drop. Interested readers will check your profile.
+        """Build system prompt, reusing a cached build for an unchanged project."""
+        if project.id is None:
+            return self._compose_system_prompt(project, subreddit, style, mention_strategy)
+
+        cache_key = (
+            project.id,
+            project.updated_at.timestamp() if project.updated_at else 0,
+            subreddit,
+            style,
+            mention_strategy,
+        )
+        prompt = _system_prompt_cache.get(cache_key)
+        if prompt is not None:
+            _system_prompt_cache.move_to_end(cache_key)
+            return prompt
 
-"""
-        elif mention_strategy == MentionStrategy.NATURAL:
-            prompt += """PRODUCT MENTIONS: You MAY mention a product/service IF AND ONLY IF:
-- The user is explicitly asking for recommendations
-- It genuinely fits their specific need (not just tangentially related)
-- You frame it as one option among others, not THE answer
-- You acknowledge it might not be perfect for everyone
-- The mention feels like natural conversation, not a pitch
+        prompt = self._compose_system_prompt(project, subreddit, style, mention_strategy)
+        _lru_put(_system_prompt_cache, cache_key, prompt, _PROMPT_CACHE_SIZE)
+        return prompt
 
-If these conditions aren't clearly met, don't mention anything. Being helpful without a mention is ALWAYS better than a forced mention.
+    def _compose_system_prompt(
+        self,
+        project: Project,
+        subreddit: str,
+        style: str,
+        mention_strategy: str
+    ) -> str:
+        """Build system prompt optimized for authentic, valuable content."""
 
-"""
-        elif mention_strategy == MentionStrategy.DIRECT:
-            prompt += """PRODUCT MENTIONS: The user is actively seeking recommendations. You may suggest relevant solutions including products you know well. Be honest about pros AND cons. Compare with alternatives if relevant. Never oversell or make unrealistic claims.
+        description, voice, approach, avoid = self._STYLE_FIELDS.get(style, self._DEFAULT_STYLE_FIELDS)
+        language_name = self._get_language_name(project.language) if project.language else None
 
-"""
+        # Static prefix first so providers can reuse its cached KV state
+        parts = [
+            _STATIC_SYSTEM_PREFIX,
+            _PERSONALITY_TEMPLATE.format(
+                description=description, voice=voice, approach=approach, avoid=avoid
+            ),
+            _MENTION_STRATEGY_BLOCKS.get(mention_strategy, ""),
+        ]
 
         # Add product context only if mentions are possible
-        if mention_strategy in [MentionStrategy.NATURAL, MentionStrategy.DIRECT]:
-            if project.product_context:
-                prompt += f"""YOUR KNOWLEDGE (use naturally only when genuinely helpful):
-{project.product_context}
-
-Remember: Only mention this if the user's situation genuinely calls for it. Most comments should NOT mention it.
-
-"""
+        if mention_strategy in _PRODUCT_CONTEXT_STRATEGIES and project.product_context:
+            parts.append(_PRODUCT_CONTEXT_TEMPLATE.format(product_context=project.product_context))
 
         # Brand voice as personality traits (if provided)
         if project.brand_voice:
-            prompt += f"""COMMUNICATION STYLE:
-{project.brand_voice}
-
-"""
+            parts.append(_BRAND_VOICE_TEMPLATE.format(brand_voice=project.brand_voice))
 
         # Language requirements
-        if language_name and project.language and project.language.lower() != "en":
-            prompt += f"""LANGUAGE: Write entirely in {language_name}. Use natural {language_name} Reddit vernacular.
-
-"""
+        if language_name and language_name != "English":
+            parts.append(_LANGUAGE_TEMPLATE.format(language_name=language_name))
 
-        # Output format
-        prompt += """OUTPUT: Write ONLY the Reddit comment. No meta-text, no "Here's a comment:", no explanations. Just the authentic comment a real user would post."""
+        # Community last - it varies per post
+        parts.append(_COMMUNITY_TEMPLATE.format(subreddit=subreddit))
 
-        return prompt
+        return "".join(parts)
 
     def _build_user_prompt(
         self,
@@ -374,53 +930,72 @@ Remember: Only mention this if the user's situation genuinely calls for it. Most
         mention_strategy: str
     ) -> str:
         """Build user prompt with opportunity context."""
+        return self._build_user_prompt_styled(self._build_user_prompt_base(opportunity), style)
 
-        prompt = f"""REDDIT POST TO RESPOND TO:
+    def _build_user_prompt_base(self, opportunity: Opportunity) -> str:
+        """Build the style-independent part of the user prompt, cached per opportunity."""
+        if opportunity.id is None:
+            return self._compose_user_prompt_base(opportunity)
+
+        cache_key = (
+            opportunity.id,
+            opportunity.post_score,
+            opportunity.post_num_comments,
+        )
+        prompt = _user_prompt_cache.get(cache_key)
+        if prompt is not None:
+            _user_prompt_cache.move_to_end(cache_key)
+            return prompt
+
+        prompt = self._compose_user_prompt_base(opportunity)
+        _lru_put(_user_prompt_cache, cache_key, prompt, _PROMPT_CACHE_SIZE)
+        return prompt
+
+    def _compose_user_prompt_base(self, opportunity: Opportunity) -> str:
+        """Build the post context shared by every style."""
+
+        parts = [f"""REDDIT POST TO RESPOND TO:
 
 Subreddit: r/{opportunity.subreddit}
 Title: {opportunity.post_title}
-"""
+"""]
 
         if opportunity.post_content:
-            content = opportunity.post_content[:2500]
-            prompt += f"""
+            content = _truncate_post_content(opportunity.post_content)
+            parts.append(f"""
 Post Content:
 {content}
-"""
+""")
 
-        prompt += f"""
-Engagement: {opportunity.post_score} upvotes, {opportunity.post_num_comments} comments
+        parts.append(f"""
+Engagement: {opportunity.post_score} upvotes, {opportunity.post_num_comments} comments""")
 
----
+        return "".join(parts)
 
-Write a single Reddit comment responding to this post. Remember:
-- Be genuinely helpful - this person has a real question or situation
-- Your comment should add value whether or not anyone ever clicks your profile
-- Sound like a real human, not a polished corporate response
-- If you have relevant experience or knowledge, share specific insights"""
+    def _build_user_prompt_styled(self, base: str, style: str) -> str:
+        """
+        Put the static instructions and tone nudge in front of a user prompt base.
 
-        # Style-specific nudge
-        style_info = self.STYLES.get(style, self.STYLES[ContentStyle.HELPFUL_EXPERT.value])
-        prompt += f"""
-- Tone: {style_info['voice']}"""
+        The post comes last so the instructions form a byte-identical prefix
+        across posts, which OpenAI's automatic prompt caching can reuse.
+        """
+        voice = self._STYLE_FIELDS.get(style, self._DEFAULT_STYLE_FIELDS)[1]
+        return f"""{_USER_PROMPT_INSTRUCTIONS}
+- Tone: {voice}
 
-        return prompt
+---
+
+{base}"""
 
     def _post_process(self, content: str) -> str:
         """Clean up generated content for Reddit."""
 
         # Remove any meta-commentary the model might have added
-        meta_patterns = [
-            r'^(Here\'s|Here is|I\'ll write|Let me write|My comment:?)[\s:]*\n*',
-            r'\n*(Note:|P\.S\.|Edit:|---|\*\*\*|Hope this helps!?).*$',
-            r'^["\']|["\']$',  # Surrounding quotes
-        ]
-
-        for pattern in meta_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE)
+        for pattern in _META_PATTERNS:
+            content = pattern.sub('', content)
 
         # Clean up excessive whitespace
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _EXCESS_NEWLINES_PATTERN.sub('\n\n', content)
         content = content.strip()
 
         return content
@@ -457,19 +1032,37 @@ Issues to address: {feedback}
 
 Please write an improved version that addresses this feedback while maintaining authenticity."""
 
-        content_text = None
-        metadata = {}
+        # At temperature 0 the response is deterministic, so an identical
+        # regeneration request can replay it instead of calling the provider
+        deterministic = settings.DEFAULT_LLM_TEMPERATURE == 0
+        cache_key = LLMResponseCache.cache_key(
+            system_prompt, user_prompt, settings.DEFAULT_LLM_MODEL
+        )
+        cached = _response_cache.get(cache_key) if deterministic else None
 
-        try:
-            if self.openai_client:
-                content_text, metadata = await self._generate_openai(system_prompt, user_prompt)
-            elif self.anthropic_client:
-                content_text, metadata = await self._generate_anthropic(system_prompt, user_prompt)
-        except Exception as e:
-            logger.error(f"Regeneration failed: {e}")
-            raise
+        if cached is not None:
+            content_text, metadata = cached
+            metadata = {**metadata, "cache_hit": True}
+        else:
+            content_text = None
+            metadata = {}
 
-        content_text = self._post_process(content_text)
+            try:
+                if self.openai_client:
+                    content_text, metadata = await self._generate_openai(
+                        system_prompt, user_prompt, max_tokens=self._max_tokens_for(style)
+                    )
+                elif self.anthropic_client:
+                    content_text, metadata = await self._generate_anthropic(
+                        system_prompt, user_prompt, self._max_tokens_for(style)
+                    )
+            except Exception as e:
+                logger.error(f"Regeneration failed: {e}")
+                raise
+
+            content_text = self._post_process(content_text)
+            if deterministic:
+                _response_cache.set(cache_key, content_text, metadata)
 
         new_content = GeneratedContent(
             opportunity_id=opportunity.id,
@@ -486,7 +1079,7 @@ Please write an improved version that addresses this feedback while maintaining
                 "mention_strategy": mention_strategy,
                 "regenerated_from": content.id,
                 "feedback": feedback,
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": datetime.now(timezone.utc).isoformat(),
             }
         )
 
@@ -501,22 +1094,165 @@ Please write an improved version that addresses this feedback while maintaining
     ) -> List[GeneratedContent]:
         """Generate multiple content variants with different styles."""
 
-        if styles:
-            selected_styles = styles[:count]
-        else:
-            selected_styles = [
-                ContentStyle.HELPFUL_EXPERT.value,
-                ContentStyle.CASUAL.value,
-                ContentStyle.STORYTELLING.value,
-            ][:count]
+        selected_styles = (styles or self.DEFAULT_VARIANT_STYLES)[:count]
+
+        # The post context is the same for every style; build it once
+        user_prompt_base = self._build_user_prompt_base(opportunity)
+
+        generated_at = datetime.now(timezone.utc).isoformat()
+
+        # Styles are independent; provider calls are capped and rate limited downstream
+        results = await asyncio.gather(
+            *(
+                self.generate_content(
+                    opportunity, project, style, user_prompt_base, generated_at
+                )
+                for style in selected_styles
+            ),
+            return_exceptions=True
+        )
 
         variants = []
-        for style in selected_styles:
-            try:
-                content = await self.generate_content(opportunity, project, style)
-                variants.append(content)
-            except Exception as e:
-                logger.error(f"Failed to generate {style} variant: {e}")
+        for style, result in zip(selected_styles, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to generate {style} variant: {result}")
                 continue
+            variants.append(result)
 
         return variants
+
+    # Batch API statuses after which a batch's output and error files are final
+    BATCH_TERMINAL_STATUSES = frozenset(("completed", "failed", "expired", "cancelled"))
+
+    @staticmethod
+    def batch_custom_id(opportunity_id: int, style: str) -> str:
+        """Batch request ID of an (opportunity, style) job."""
+        return f"{opportunity_id}:{style}"
+
+    async def submit_content_batch(
+        self,
+        jobs: List[Tuple[Opportunity, Project, str]]
+    ) -> str:
+        """
+        Submit (opportunity, project, style) jobs to the OpenAI Batch API.
+
+        Batches are billed at half price but may take up to the completion
+        window to finish. This only submits; collect the results later with
+        fetch_content_batch - never wait for them in a worker or request.
+
+        Returns:
+            OpenAI batch ID
+        """
+        if not self.openai_client:
+            raise ValueError("OpenAI client required for batch generation")
+
+        lines = []
+        for opportunity, project, style in jobs:
+            mention_strategy, _ = MentionStrategy.analyze_opportunity(opportunity, project)
+            lines.append(json.dumps({
+                "custom_id": self.batch_custom_id(opportunity.id, style),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.DEFAULT_LLM_MODEL,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": self._build_system_prompt(
+                                project, opportunity.subreddit, style, mention_strategy
+                            ),
+                        },
+                        {
+                            "role": "user",
+                            "content": self._build_user_prompt(
+                                opportunity, project, style, mention_strategy
+                            ),
+                        },
+                    ],
+                    "temperature": settings.DEFAULT_LLM_TEMPERATURE,
+                    "max_tokens": self._max_tokens_for(style),
+                },
+            }))
+
+        batch_file = await self.openai_client.files.create(
+            file=("content_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(jobs)} requests")
+        return batch.id
+
+    async def fetch_content_batch(
+        self,
+        batch_id: str
+    ) -> Optional[Dict[str, Tuple[str, Dict[str, Any]]]]:
+        """
+        Collect the results of a submitted batch, if it has finished.
+
+        Failed requests (from the output and the error file) are logged and
+        left out of the results.
+
+        Returns:
+            None while the batch is still running; otherwise
+            custom_id -> (post-processed content text, metadata) for every
+            request that succeeded
+        """
+        batch = await self.openai_client.batches.retrieve(batch_id)
+        if batch.status not in self.BATCH_TERMINAL_STATUSES:
+            return None
+
+        logger.info(f"OpenAI batch {batch_id} finished as {batch.status}")
+
+        records = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                output = (await self.openai_client.files.content(file_id)).text
+                records.extend(json.loads(line) for line in output.splitlines() if line.strip())
+
+        results: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for record in records:
+            custom_id = record["custom_id"]
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.error(
+                    f"Batch {batch_id} request {custom_id} failed: "
+                    f"{record.get('error') or response.get('body')}"
+                )
+                continue
+
+            body = response["body"]
+            usage = body.get("usage") or {}
+            results[custom_id] = (
+                self._post_process(body["choices"][0]["message"]["content"]),
+                {
+                    "model": body.get("model", settings.DEFAULT_LLM_MODEL),
+                    "provider": "openai",
+                    "prompt_tokens": usage.get("prompt_tokens", 0),
+                    "completion_tokens": usage.get("completion_tokens", 0),
+                    "batch_id": batch_id,
+                },
+            )
+
+        return results
+
+    def build_batch_content(
+        self,
+        opportunity: Opportunity,
+        project: Project,
+        style: str,
+        content_text: str,
+        metadata: Dict[str, Any],
+        generated_at: str
+    ) -> GeneratedContent:
+        """Draft content object for a result returned by fetch_content_batch."""
+        mention_strategy, strategy_reason = MentionStrategy.analyze_opportunity(
+            opportunity, project
+        )
+        return self._build_generated_content(
+            opportunity, project, style, content_text, metadata,
+            mention_strategy, strategy_reason, generated_at
+        )
@@ -2,9 +2,16 @@
 Opportunity Mining Service - discovers and scores Reddit opportunities.
 """
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Set, Tuple
+import numpy as np
 import praw
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 try:
@@ -14,6 +21,12 @@ except ImportError:
     LANGDETECT_AVAILABLE = False
     LangDetectException = Exception
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from app.core.config import settings
 from app.models import Opportunity, OpportunityStatus, OpportunityUrgency, Project, SubredditConfig
 from app.services.virality_predictor import ViralityPredictor
@@ -21,7 +34,10 @@ from app.utils.reddit_helpers import (
     RedditClientFactory,
     calculate_post_velocity,
     get_post_age_hours,
-    classify_urgency,
+    urgency_code,
+    URGENCY_LEVELS,
+    URGENCY_AGE_BOUNDS,
+    URGENCY_MAX_AGE_HOURS,
     get_velocity_threshold,
     extract_submission_data,
     get_rising_posts,
@@ -30,6 +46,77 @@ from app.utils.reddit_helpers import (
 logger = logging.getLogger(__name__)
 
 
+# Aho-Corasick automatons for keyword lists, keyed on the lowercased keywords.
+# Mining threads share them, so the LRU bookkeeping is done under a lock.
+_KEYWORD_AUTOMATON_CACHE_SIZE = 256
+_keyword_automatons: "OrderedDict[Tuple[str, ...], Any]" = OrderedDict()
+_keyword_automatons_lock = threading.Lock()
+
+
+def _get_keyword_automaton(keywords: Tuple[str, ...]) -> Any:
+    """Automaton matching every (lowercased) keyword, built once per keyword list."""
+    with _keyword_automatons_lock:
+        automaton = _keyword_automatons.get(keywords)
+        if automaton is not None:
+            _keyword_automatons.move_to_end(keywords)
+            return automaton
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+
+    with _keyword_automatons_lock:
+        _keyword_automatons[keywords] = automaton
+        if len(_keyword_automatons) > _KEYWORD_AUTOMATON_CACHE_SIZE:
+            _keyword_automatons.popitem(last=False)
+    return automaton
+
+
+def _count_keyword_matches(keywords: Tuple[str, ...], text: str) -> int:
+    """
+    Count the lowercased keywords contained in lowercased text.
+
+    With pyahocorasick every keyword is found in a single pass over the text
+    instead of one substring scan per keyword.
+    """
+    if not keywords:
+        return 0
+    if not AHOCORASICK_AVAILABLE:
+        return sum(1 for keyword in keywords if keyword in text)
+
+    automaton = _get_keyword_automaton(keywords)
+    # An empty keyword is contained in every text
+    found = {""}
+    if len(automaton):
+        found.update(keyword for _, keyword in automaton.iter(text))
+    return sum(1 for keyword in keywords if keyword in found)
+
+
+# Timing score per urgency code (see URGENCY_LEVELS)
+_URGENCY_TIMING_SCORES = (1.0, 0.85, 0.6, 0.3, 0.1)
+_URGENCY_TIMING_SCORES_ARRAY = np.array(_URGENCY_TIMING_SCORES)
+
+
+# Subreddit fetches run on one long-lived pool per process, so each worker
+# thread keeps its read-only PRAW client (and OAuth token) across runs.
+_mining_executor: Optional[ThreadPoolExecutor] = None
+_mining_executor_lock = threading.Lock()
+
+
+def _get_mining_executor() -> ThreadPoolExecutor:
+    """Process-wide executor for subreddit fetches, created on first use."""
+    global _mining_executor
+    with _mining_executor_lock:
+        if _mining_executor is None:
+            _mining_executor = ThreadPoolExecutor(
+                max_workers=settings.MINING_MAX_WORKERS,
+                thread_name_prefix="opportunity-miner",
+            )
+        return _mining_executor
+
+
 class OpportunityMiner:
     """
     Service for mining Reddit opportunities.
@@ -47,6 +134,17 @@ class OpportunityMiner:
     def __init__(self):
         self.reddit = RedditClientFactory.create_read_only_client()
         self.virality_predictor = ViralityPredictor()
+        # project_id -> (lowercased keywords, lowercased negative keywords)
+        self._lowered_keywords: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+    def _get_thread_reddit(self) -> praw.Reddit:
+        """
+        Read-only client for the current mining thread.
+
+        PRAW instances are not thread-safe, so each worker thread uses its own;
+        the pool threads are long-lived, so the client is reused across runs.
+        """
+        return RedditClientFactory.create_read_only_client()
 
     def _detect_language(self, text: str) -> Optional[str]:
         """
@@ -126,38 +224,62 @@ class OpportunityMiner:
         # Get existing reddit post IDs to avoid duplicates
         existing_ids = self._get_existing_post_ids(db, project.id)
 
-        # Get subreddit configs for velocity thresholds
-        subreddit_configs = self._get_subreddit_configs(db, project.id)
-
-        opportunities = []
-        processed_count = 0
-
-        for subreddit_name in target_subreddits:
-            if processed_count >= limit:
-                break
-
-            try:
-                subreddit_opps = self._mine_subreddit(
+        # Resolve velocity thresholds once per run from the subreddit configs
+        velocity_thresholds = self._get_velocity_thresholds(db, project.id)
+
+        # Lowercase keywords once per run (they may have been edited since the last one)
+        self._lowered_keywords.pop(project.id, None)
+        self._get_lowered_keywords(project)
+
+        # Subreddit fetches are I/O-bound; overlap them. Workers only read
+        # existing_ids and never touch the session - results are merged here.
+        executor = _get_mining_executor()
+        futures = [
+            (
+                subreddit_name,
+                executor.submit(
+                    self._mine_subreddit,
                     db=db,
                     project=project,
                     subreddit_name=subreddit_name,
                     existing_ids=existing_ids,
-                    subreddit_config=subreddit_configs.get(subreddit_name),
-                    limit=min(50, limit - processed_count)
-                )
-
-                opportunities.extend(subreddit_opps)
-                processed_count += len(subreddit_opps)
+                    velocity_threshold=velocity_thresholds.get(subreddit_name),
+                    limit=min(50, limit),
+                ),
+            )
+            for subreddit_name in target_subreddits
+        ]
 
+        # Merge in target order so the limit favours the same subreddits every run
+        rows = []
+        merged_ids: Set[str] = set()
+        for subreddit_name, future in futures:
+            try:
+                subreddit_rows = future.result()
             except Exception as e:
                 logger.error(f"Error mining r/{subreddit_name}: {e}")
                 continue
 
-        # Save to database
-        if opportunities:
-            db.add_all(opportunities)
-            db.commit()
-            logger.info(f"Mined {len(opportunities)} opportunities for project {project.id}")
+            for row in subreddit_rows:
+                if len(rows) >= limit:
+                    break
+                if row["reddit_post_id"] in merged_ids:
+                    continue
+                merged_ids.add(row["reddit_post_id"])
+                rows.append(row)
+
+        if not rows:
+            return []
+
+        # Save to database in one multi-row INSERT. Posts stored since
+        # existing_ids was read (e.g. by a concurrent run) are skipped.
+        insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(Opportunity).values(rows).on_conflict_do_nothing(
+            index_elements=["reddit_post_id"]
+        ).returning(Opportunity)
+        opportunities = list(db.scalars(stmt))
+        db.commit()
+        logger.info(f"Mined {len(opportunities)} opportunities for project {project.id}")
 
         return opportunities
 
@@ -167,32 +289,34 @@ class OpportunityMiner:
         project: Project,
         subreddit_name: str,
         existing_ids: Set[str],
-        subreddit_config: Optional[SubredditConfig],
+        velocity_threshold: Optional[float],
         limit: int
-    ) -> List[Opportunity]:
-        """Mine opportunities from a single subreddit."""
+    ) -> List[Dict[str, Any]]:
+        """Mine opportunities from a single subreddit, as Opportunity column values."""
         opportunities = []
 
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
+            subreddit = self._get_thread_reddit().subreddit(subreddit_name)
 
-            # Get velocity threshold
-            if subreddit_config and subreddit_config.velocity_threshold:
-                velocity_threshold = subreddit_config.velocity_threshold
-            else:
-                velocity_threshold = get_velocity_threshold(subreddit.subscribers)
+            # One about-request per subreddit; read off each post's lazy Subreddit
+            # it would be one per post
+            subscribers = subreddit.subscribers
 
-            # Get rising and new posts
-            posts_to_check = []
+            # No configured threshold: fall back to the live subscriber count
+            if velocity_threshold is None:
+                velocity_threshold = get_velocity_threshold(subscribers)
 
-            for submission in subreddit.rising(limit=limit):
-                posts_to_check.append(submission)
+            # Get rising and new posts
+            posts_to_check = list(subreddit.rising(limit=limit))
+            seen_ids = {submission.id for submission in posts_to_check}
 
             for submission in subreddit.new(limit=limit // 2):
-                if submission.id not in [p.id for p in posts_to_check]:
+                if submission.id not in seen_ids:
                     posts_to_check.append(submission)
+                    seen_ids.add(submission.id)
 
-            # Process each post
+            # Filter posts and collect per-post signals
+            candidates = []
             for submission in posts_to_check:
                 if submission.id in existing_ids:
                     continue
@@ -202,10 +326,6 @@ class OpportunityMiner:
                 if age_hours > 24:
                     continue
 
-                # Language filter - skip posts not in target language
-                if project.language and not self._matches_language(submission, project.language):
-                    continue
-
                 # Calculate scores
                 relevance_score = self._calculate_relevance(submission, project)
 
@@ -213,54 +333,67 @@ class OpportunityMiner:
                 if relevance_score < 0.3:
                     continue
 
-                # Calculate other scores
-                velocity = calculate_post_velocity(submission)
-                virality_score = self.virality_predictor.predict(submission, velocity_threshold)
-                timing_score = self._calculate_timing_score(velocity, age_hours, velocity_threshold)
+                # Language filter - skip posts not in target language. Runs after
+                # the cheap keyword check so langdetect only sees relevant posts.
+                if project.language and not self._matches_language(submission, project.language):
+                    continue
+
+                velocity = calculate_post_velocity(submission, age_hours)
+                virality_score = self.virality_predictor.predict(
+                    submission, velocity_threshold, subscribers
+                )
+                candidates.append((submission, age_hours, relevance_score, velocity, virality_score))
 
-                # Classify urgency
-                urgency = classify_urgency(velocity, age_hours, velocity_threshold)
+            if not candidates:
+                return opportunities
 
-                # Calculate composite score
-                composite_score = self._calculate_composite_score(
-                    relevance_score,
-                    virality_score,
-                    timing_score
+            # Timing, urgency and composite scores for all candidates at once
+            _, ages, relevances, velocities, viralities = zip(*candidates)
+            timing_scores, composite_scores, urgency_codes = (
+                scores.tolist() for scores in self._score_batch(
+                    np.array(relevances), np.array(viralities), np.array(velocities),
+                    np.array(ages), velocity_threshold
                 )
+            )
+
+            # One clock read for every expiry in the batch
+            now = datetime.utcnow()
+
+            for index, (submission, age_hours, relevance_score, velocity, virality_score) in enumerate(candidates):
+                timing_score = timing_scores[index]
+                composite_score = composite_scores[index]
+                urgency = URGENCY_LEVELS[urgency_codes[index]]
 
                 # Create opportunity
                 submission_data = extract_submission_data(submission)
 
-                opportunity = Opportunity(
-                    project_id=project.id,
-                    reddit_post_id=submission.id,
-                    subreddit=subreddit_name,
-                    post_title=submission_data["post_title"],
-                    post_content=submission_data["post_content"],
-                    post_url=submission_data["post_url"],
-                    post_author=submission_data["post_author"],
-                    post_created_at=submission_data["post_created_at"],
-                    post_score=submission_data["post_score"],
-                    post_num_comments=submission_data["post_num_comments"],
-                    post_upvote_ratio=submission_data["post_upvote_ratio"],
-                    relevance_score=relevance_score,
-                    virality_score=virality_score,
-                    timing_score=timing_score,
-                    composite_score=composite_score,
-                    urgency=urgency,
-                    velocity=velocity,
-                    velocity_threshold=velocity_threshold,
-                    status=OpportunityStatus.PENDING.value,
-                    expires_at=self._calculate_expiry(age_hours, urgency),
-                    opportunity_metadata={
+                opportunities.append({
+                    "project_id": project.id,
+                    "reddit_post_id": submission.id,
+                    "subreddit": subreddit_name,
+                    "post_title": submission_data["post_title"],
+                    "post_content": submission_data["post_content"],
+                    "post_url": submission_data["post_url"],
+                    "post_author": submission_data["post_author"],
+                    "post_created_at": submission_data["post_created_at"],
+                    "post_score": submission_data["post_score"],
+                    "post_num_comments": submission_data["post_num_comments"],
+                    "post_upvote_ratio": submission_data["post_upvote_ratio"],
+                    "relevance_score": relevance_score,
+                    "virality_score": virality_score,
+                    "timing_score": timing_score,
+                    "composite_score": composite_score,
+                    "urgency": urgency,
+                    "velocity": velocity,
+                    "velocity_threshold": velocity_threshold,
+                    "status": OpportunityStatus.PENDING.value,
+                    "expires_at": self._calculate_expiry(age_hours, urgency, now),
+                    "opportunity_metadata": {
                         "is_self": submission_data["is_self"],
                         "link_flair_text": submission_data.get("link_flair_text"),
                         "over_18": submission_data.get("over_18", False),
-                    }
-                )
-
-                opportunities.append(opportunity)
-                existing_ids.add(submission.id)
+                    },
+                })
 
         except Exception as e:
             logger.error(f"Error processing r/{subreddit_name}: {e}")
@@ -284,17 +417,9 @@ class OpportunityMiner:
         # Combine title and content
         text = f"{submission.title} {submission.selftext if submission.is_self else ''}".lower()
 
-        # Check positive keywords
-        positive_matches = 0
-        for keyword in project.keywords:
-            if keyword.lower() in text:
-                positive_matches += 1
-
-        # Check negative keywords
-        negative_matches = 0
-        for keyword in project.negative_keywords or []:
-            if keyword.lower() in text:
-                negative_matches += 1
+        keywords, negative_keywords = self._get_lowered_keywords(project)
+        positive_matches = _count_keyword_matches(keywords, text)
+        negative_matches = _count_keyword_matches(negative_keywords, text)
 
         # Calculate score
         if positive_matches == 0:
@@ -305,35 +430,51 @@ class OpportunityMiner:
 
         return max(0.0, min(1.0, positive_score - negative_penalty))
 
-    def _calculate_timing_score(
+    def _get_lowered_keywords(self, project: Project) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Lowercased (keywords, negative keywords) of a project, computed once per mining run."""
+        lowered = self._lowered_keywords.get(project.id)
+        if lowered is None:
+            lowered = self._lowered_keywords[project.id] = (
+                tuple(keyword.lower() for keyword in project.keywords or []),
+                tuple(keyword.lower() for keyword in project.negative_keywords or []),
+            )
+        return lowered
+
+    def _score_batch(
         self,
-        velocity: float,
-        age_hours: float,
+        relevance: np.ndarray,
+        virality: np.ndarray,
+        velocity: np.ndarray,
+        age_hours: np.ndarray,
         threshold: float
-    ) -> float:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calculate timing score based on velocity and age.
+        Vectorized timing, composite and urgency scoring for a subreddit's candidates.
 
-        Args:
-            velocity: Post velocity
-            age_hours: Post age in hours
-            threshold: Velocity threshold for subreddit
+        Same rules as urgency_code, _URGENCY_TIMING_SCORES and
+        _calculate_composite_score, applied to arrays.
 
         Returns:
-            float: Timing score (0-1)
+            Tuple of (timing scores, composite scores, urgency codes into URGENCY_LEVELS)
         """
-        # Urgency-based scoring
-        urgency = classify_urgency(velocity, age_hours, threshold)
-
-        urgency_scores = {
-            "urgent": 1.0,
-            "high": 0.85,
-            "medium": 0.6,
-            "low": 0.3,
-            "expired": 0.1,
-        }
-
-        return urgency_scores.get(urgency, 0.3)
+        velocity_codes = 3 - (
+            (velocity > threshold * 0.5).astype(int) +
+            (velocity > threshold) +
+            (velocity > threshold * 2)
+        )
+        age_codes = (
+            np.searchsorted(URGENCY_AGE_BOUNDS, age_hours, side="right") +
+            (age_hours > URGENCY_MAX_AGE_HOURS)
+        )
+        urgency_codes = np.maximum(velocity_codes, age_codes)
+        timing = _URGENCY_TIMING_SCORES_ARRAY[urgency_codes]
+        composite = (
+            relevance * self.WEIGHT_RELEVANCE +
+            virality * self.WEIGHT_VIRALITY +
+            timing * self.WEIGHT_TIMING +
+            0.5 * self.WEIGHT_EFFORT
+        )
+        return timing, composite, urgency_codes
 
     def _calculate_composite_score(
         self,
@@ -350,8 +491,13 @@ class OpportunityMiner:
             effort * self.WEIGHT_EFFORT
         )
 
-    def _calculate_expiry(self, age_hours: float, urgency: str) -> datetime:
-        """Calculate when opportunity expires."""
+    def _calculate_expiry(
+        self,
+        age_hours: float,
+        urgency: str,
+        now: Optional[datetime] = None
+    ) -> datetime:
+        """Calculate when opportunity expires, relative to now (default: current UTC time)."""
         # Expiry windows based on urgency
         windows = {
             "urgent": 1,      # 1 hour window
@@ -364,15 +510,13 @@ class OpportunityMiner:
         window_hours = windows.get(urgency, 4)
         remaining_hours = max(0, window_hours - age_hours)
 
-        return datetime.utcnow() + timedelta(hours=remaining_hours)
+        return (now or datetime.utcnow()) + timedelta(hours=remaining_hours)
 
     def _get_existing_post_ids(self, db: Session, project_id: int) -> Set[str]:
         """Get set of existing Reddit post IDs for project."""
-        results = db.query(Opportunity.reddit_post_id).filter(
-            Opportunity.project_id == project_id
-        ).all()
-
-        return {r[0] for r in results}
+        return set(db.scalars(
+            select(Opportunity.reddit_post_id).where(Opportunity.project_id == project_id)
+        ))
 
     def _get_subreddit_configs(self, db: Session, project_id: int) -> Dict[str, SubredditConfig]:
         """Get subreddit configs indexed by name."""
@@ -382,6 +526,19 @@ class OpportunityMiner:
 
         return {c.subreddit_name: c for c in configs}
 
+    def _get_velocity_thresholds(self, db: Session, project_id: int) -> Dict[str, float]:
+        """
+        Get velocity thresholds indexed by subreddit name.
+
+        Only configs with an explicit threshold or a known subscriber count
+        are included; other subreddits fall back to the live subscriber count.
+        """
+        return {
+            name: config.get_velocity_threshold()
+            for name, config in self._get_subreddit_configs(db, project_id).items()
+            if config.velocity_threshold or config.subscribers
+        }
+
     def refresh_opportunity_scores(
         self,
         db: Session,
@@ -401,43 +558,86 @@ class OpportunityMiner:
             submission = self.reddit.submission(id=opportunity.reddit_post_id)
             submission._fetch()
 
-            # Recalculate velocity and timing
-            age_hours = get_post_age_hours(submission)
-            velocity = calculate_post_velocity(submission)
+            self._apply_refreshed_submission(opportunity, submission)
 
-            opportunity.post_score = submission.score
-            opportunity.post_num_comments = submission.num_comments
-            opportunity.velocity = velocity
+            db.commit()
 
-            # Recalculate timing score
-            timing_score = self._calculate_timing_score(
-                velocity,
-                age_hours,
-                opportunity.velocity_threshold or 15.0
-            )
-            opportunity.timing_score = timing_score
+        except Exception as e:
+            logger.error(f"Error refreshing opportunity {opportunity.id}: {e}")
 
-            # Recalculate urgency
-            opportunity.urgency = classify_urgency(
-                velocity,
-                age_hours,
-                opportunity.velocity_threshold or 15.0
-            )
+        return opportunity
+
+    def refresh_opportunities_bulk(
+        self,
+        db: Session,
+        opportunities: List[Opportunity]
+    ) -> int:
+        """
+        Refresh scores for many opportunities with batched Reddit lookups.
+
+        reddit.info() fetches up to 100 submissions per request, instead of
+        one request per opportunity.
+
+        Args:
+            db: Database session
+            opportunities: Opportunities to refresh
+
+        Returns:
+            Number of opportunities refreshed
+        """
+        if not opportunities:
+            return 0
 
-            # Recalculate composite
-            opportunity.composite_score = self._calculate_composite_score(
-                opportunity.relevance_score or 0.5,
-                opportunity.virality_score or 0.5,
-                timing_score
+        submissions = {
+            submission.id: submission
+            for submission in self.reddit.info(
+                fullnames=[f"t3_{opp.reddit_post_id}" for opp in opportunities]
             )
+        }
 
-            # Check if expired
-            if opportunity.urgency == "expired" and opportunity.status == OpportunityStatus.PENDING.value:
-                opportunity.status = OpportunityStatus.EXPIRED.value
+        refreshed = 0
+        for opportunity in opportunities:
+            submission = submissions.get(opportunity.reddit_post_id)
+            if submission is None:
+                logger.warning(f"Post for opportunity {opportunity.id} not returned by Reddit")
+                continue
 
-            db.commit()
+            try:
+                self._apply_refreshed_submission(opportunity, submission)
+                refreshed += 1
+            except Exception as e:
+                logger.error(f"Error refreshing opportunity {opportunity.id}: {e}")
 
-        except Exception as e:
-            logger.error(f"Error refreshing opportunity {opportunity.id}: {e}")
+        db.commit()
+        return refreshed
 
-        return opportunity
+    def _apply_refreshed_submission(
+        self,
+        opportunity: Opportunity,
+        submission: praw.models.Submission
+    ) -> None:
+        """Recalculate an opportunity's engagement and scores from fresh post data."""
+        # Recalculate velocity and timing
+        age_hours = get_post_age_hours(submission)
+        velocity = calculate_post_velocity(submission, age_hours)
+
+        opportunity.post_score = submission.score
+        opportunity.post_num_comments = submission.num_comments
+        opportunity.velocity = velocity
+
+        # Recalculate urgency, and the timing score derived from it
+        code = urgency_code(velocity, age_hours, opportunity.velocity_threshold or 15.0)
+        opportunity.urgency = URGENCY_LEVELS[code]
+        timing_score = _URGENCY_TIMING_SCORES[code]
+        opportunity.timing_score = timing_score
+
+        # Recalculate composite
+        opportunity.composite_score = self._calculate_composite_score(
+            opportunity.relevance_score or 0.5,
+            opportunity.virality_score or 0.5,
+            timing_score
+        )
+
+        # Check if expired
+        if opportunity.urgency == "expired" and opportunity.status == OpportunityStatus.PENDING.value:
+            opportunity.status = OpportunityStatus.EXPIRED.value
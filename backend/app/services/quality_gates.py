@@ -2,7 +2,8 @@
 Quality Gates Service - validates generated content before publishing.
 """
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -13,11 +14,24 @@ from app.utils.text_processing import (
     calculate_readability,
     check_length_appropriate,
     calculate_authenticity_score,
+    LENGTH_BOUNDS,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _posting_rule_flags(posting_rules: str) -> Tuple[bool, bool]:
+    """
+    (no self-promotion, no links) flags of a subreddit's posting rules.
+
+    Rules change rarely and repeat across every validation for a subreddit,
+    so they are lowercased and scanned once per distinct rules text.
+    """
+    rules_lower = posting_rules.lower()
+    return "no self-promotion" in rules_lower, "no link" in rules_lower
+
+
 @dataclass
 class CheckResult:
     """Result of a single quality check."""
@@ -130,22 +144,28 @@ class QualityGates:
         if not readability_check.passed:
             warnings.append(readability_check.message)
 
-        # 5. Authenticity
-        authenticity_check = self._check_authenticity(text, context)
+        # 5. Authenticity (reuses the spam, promotional and readability analyses)
+        authenticity_check = self._check_authenticity(
+            text, context,
+            promo=promo_check.details,
+            spam=spam_check.details,
+            readability=readability_check.details,
+        )
         checks.append(authenticity_check)
         if not authenticity_check.passed:
             warnings.append(authenticity_check.message)
 
         # 6. Subreddit Compliance (if config available)
         if subreddit_config:
-            compliance_check = self._check_subreddit_compliance(text, subreddit_config)
+            compliance_check = self._check_subreddit_compliance(
+                text, subreddit_config, promo_check.details
+            )
             checks.append(compliance_check)
             if not compliance_check.passed:
                 blocking_issues.append(compliance_check.message)
 
         # Calculate overall score
-        scores = [c.score for c in checks]
-        overall_score = sum(scores) / len(scores) if scores else 0
+        overall_score = sum(c.score for c in checks) / len(checks) if checks else 0
 
         # Determine if passed
         passed = (
@@ -240,9 +260,16 @@ class QualityGates:
             details=result,
         )
 
-    def _check_authenticity(self, text: str, context: Optional[str] = None) -> CheckResult:
+    def _check_authenticity(
+        self,
+        text: str,
+        context: Optional[str] = None,
+        promo: Optional[Dict[str, Any]] = None,
+        spam: Optional[Dict[str, Any]] = None,
+        readability: Optional[Dict[str, Any]] = None
+    ) -> CheckResult:
         """Check content authenticity."""
-        score = calculate_authenticity_score(text, context)
+        score = calculate_authenticity_score(text, context, promo, spam, readability)
         passed = score >= self.MIN_AUTHENTICITY_SCORE
 
         if passed:
@@ -261,22 +288,29 @@ class QualityGates:
     def _check_subreddit_compliance(
         self,
         text: str,
-        config: SubredditConfig
+        config: SubredditConfig,
+        promo: Optional[Dict[str, Any]] = None
     ) -> CheckResult:
-        """Check compliance with subreddit rules."""
+        """
+        Check compliance with subreddit rules.
+
+        promo is the detect_promotional_language(text) result, if the caller
+        already has it.
+        """
         issues = []
 
         # Check against posting rules if available
         if config.posting_rules:
-            rules_lower = config.posting_rules.lower()
+            no_self_promotion, no_links = _posting_rule_flags(config.posting_rules)
 
             # Check for common rule violations
-            if "no self-promotion" in rules_lower:
-                promo = detect_promotional_language(text)
+            if no_self_promotion:
+                if promo is None:
+                    promo = detect_promotional_language(text)
                 if promo["is_promotional"]:
                     issues.append("Self-promotion may be prohibited")
 
-            if "no link" in rules_lower and "http" in text.lower():
+            if no_links and "http" in text.lower():
                 issues.append("Links may be prohibited")
 
         passed = len(issues) == 0
@@ -300,9 +334,11 @@ class QualityGates:
         Returns:
             bool: True if content passes basic checks
         """
-        # Quick spam check
-        spam = detect_spam_patterns(text)
-        if spam["spam_score"] > self.MAX_SPAM_SCORE:
+        # Cheapest predicate first: length is O(1), the pattern checks scan the text
+
+        # Quick length check
+        min_len, max_len = LENGTH_BOUNDS["comment"]
+        if not min_len <= len(text) <= max_len:
             return False
 
         # Quick promotional check
@@ -310,8 +346,9 @@ class QualityGates:
         if promo["promotional_score"] > self.MAX_PROMOTIONAL_SCORE:
             return False
 
-        # Quick length check
-        if len(text) < 50 or len(text) > 2000:
+        # Quick spam check
+        spam = detect_spam_patterns(text)
+        if spam["spam_score"] > self.MAX_SPAM_SCORE:
             return False
 
         return True
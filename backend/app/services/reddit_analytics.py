@@ -3,8 +3,9 @@ Reddit Analytics Service - collects performance metrics for published content.
 """
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import praw
+from sqlalchemy import and_, case, func, select
 from sqlalchemy.orm import Session
 
 from app.models import GeneratedContent, ContentPerformance, RedditAccount
@@ -13,6 +14,30 @@ from app.utils.reddit_helpers import RedditClientFactory, check_comment_removed,
 logger = logging.getLogger(__name__)
 
 
+def _latest_performance_subquery(content_ids):
+    """
+    Latest ContentPerformance snapshot of each content, as a subquery.
+
+    Snapshots are ranked per content with ROW_NUMBER() so callers can
+    aggregate the latest ones (rn == 1) in a single query instead of one
+    ORDER BY ... LIMIT 1 lookup per content.
+
+    Args:
+        content_ids: Content IDs, as a list or a select of IDs
+    """
+    return select(
+        ContentPerformance.content_id,
+        ContentPerformance.score,
+        ContentPerformance.num_replies,
+        ContentPerformance.is_removed,
+        ContentPerformance.snapshot_at,
+        func.row_number().over(
+            partition_by=ContentPerformance.content_id,
+            order_by=ContentPerformance.snapshot_at.desc(),
+        ).label("rn"),
+    ).where(ContentPerformance.content_id.in_(content_ids)).subquery()
+
+
 class RedditAnalyticsService:
     """
     Service for collecting Reddit analytics.
@@ -29,7 +54,8 @@ class RedditAnalyticsService:
     def fetch_content_metrics(
         self,
         db: Session,
-        content: GeneratedContent
+        content: GeneratedContent,
+        latest_snapshots: Optional[Dict[int, Tuple[int, datetime]]] = None
     ) -> Optional[ContentPerformance]:
         """
         Fetch current metrics for published content.
@@ -37,6 +63,8 @@ class RedditAnalyticsService:
         Args:
             db: Database session
             content: Published content to fetch metrics for
+            latest_snapshots: Preloaded content_id -> (score, snapshot_at) of the
+                latest snapshots; queried for this content if not given
 
         Returns:
             ContentPerformance snapshot
@@ -75,14 +103,21 @@ class RedditAnalyticsService:
 
             # Calculate velocity (score change since last snapshot)
             velocity = None
-            last_snapshot = db.query(ContentPerformance).filter(
-                ContentPerformance.content_id == content.id
-            ).order_by(ContentPerformance.snapshot_at.desc()).first()
+            if latest_snapshots is not None:
+                last_snapshot = latest_snapshots.get(content.id)
+            else:
+                last_snapshot = db.execute(
+                    select(ContentPerformance.score, ContentPerformance.snapshot_at)
+                    .where(ContentPerformance.content_id == content.id)
+                    .order_by(ContentPerformance.snapshot_at.desc())
+                    .limit(1)
+                ).first()
 
             if last_snapshot:
-                time_diff = (datetime.utcnow() - last_snapshot.snapshot_at).total_seconds() / 3600
+                last_score, last_snapshot_at = last_snapshot
+                time_diff = (datetime.utcnow() - last_snapshot_at).total_seconds() / 3600
                 if time_diff > 0:
-                    velocity = (metrics["score"] - last_snapshot.score) / time_diff
+                    velocity = (metrics["score"] - last_score) / time_diff
 
             # Create performance snapshot
             performance = ContentPerformance(
@@ -134,9 +169,19 @@ class RedditAnalyticsService:
         """
         performances = []
 
+        # Previous snapshot of every content, for velocity, in one query
+        latest = _latest_performance_subquery([content.id for content in contents])
+        latest_snapshots = {
+            content_id: (score, snapshot_at)
+            for content_id, score, snapshot_at in db.execute(
+                select(latest.c.content_id, latest.c.score, latest.c.snapshot_at)
+                .where(latest.c.rn == 1)
+            )
+        }
+
         for content in contents:
             try:
-                perf = self.fetch_content_metrics(db, content)
+                perf = self.fetch_content_metrics(db, content, latest_snapshots)
                 if perf:
                     performances.append(perf)
             except Exception as e:
@@ -225,47 +270,45 @@ class RedditAnalyticsService:
             Dict with aggregate metrics
         """
         from datetime import timedelta
-        from sqlalchemy import func
 
         cutoff = datetime.utcnow() - timedelta(days=days)
 
-        # Get all published content for project
-        contents = db.query(GeneratedContent).filter(
+        # All published content for project
+        published = (
             GeneratedContent.project_id == project_id,
             GeneratedContent.status == "published",
-            GeneratedContent.published_at >= cutoff
-        ).all()
+            GeneratedContent.published_at >= cutoff,
+        )
+
+        # Count the content and sum its latest metrics in one statement;
+        # content without snapshots counts as published with no score
+        latest = _latest_performance_subquery(select(GeneratedContent.id).where(*published))
+        total_published, total_score, total_replies, removed_count = db.execute(
+            select(
+                func.count(GeneratedContent.id),
+                func.coalesce(func.sum(latest.c.score), 0),
+                func.coalesce(func.sum(latest.c.num_replies), 0),
+                func.coalesce(func.sum(case((latest.c.is_removed, 1), else_=0)), 0),
+            )
+            .select_from(GeneratedContent)
+            .outerjoin(latest, and_(latest.c.content_id == GeneratedContent.id, latest.c.rn == 1))
+            .where(*published)
+        ).one()
 
-        if not contents:
+        if not total_published:
             return {
                 "project_id": project_id,
                 "period_days": days,
                 "total_published": 0,
             }
 
-        # Get latest metrics for each content
-        total_score = 0
-        total_replies = 0
-        removed_count = 0
-
-        for content in contents:
-            latest = db.query(ContentPerformance).filter(
-                ContentPerformance.content_id == content.id
-            ).order_by(ContentPerformance.snapshot_at.desc()).first()
-
-            if latest:
-                total_score += latest.score
-                total_replies += latest.num_replies
-                if latest.is_removed:
-                    removed_count += 1
-
-        avg_score = total_score / len(contents) if contents else 0
-        removal_rate = removed_count / len(contents) if contents else 0
+        avg_score = total_score / total_published
+        removal_rate = removed_count / total_published
 
         return {
             "project_id": project_id,
             "period_days": days,
-            "total_published": len(contents),
+            "total_published": total_published,
             "total_score": total_score,
             "total_replies": total_replies,
             "avg_score": avg_score,
@@ -292,46 +335,40 @@ class RedditAnalyticsService:
         """
         from app.models import Opportunity
 
-        # Get opportunities and content for this subreddit
-        opportunities = db.query(Opportunity).filter(
-            Opportunity.project_id == project_id,
-            Opportunity.subreddit == subreddit
-        ).all()
-
-        published_contents = []
-        for opp in opportunities:
-            contents = db.query(GeneratedContent).filter(
-                GeneratedContent.opportunity_id == opp.id,
-                GeneratedContent.status == "published"
-            ).all()
-            published_contents.extend(contents)
-
-        if not published_contents:
+        # Published content for this subreddit's opportunities
+        content_ids = list(db.scalars(
+            select(GeneratedContent.id)
+            .join(Opportunity, GeneratedContent.opportunity_id == Opportunity.id)
+            .where(
+                Opportunity.project_id == project_id,
+                Opportunity.subreddit == subreddit,
+                GeneratedContent.status == "published",
+            )
+        ))
+
+        if not content_ids:
             return {
                 "subreddit": subreddit,
                 "total_posts": 0,
             }
 
-        # Aggregate metrics
-        scores = []
-        removal_count = 0
-
-        for content in published_contents:
-            latest = db.query(ContentPerformance).filter(
-                ContentPerformance.content_id == content.id
-            ).order_by(ContentPerformance.snapshot_at.desc()).first()
-
-            if latest:
-                scores.append(latest.score)
-                if latest.is_removed:
-                    removal_count += 1
+        # Aggregate the latest metrics in the database
+        latest = _latest_performance_subquery(content_ids)
+        avg_score, max_score, min_score, removal_count = db.execute(
+            select(
+                func.avg(latest.c.score),
+                func.max(latest.c.score),
+                func.min(latest.c.score),
+                func.coalesce(func.sum(case((latest.c.is_removed, 1), else_=0)), 0),
+            ).where(latest.c.rn == 1)
+        ).one()
 
         return {
             "subreddit": subreddit,
-            "total_posts": len(published_contents),
-            "avg_score": sum(scores) / len(scores) if scores else 0,
-            "max_score": max(scores) if scores else 0,
-            "min_score": min(scores) if scores else 0,
+            "total_posts": len(content_ids),
+            "avg_score": float(avg_score) if avg_score is not None else 0,
+            "max_score": max_score if max_score is not None else 0,
+            "min_score": min_score if min_score is not None else 0,
             "removal_count": removal_count,
-            "removal_rate": removal_count / len(published_contents) if published_contents else 0,
+            "removal_rate": removal_count / len(content_ids),
         }
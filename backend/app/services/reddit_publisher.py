@@ -6,7 +6,9 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 import praw
 from praw.exceptions import RedditAPIException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.core.config import settings
 from app.models import RedditAccount, AccountStatus, GeneratedContent, ContentStatus, Opportunity, Project
@@ -46,6 +48,9 @@ class RedditPublisher:
     - Error handling and recovery
     """
 
+    # Attempts to write the rate counters when they change concurrently
+    MAX_CLAIM_ATTEMPTS = 3
+
     def __init__(self):
         self._clients: Dict[int, praw.Reddit] = {}
 
@@ -86,6 +91,15 @@ class RedditPublisher:
                     error="No available accounts for posting"
                 )
 
+        # Reserve the action before posting so concurrent workers can't
+        # both use the account's last slot
+        if not self._claim_action_slot(db, account):
+            return PublishResult(
+                success=False,
+                content_id=content.id,
+                error=f"Account {account.id} not available for posting"
+            )
+
         try:
             # Get authenticated Reddit client
             reddit = self._get_client(account)
@@ -104,9 +118,7 @@ class RedditPublisher:
             content.published_at = datetime.utcnow()
             content.status = ContentStatus.PUBLISHED.value
 
-            # Update account usage
-            account.last_action_at = datetime.utcnow()
-            account.daily_actions_count += 1
+            # Update account usage (rate counters were updated by _claim_action_slot)
             account.total_posts_made += 1
             account.consecutive_failures = 0
 
@@ -174,6 +186,73 @@ class RedditPublisher:
         self._clients[account.id] = reddit
         return reddit
 
+    def _claim_action_slot(self, db: Session, account: RedditAccount) -> bool:
+        """
+        Reserve one action on the account's rate counters.
+
+        The counters are versioned, so if another worker updated them since
+        they were read the commit fails with StaleDataError; the counters are
+        then re-read, can_post re-checked and the claim retried.
+
+        Returns:
+            bool: True if the slot was reserved
+        """
+        for attempt in range(self.MAX_CLAIM_ATTEMPTS):
+            if not account.can_post:
+                return False
+
+            account.last_action_at = datetime.utcnow()
+            account.daily_actions_count += 1
+
+            try:
+                db.commit()
+                return True
+            except (StaleDataError, IntegrityError):
+                db.rollback()
+                logger.info(
+                    f"Rate counters for account {account.id} changed concurrently, "
+                    f"retrying (attempt {attempt + 1})"
+                )
+
+        return False
+
+    def reset_daily_actions(
+        self,
+        db: Session,
+        account: RedditAccount,
+        reset_before: datetime
+    ) -> bool:
+        """
+        Zero the account's daily action count if it was last reset before reset_before.
+
+        Commits on its own so a concurrent _claim_action_slot can only fail
+        this account's reset; on StaleDataError the counters are re-read
+        and the reset retried, like the claim itself.
+
+        Returns:
+            bool: False if the counters kept changing and the reset was given up
+        """
+        for attempt in range(self.MAX_CLAIM_ATTEMPTS):
+            reset_at = account.daily_actions_reset_at
+            if reset_at is not None and reset_at >= reset_before:
+                return True
+
+            account.daily_actions_count = 0
+            account.daily_actions_reset_at = datetime.utcnow()
+
+            try:
+                db.commit()
+                return True
+            except (StaleDataError, IntegrityError):
+                db.rollback()
+                logger.info(
+                    f"Rate counters for account {account.id} changed concurrently, "
+                    f"retrying reset (attempt {attempt + 1})"
+                )
+
+        logger.warning(f"Could not reset daily actions for account {account.id}")
+        return False
+
     def _select_best_account(
         self,
         db: Session,
@@ -394,12 +473,6 @@ class RedditPublisher:
                 issues.append("High removal rate")
                 status = "warning"
 
-            # Reset daily actions if needed
-            if account.daily_actions_reset_at:
-                if datetime.utcnow() - account.daily_actions_reset_at > timedelta(days=1):
-                    account.daily_actions_count = 0
-                    account.daily_actions_reset_at = datetime.utcnow()
-
             account.status = AccountStatus.ACTIVE.value
             account.health_score = 1.0 if not issues else 0.7
             account.last_health_check_at = datetime.utcnow()
@@ -413,6 +486,11 @@ class RedditPublisher:
 
         db.commit()
 
+        # Reset daily actions if needed. Done after the commit above so a
+        # concurrent claim on the rate counters can't discard the health update.
+        if status != "error" and account.daily_actions_reset_at:
+            self.reset_daily_actions(db, account, datetime.utcnow() - timedelta(days=1))
+
         return {
             "account_id": account.id,
             "username": account.username,
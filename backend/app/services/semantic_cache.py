@@ -0,0 +1,173 @@
+"""
+Semantic Cache - reuses generated content for near-identical prompts.
+
+Entries are kept in Redis per (project, subreddit, style, mention strategy) as a capped
+list of {embedding, content_text, metadata} records. Lookups embed the post
+being answered and compare it against the stored embeddings by cosine
+similarity; a hit above the configured threshold returns the cached text
+instead of paying for another LLM round-trip.
+"""
+import base64
+import logging
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Redis-backed similarity cache for generated content.
+
+    The cache fails open: any Redis error or unreadable entry is logged and
+    treated as a miss, so generation never depends on the cache.
+    """
+
+    KEY_PREFIX = "content_cache"
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        threshold: Optional[float] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.redis = redis_client or aioredis.from_url(settings.REDIS_URL)
+        self.threshold = threshold if threshold is not None else settings.SEMANTIC_CACHE_THRESHOLD
+        self.ttl_seconds = ttl_seconds or settings.SEMANTIC_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.SEMANTIC_CACHE_MAX_ENTRIES
+
+    def _key(self, project_id: int, subreddit: str, style: str, mention_strategy: str) -> str:
+        return f"{self.KEY_PREFIX}:{project_id}:{subreddit.lower()}:{style}:{mention_strategy}"
+
+    @staticmethod
+    def _decode(raw: bytes) -> Tuple[Dict[str, Any], np.ndarray]:
+        entry = orjson.loads(raw)
+        vector = np.frombuffer(base64.b64decode(entry["embedding"]), dtype=np.float32)
+        return entry, vector
+
+    async def lookup(
+        self,
+        project_id: int,
+        subreddit: str,
+        style: str,
+        mention_strategy: str,
+        embedding: Sequence[float]
+    ) -> Optional[Tuple[str, Dict[str, Any], float]]:
+        """
+        Find the most similar cached generation for a prompt embedding.
+
+        Args:
+            project_id: Project the content belongs to
+            subreddit: Subreddit the content was written for
+            style: Content style
+            mention_strategy: Mention strategy the content was written for
+            embedding: Embedding of the post being answered
+
+        Returns:
+            Tuple of (content_text, metadata, similarity), or None on a miss
+        """
+        key = self._key(project_id, subreddit, style, mention_strategy)
+        try:
+            raw_entries = await self.redis.lrange(key, 0, -1)
+        except RedisError as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+        if not raw_entries:
+            return None
+
+        query = np.asarray(embedding, dtype=np.float32)
+
+        # Entries that don't decode, or were embedded with a different model
+        # (dimension), can never match; skip them and evict them below
+        entries, vectors, invalid = [], [], []
+        for raw in raw_entries:
+            try:
+                entry, vector = self._decode(raw)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable semantic cache entry in {key}: {e}")
+                invalid.append(raw)
+                continue
+            if vector.shape != query.shape:
+                invalid.append(raw)
+                continue
+            entries.append(entry)
+            vectors.append(vector)
+
+        if invalid:
+            await self._evict(key, invalid)
+
+        if not entries:
+            return None
+
+        try:
+            matrix = np.stack(vectors)
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+            similarities = (matrix @ query) / np.where(norms == 0, 1.0, norms)
+
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                return None
+
+            return entries[best]["content_text"], entries[best]["metadata"], similarity
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    async def _evict(self, key: str, raw_entries: Sequence[bytes]) -> None:
+        """Remove the given raw entries from a cache list."""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for raw in raw_entries:
+                    pipe.lrem(key, 0, raw)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Semantic cache eviction failed: {e}")
+
+    async def store(
+        self,
+        project_id: int,
+        subreddit: str,
+        style: str,
+        mention_strategy: str,
+        embedding: Sequence[float],
+        content_text: str,
+        metadata: Dict[str, Any]
+    ) -> None:
+        """
+        Cache a generation, keeping only the newest max_entries per key.
+
+        Args:
+            project_id: Project the content belongs to
+            subreddit: Subreddit the content was written for
+            style: Content style
+            mention_strategy: Mention strategy the content was written for
+            embedding: Embedding of the post being answered
+            content_text: Generated text
+            metadata: Provider metadata from the generation
+        """
+        key = self._key(project_id, subreddit, style, mention_strategy)
+        entry = orjson.dumps({
+            "embedding": base64.b64encode(
+                np.asarray(embedding, dtype=np.float32).tobytes()
+            ).decode("ascii"),
+            "content_text": content_text,
+            "metadata": metadata,
+        })
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.lpush(key, entry)
+                pipe.ltrim(key, 0, self.max_entries - 1)
+                pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Semantic cache store failed: {e}")
@@ -5,6 +5,8 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import praw
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.models import SubredditConfig
@@ -239,20 +241,95 @@ class SubredditAnalyzer:
             project_id: Project ID
 
         Returns:
-            List of SubredditConfig objects
+            List of successfully analyzed SubredditConfig objects
         """
         configs = []
 
+        # Create the missing config rows up front in one statement
+        created = self.create_missing_configs(db, subreddit_names, project_id)
+
+        analyzed = set()
         for name in subreddit_names:
             try:
                 config = self.analyze_subreddit(db, name, project_id)
-                configs.append(config)
+                if config.last_analyzed_at is not None:
+                    configs.append(config)
+                    analyzed.add(name)
             except Exception as e:
                 logger.error(f"Error analyzing r/{name}: {e}")
                 continue
 
+        # Drop placeholders whose analysis failed so they can be added again later
+        failed = [name for name in created if name not in analyzed]
+        if failed:
+            self._remove_configs(db, failed, project_id)
+
         return configs
 
+    def create_missing_configs(
+        self,
+        db: Session,
+        subreddit_names: List[str],
+        project_id: int
+    ) -> List[str]:
+        """
+        Insert empty configs for subreddits the project doesn't have yet.
+
+        Uses a single multi-row INSERT ... ON CONFLICT DO NOTHING on the
+        (project_id, subreddit_name) unique constraint instead of an ORM
+        query and flush per subreddit. Names that don't fit the column are
+        skipped, and errors are logged rather than raised.
+
+        Args:
+            db: Database session
+            subreddit_names: List of subreddit names
+            project_id: Project ID
+
+        Returns:
+            Names of the configs that were inserted
+        """
+        max_length = SubredditConfig.subreddit_name.type.length
+        rows = []
+        for name in dict.fromkeys(subreddit_names):
+            if not name or len(name) > max_length:
+                logger.warning(f"Skipping invalid subreddit name: {name!r}")
+                continue
+            rows.append({"project_id": project_id, "subreddit_name": name})
+        if not rows:
+            return []
+
+        insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(SubredditConfig).values(rows).on_conflict_do_nothing(
+            index_elements=["project_id", "subreddit_name"]
+        ).returning(SubredditConfig.subreddit_name)
+
+        try:
+            created = list(db.scalars(stmt))
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error creating subreddit configs for project {project_id}: {e}")
+            db.rollback()
+            return []
+
+        return created
+
+    def _remove_configs(
+        self,
+        db: Session,
+        subreddit_names: List[str],
+        project_id: int
+    ) -> None:
+        """Delete the given subreddit configs of a project."""
+        try:
+            db.query(SubredditConfig).filter(
+                SubredditConfig.project_id == project_id,
+                SubredditConfig.subreddit_name.in_(subreddit_names)
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error removing unanalyzed subreddit configs: {e}")
+            db.rollback()
+
     def get_posting_recommendation(
         self,
         config: SubredditConfig
@@ -32,7 +32,8 @@ class ViralityPredictor:
     def predict(
         self,
         submission: praw.models.Submission,
-        velocity_threshold: float
+        velocity_threshold: float,
+        subreddit_subscribers: Optional[int] = None
     ) -> float:
         """
         Predict virality score for a submission.
@@ -40,19 +41,23 @@ class ViralityPredictor:
         Args:
             submission: Reddit submission
             velocity_threshold: Subreddit's velocity threshold
+            subreddit_subscribers: Subscriber count, if the caller already has it.
+                Listing submissions carry a lazy Subreddit, so reading it from
+                the submission costs one API request per post.
 
         Returns:
             float: Virality score (0-1)
         """
         if self.model:
-            return self._predict_ml(submission, velocity_threshold)
+            return self._predict_ml(submission, velocity_threshold, subreddit_subscribers)
         else:
-            return self._predict_heuristic(submission, velocity_threshold)
+            return self._predict_heuristic(submission, velocity_threshold, subreddit_subscribers)
 
     def _predict_heuristic(
         self,
         submission: praw.models.Submission,
-        velocity_threshold: float
+        velocity_threshold: float,
+        subreddit_subscribers: Optional[int] = None
     ) -> float:
         """
         Heuristic-based virality prediction.
@@ -61,8 +66,10 @@ class ViralityPredictor:
         """
         score = 0.5  # Base score
 
-        # Extract features
-        features = self._extract_features(submission)
+        # Extract features (author features are unused here and cost a request each)
+        features = self._extract_features(
+            submission, subreddit_subscribers, include_author=False
+        )
 
         # 1. Velocity signal (most important)
         velocity = features["velocity"]
@@ -120,14 +127,15 @@ class ViralityPredictor:
     def _predict_ml(
         self,
         submission: praw.models.Submission,
-        velocity_threshold: float
+        velocity_threshold: float,
+        subreddit_subscribers: Optional[int] = None
     ) -> float:
         """
         ML-based virality prediction.
 
         Uses trained XGBoost/LightGBM model.
         """
-        features = self._extract_features(submission)
+        features = self._extract_features(submission, subreddit_subscribers)
         feature_vector = self._features_to_vector(features, velocity_threshold)
 
         try:
@@ -136,15 +144,24 @@ class ViralityPredictor:
             return float(proba)
         except Exception as e:
             logger.error(f"ML prediction failed, falling back to heuristic: {e}")
-            return self._predict_heuristic(submission, velocity_threshold)
+            return self._predict_heuristic(submission, velocity_threshold, subreddit_subscribers)
 
-    def _extract_features(self, submission: praw.models.Submission) -> Dict[str, Any]:
+    def _extract_features(
+        self,
+        submission: praw.models.Submission,
+        subreddit_subscribers: Optional[int] = None,
+        include_author: bool = True
+    ) -> Dict[str, Any]:
         """
         Extract features from a submission for prediction.
 
         Returns features that are available at time of discovery
-        (not outcomes like final score).
+        (not outcomes like final score). Subreddit and author features
+        trigger lazy PRAW fetches, so a known subscriber count can be passed
+        in and author features skipped.
         """
+        if subreddit_subscribers is None:
+            subreddit_subscribers = submission.subreddit.subscribers
         age_hours = get_post_age_hours(submission)
         age_hours = max(0.1, age_hours)  # Avoid division by zero
 
@@ -153,7 +170,7 @@ class ViralityPredictor:
         comment_velocity = submission.num_comments / age_hours
         velocity = (score_velocity * 0.7) + (comment_velocity * 0.3 * 10)
 
-        return {
+        features = {
             # Temporal features
             "age_hours": age_hours,
             "hour_of_day": datetime.utcfromtimestamp(submission.created_utc).hour,
@@ -184,13 +201,16 @@ class ViralityPredictor:
 
             # Subreddit features
             "subreddit": submission.subreddit.display_name,
-            "subreddit_subscribers": submission.subreddit.subscribers,
-
-            # Author features (if available)
-            "author_karma": self._get_author_karma(submission),
-            "author_account_age_days": self._get_author_age(submission),
+            "subreddit_subscribers": subreddit_subscribers,
         }
 
+        # Author features (if available)
+        if include_author:
+            features["author_karma"] = self._get_author_karma(submission)
+            features["author_account_age_days"] = self._get_author_age(submission)
+
+        return features
+
     def _features_to_vector(
         self,
         features: Dict[str, Any],
@@ -11,6 +11,8 @@ from app.tasks.generate_content import (
     generate_content_task,
     regenerate_content_task,
     batch_generate_content_task,
+    submit_content_batch_task,
+    collect_content_batches_task,
     auto_generate_for_urgent_task,
 )
 from app.tasks.collect_analytics import (
@@ -40,6 +42,8 @@ __all__ = [
     "generate_content_task",
     "regenerate_content_task",
     "batch_generate_content_task",
+    "submit_content_batch_task",
+    "collect_content_batches_task",
     "auto_generate_for_urgent_task",
     # Analytics tasks
     "collect_content_analytics_task",
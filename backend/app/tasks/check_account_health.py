@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.core.celery_app import celery_app
 from app.db.database import SessionLocal
-from app.models import RedditAccount, AccountStatus
+from app.models import RedditAccount, RedditAccountRate, AccountStatus
 from app.services.reddit_publisher import RedditPublisher
 
 logger = logging.getLogger(__name__)
@@ -180,21 +180,22 @@ def reset_daily_limits_task():
 
     try:
         now = datetime.utcnow()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Get accounts that need reset
-        accounts = db.query(RedditAccount).filter(
-            (RedditAccount.daily_actions_reset_at.is_(None)) |
-            (RedditAccount.daily_actions_reset_at < now.replace(hour=0, minute=0, second=0))
+        accounts = db.query(RedditAccount).outerjoin(RedditAccount.rate).filter(
+            (RedditAccountRate.daily_actions_reset_at.is_(None)) |
+            (RedditAccountRate.daily_actions_reset_at < midnight)
         ).all()
 
+        # Reset and commit per account, so a concurrent claim on one
+        # account's versioned counters doesn't roll back the others
+        publisher = RedditPublisher()
         reset_count = 0
 
         for account in accounts:
-            account.daily_actions_count = 0
-            account.daily_actions_reset_at = now
-            reset_count += 1
-
-        db.commit()
+            if publisher.reset_daily_actions(db, account, midnight):
+                reset_count += 1
 
         logger.info(f"Reset daily limits for {reset_count} accounts")
 
@@ -225,9 +226,9 @@ def recover_rate_limited_accounts_task():
         # Rate limit typically lasts 10 minutes
         cooldown_cutoff = datetime.utcnow() - timedelta(minutes=15)
 
-        rate_limited = db.query(RedditAccount).filter(
+        rate_limited = db.query(RedditAccount).join(RedditAccount.rate).filter(
             RedditAccount.status == AccountStatus.RATE_LIMITED.value,
-            RedditAccount.last_action_at < cooldown_cutoff
+            RedditAccountRate.last_action_at < cooldown_cutoff
         ).all()
 
         recovered = 0
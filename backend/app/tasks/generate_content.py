@@ -1,8 +1,11 @@
 """
 Celery tasks for content generation.
 """
+import asyncio
 import logging
-from typing import Optional
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Awaitable, Dict, List, Optional, TypeVar
 
 from celery import shared_task
 from sqlalchemy.orm import Session
@@ -18,6 +21,30 @@ from app.services.quality_gates import QualityGates
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Per worker process: one event loop reused by every task, and one generator
+# bound to it, so SDK connection pools (and their TLS sessions) survive across
+# tasks instead of being rebuilt for each job
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_generator: Optional[ContentGenerator] = None
+
+
+def _run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on this worker's persistent event loop."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop.run_until_complete(coro)
+
+
+def _get_generator() -> ContentGenerator:
+    """ContentGenerator shared by all tasks in this worker process."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = ContentGenerator()
+    return _worker_generator
+
 
 @celery_app.task(
     bind=True,
@@ -55,6 +82,11 @@ def generate_content_task(
             logger.error(f"Project not found for opportunity {opportunity_id}")
             return {"error": "Project not found"}
 
+        # Already being generated through an OpenAI batch
+        if (opportunity.opportunity_metadata or {}).get("batch_id"):
+            logger.info(f"Opportunity {opportunity_id} is in a pending batch, skipping")
+            return {"skipped": True, "reason": "Batch generation in progress"}
+
         # Update opportunity status
         opportunity.status = OpportunityStatus.GENERATING.value
         db.commit()
@@ -62,18 +94,9 @@ def generate_content_task(
         logger.info(f"Generating content for opportunity {opportunity_id}")
 
         # Generate content
-        generator = ContentGenerator()
-
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            content = loop.run_until_complete(
-                generator.generate_content(opportunity, project, style)
-            )
-        finally:
-            loop.close()
+        content = _run_async(
+            _get_generator().generate_content(opportunity, project, style)
+        )
 
         # Run quality gates
         quality_gates = QualityGates()
@@ -173,24 +196,15 @@ def regenerate_content_task(
 
         logger.info(f"Regenerating content {content_id}")
 
-        generator = ContentGenerator()
-
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            new_content = loop.run_until_complete(
-                generator.regenerate_content(
-                    content=content,
-                    opportunity=opportunity,
-                    project=project,
-                    feedback=feedback,
-                    new_style=new_style,
-                )
+        new_content = _run_async(
+            _get_generator().regenerate_content(
+                content=content,
+                opportunity=opportunity,
+                project=project,
+                feedback=feedback,
+                new_style=new_style,
             )
-        finally:
-            loop.close()
+        )
 
         # Run quality gates
         quality_gates = QualityGates()
@@ -281,6 +295,186 @@ def batch_generate_content_task(project_id: int, max_items: int = 10):
         db.close()
 
 
+@celery_app.task(
+    name="tasks.submit_content_batch",
+    queue="content-generation",
+)
+def submit_content_batch_task(
+    project_id: int,
+    max_items: int = 50,
+    styles: Optional[List[str]] = None,
+):
+    """
+    Submit content generation for approved opportunities to the OpenAI Batch API.
+
+    Cheaper than queueing generate_content_task per opportunity, but results
+    can take hours, so use it for backfills rather than urgent items. The
+    opportunities are marked GENERATING with the batch ID in their metadata;
+    collect_content_batches_task picks up the results once the batch ends.
+
+    Args:
+        project_id: Project to generate content for
+        max_items: Maximum number of opportunities to process
+        styles: Content styles to generate per opportunity (default: helpful_expert)
+    """
+    db = SessionLocal()
+    styles = styles or ["helpful_expert"]
+
+    try:
+        project = db.query(Project).get(project_id)
+
+        if not project:
+            logger.error(f"Project {project_id} not found")
+            return {"error": "Project not found"}
+
+        opportunities = db.query(Opportunity).filter(
+            Opportunity.project_id == project_id,
+            Opportunity.status == OpportunityStatus.APPROVED.value
+        ).order_by(
+            Opportunity.composite_score.desc()
+        ).limit(max_items).all()
+
+        if not opportunities:
+            return {"project_id": project_id, "submitted_count": 0}
+
+        # Claim the opportunities before submitting, so no other generation
+        # path picks them up while the batch runs
+        for opp in opportunities:
+            opp.status = OpportunityStatus.GENERATING.value
+        db.commit()
+
+        jobs = [(opp, project, style) for opp in opportunities for style in styles]
+
+        logger.info(
+            f"Batch API submitting {len(jobs)} items for {len(opportunities)} opportunities "
+            f"in project {project_id}"
+        )
+
+        try:
+            batch_id = _run_async(_get_generator().submit_content_batch(jobs))
+        except Exception:
+            for opp in opportunities:
+                opp.status = OpportunityStatus.APPROVED.value
+            db.commit()
+            raise
+
+        for opp in opportunities:
+            opp.opportunity_metadata = {
+                **(opp.opportunity_metadata or {}),
+                "batch_id": batch_id,
+                "batch_styles": styles,
+            }
+        db.commit()
+
+        return {
+            "project_id": project_id,
+            "batch_id": batch_id,
+            "submitted_count": len(jobs),
+            "opportunity_ids": [opp.id for opp in opportunities],
+        }
+
+    except Exception as e:
+        logger.exception(f"Batch API submission failed for project {project_id}: {e}")
+        db.rollback()
+        return {"error": str(e)}
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name="tasks.collect_content_batches",
+    queue="content-generation",
+)
+def collect_content_batches_task():
+    """
+    Collect the results of finished OpenAI batches.
+
+    Runs periodically via Celery beat. Each pending batch is checked once;
+    finished ones get their content stored and quality-checked. Opportunities
+    with no successful result go back to APPROVED so they are generated again.
+    """
+    db = SessionLocal()
+
+    try:
+        pending = db.query(Opportunity).filter(
+            Opportunity.status == OpportunityStatus.GENERATING.value
+        ).all()
+
+        opportunities_by_batch: Dict[str, List[Opportunity]] = defaultdict(list)
+        for opp in pending:
+            batch_id = (opp.opportunity_metadata or {}).get("batch_id")
+            if batch_id:
+                opportunities_by_batch[batch_id].append(opp)
+
+        generator = _get_generator()
+        quality_gates = QualityGates()
+        collected = []
+
+        for batch_id, opportunities in opportunities_by_batch.items():
+            try:
+                results = _run_async(generator.fetch_content_batch(batch_id))
+                if results is None:
+                    continue
+
+                generated_at = datetime.now(timezone.utc).isoformat()
+                content_count = 0
+
+                for opp in opportunities:
+                    metadata = dict(opp.opportunity_metadata)
+                    metadata.pop("batch_id")
+                    styles = metadata.pop("batch_styles", None) or ["helpful_expert"]
+
+                    contents = []
+                    for style in styles:
+                        result = results.get(generator.batch_custom_id(opp.id, style))
+                        if result is None:
+                            continue
+                        content_text, content_metadata = result
+                        contents.append(generator.build_batch_content(
+                            opp, opp.project, style, content_text, content_metadata, generated_at
+                        ))
+
+                    for content in contents:
+                        quality_result = quality_gates.run_all_checks(content, opp)
+
+                        content.quality_score = quality_result.overall_score
+                        content.quality_checks = quality_result.to_dict()
+                        content.passed_quality_gates = quality_result.passed
+                        content.status = (
+                            ContentStatus.PENDING.value if quality_result.passed
+                            else ContentStatus.DRAFT.value
+                        )
+                        db.add(content)
+
+                    opp.opportunity_metadata = metadata
+                    opp.status = (
+                        OpportunityStatus.READY.value if contents
+                        else OpportunityStatus.APPROVED.value
+                    )
+                    content_count += len(contents)
+
+                db.commit()
+                collected.append(batch_id)
+                logger.info(f"Collected {content_count} contents from OpenAI batch {batch_id}")
+
+            except Exception as e:
+                logger.exception(f"Collecting OpenAI batch {batch_id} failed: {e}")
+                db.rollback()
+
+        return {
+            "pending_batches": len(opportunities_by_batch) - len(collected),
+            "collected_batches": collected,
+        }
+
+    except Exception as e:
+        logger.exception(f"Batch collection task failed: {e}")
+        return {"error": str(e)}
+
+    finally:
+        db.close()
+
+
 @celery_app.task(
     name="tasks.auto_generate_for_urgent",
     queue="content-generation",
@@ -201,14 +201,7 @@ def refresh_opportunity_scores_task(opportunity_ids: Optional[List[int]] = None)
         logger.info(f"Refreshing scores for {len(opportunities)} opportunities")
 
         miner = OpportunityMiner()
-        refreshed = 0
-
-        for opp in opportunities:
-            try:
-                miner.refresh_opportunity_scores(db, opp)
-                refreshed += 1
-            except Exception as e:
-                logger.warning(f"Failed to refresh opportunity {opp.id}: {e}")
+        refreshed = miner.refresh_opportunities_bulk(db, opportunities)
 
         return {"refreshed_count": refreshed}
 
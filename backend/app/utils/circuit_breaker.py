@@ -0,0 +1,81 @@
+"""
+Circuit breaker for calls to external providers.
+"""
+import logging
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    CLOSED: calls go through; failures are counted.
+    OPEN: after failure_threshold consecutive failures, calls fail immediately
+        with CircuitOpenError until reset_timeout seconds have passed.
+    HALF-OPEN: after the timeout a single probe call is let through; success
+        closes the circuit, failure re-opens it for another timeout.
+
+    State is only touched between awaits, so it is safe to share between
+    coroutines on one event loop without a lock.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.fail_count = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.fail_count >= self.failure_threshold
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the call should not be attempted."""
+        if not self.is_open:
+            return
+
+        if time.monotonic() - self.opened_at < self.reset_timeout or self._probe_in_flight:
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+        # Half-open: let exactly this call through as a probe
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        if self.is_open:
+            logger.info(f"{self.name} circuit closed")
+        self.fail_count = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.fail_count += 1
+        self._probe_in_flight = False
+        if self.is_open:
+            if self.fail_count == self.failure_threshold:
+                logger.warning(f"{self.name} circuit opened after {self.fail_count} failures")
+            self.opened_at = time.monotonic()
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Await func(*args, **kwargs) through the breaker."""
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # Cancelled: not the provider's fault, but free the probe slot
+            self._probe_in_flight = False
+            raise
+        self.record_success()
+        return result
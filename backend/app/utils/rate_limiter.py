@@ -0,0 +1,45 @@
+"""
+Token-bucket rate limiter for calls to external providers.
+"""
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Async token bucket: at most `rate` acquisitions per `period` seconds,
+    with bursts of up to `rate`.
+
+    Only plain attributes are kept (no asyncio primitives), so one
+    process-wide instance isn't bound to an event loop: the API server's loop
+    and a Celery worker's persistent task loop can both use it, and its
+    tokens carry over from one task to the next.
+    """
+
+    def __init__(self, name: str, rate: float, period: float = 60.0):
+        self.name = name
+        self.rate = rate
+        self.period = period
+        self.tokens = float(rate)
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate / self.period)
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed, then take its token."""
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) * self.period / self.rate)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
@@ -2,9 +2,12 @@
 Reddit API helper utilities for PRAW integration.
 """
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import praw
+import prawcore
 from praw.models import Submission, Comment, Subreddit
 
 from app.core.config import settings
@@ -13,22 +16,77 @@ from app.utils.encryption import decrypt_token
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at rate_per_minute up to capacity; acquire()
+    blocks until a token is available.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# PRAW rate-limits each client on its own, but all read-only clients share
+# the app's client id, so they draw from one process-wide budget
+_read_only_rate_limiter = TokenBucket(settings.REDDIT_READ_REQUESTS_PER_MINUTE)
+
+
+class RateLimitedRequestor(prawcore.Requestor):
+    """prawcore requestor that takes a token from the shared bucket per request."""
+
+    def request(self, *args: Any, **kwargs: Any):
+        _read_only_rate_limiter.acquire()
+        return super().request(*args, **kwargs)
+
+
+# Read-only clients, one per thread: PRAW instances are not thread-safe, but
+# reusing a thread's client keeps its OAuth token and HTTP connections alive
+# for as long as the thread lives.
+_read_only_clients = threading.local()
+
+
 class RedditClientFactory:
     """Factory for creating PRAW Reddit client instances."""
 
     @staticmethod
     def create_read_only_client() -> praw.Reddit:
         """
-        Create a read-only Reddit client for mining.
+        Get the read-only Reddit client for the current thread.
+
+        The client is created on first use and reused afterwards. Its
+        requests are throttled by the process-wide read-only rate limiter.
 
         Returns:
             praw.Reddit: Read-only PRAW client
         """
-        return praw.Reddit(
-            client_id=settings.REDDIT_CLIENT_ID,
-            client_secret=settings.REDDIT_CLIENT_SECRET,
-            user_agent=settings.REDDIT_USER_AGENT,
-        )
+        reddit = getattr(_read_only_clients, "reddit", None)
+        if reddit is None:
+            reddit = _read_only_clients.reddit = praw.Reddit(
+                client_id=settings.REDDIT_CLIENT_ID,
+                client_secret=settings.REDDIT_CLIENT_SECRET,
+                user_agent=settings.REDDIT_USER_AGENT,
+                requestor_class=RateLimitedRequestor,
+            )
+        return reddit
 
     @staticmethod
     def create_authenticated_client(
@@ -62,7 +120,7 @@ class RedditClientFactory:
         return reddit
 
 
-def calculate_post_velocity(submission: Submission) -> float:
+def calculate_post_velocity(submission: Submission, age_hours: Optional[float] = None) -> float:
     """
     Calculate the velocity of a Reddit post.
 
@@ -70,11 +128,13 @@ def calculate_post_velocity(submission: Submission) -> float:
 
     Args:
         submission: PRAW Submission object
+        age_hours: Post age, if already computed by the caller
 
     Returns:
         float: Velocity score
     """
-    age_hours = get_post_age_hours(submission)
+    if age_hours is None:
+        age_hours = get_post_age_hours(submission)
 
     if age_hours < 0.1:  # Less than 6 minutes old
         age_hours = 0.1  # Avoid division by very small numbers
@@ -102,6 +162,32 @@ def get_post_age_hours(submission: Submission) -> float:
     return age_delta.total_seconds() / 3600
 
 
+# Urgency levels, most urgent first; index = urgency code
+URGENCY_LEVELS = ("urgent", "high", "medium", "low", "expired")
+
+# Upper age bounds (exclusive, hours) of the urgent/high/medium levels
+URGENCY_AGE_BOUNDS = (1, 2, 4)
+# Posts older than this are expired regardless of velocity
+URGENCY_MAX_AGE_HOURS = 6
+
+
+def urgency_code(velocity: float, age_hours: float, threshold: float) -> int:
+    """
+    Urgency level of a post as an index into URGENCY_LEVELS.
+
+    A post is only as urgent as both its velocity and its age allow, so the
+    code is the worse (larger) of the level each one permits on its own.
+    """
+    velocity_code = 3 - (
+        (velocity > threshold * 0.5) + (velocity > threshold) + (velocity > threshold * 2)
+    )
+    age_code = (
+        (age_hours >= URGENCY_AGE_BOUNDS[0]) + (age_hours >= URGENCY_AGE_BOUNDS[1]) +
+        (age_hours >= URGENCY_AGE_BOUNDS[2]) + (age_hours > URGENCY_MAX_AGE_HOURS)
+    )
+    return max(velocity_code, age_code)
+
+
 def classify_urgency(velocity: float, age_hours: float, threshold: float) -> str:
     """
     Classify opportunity urgency based on velocity and age.
@@ -114,16 +200,7 @@ def classify_urgency(velocity: float, age_hours: float, threshold: float) -> str
     Returns:
         str: Urgency level (urgent, high, medium, low, expired)
     """
-    if age_hours > 6:
-        return "expired"
-    elif velocity > threshold * 2 and age_hours < 1:
-        return "urgent"
-    elif velocity > threshold and age_hours < 2:
-        return "high"
-    elif velocity > threshold * 0.5 and age_hours < 4:
-        return "medium"
-    else:
-        return "low"
+    return URGENCY_LEVELS[urgency_code(velocity, age_hours, threshold)]
 
 
 def get_velocity_threshold(subscribers: int) -> float:
@@ -146,6 +223,11 @@ def get_velocity_threshold(subscribers: int) -> float:
         return 200.0
 
 
+def reddit_post_url(subreddit: str, post_id: str) -> str:
+    """Canonical Reddit URL of a post."""
+    return f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/"
+
+
 def extract_submission_data(submission: Submission) -> Dict[str, Any]:
     """
     Extract relevant data from a PRAW Submission object.
@@ -156,12 +238,13 @@ def extract_submission_data(submission: Submission) -> Dict[str, Any]:
     Returns:
         Dict containing submission data
     """
+    subreddit = submission.subreddit.display_name
     return {
         "reddit_post_id": submission.id,
-        "subreddit": submission.subreddit.display_name,
+        "subreddit": subreddit,
         "post_title": submission.title,
         "post_content": submission.selftext if submission.is_self else None,
-        "post_url": f"https://www.reddit.com{submission.permalink}",
+        "post_url": reddit_post_url(subreddit, submission.id),
         "post_author": str(submission.author) if submission.author else "[deleted]",
         "post_created_at": datetime.utcfromtimestamp(submission.created_utc),
         "post_score": submission.score,
@@ -35,6 +35,24 @@ SPAM_INDICATORS = [
     r'(?:BUY|SALE|DISCOUNT|OFFER|LIMITED)',  # Sales language (caps)
 ]
 
+# (min, max) character bounds by content type
+LENGTH_BOUNDS = {
+    "comment": (50, 2000),
+    "post": (100, 10000),
+    "reply": (20, 1000),
+}
+
+# Compiled once at import; the checks run for every generated comment
+_PROMOTIONAL_REGEXES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in PROMOTIONAL_PATTERNS)
+_SPAM_REGEXES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in SPAM_INDICATORS)
+_REPEATED_CHARS_PATTERN = re.compile(r'(.)\1{4,}')
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_KEYWORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+_PERSONAL_PRONOUN_PATTERN = re.compile(r'\b(I|my|me|we|our)\b', re.IGNORECASE)
+_TRACKING_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^)]+\?[^)]*(?:ref|affiliate|utm)[^)]*\)')
+_EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+_EXCESS_SPACES_PATTERN = re.compile(r' {2,}')
+
 
 def detect_promotional_language(text: str) -> Dict[str, Any]:
     """
@@ -49,8 +67,8 @@ def detect_promotional_language(text: str) -> Dict[str, Any]:
     text_lower = text.lower()
     matches = []
 
-    for pattern in PROMOTIONAL_PATTERNS:
-        found = re.findall(pattern, text_lower, re.IGNORECASE)
+    for pattern in _PROMOTIONAL_REGEXES:
+        found = pattern.findall(text_lower)
         if found:
             matches.extend(found)
 
@@ -76,8 +94,8 @@ def detect_spam_patterns(text: str) -> Dict[str, Any]:
     """
     indicators = []
 
-    for pattern in SPAM_INDICATORS:
-        found = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _SPAM_REGEXES:
+        found = pattern.findall(text)
         if found:
             indicators.extend(found)
 
@@ -87,7 +105,7 @@ def detect_spam_patterns(text: str) -> Dict[str, Any]:
     caps_ratio = caps_words / max(len(words), 1)
 
     # Check for repeated characters
-    repeated_chars = bool(re.search(r'(.)\1{4,}', text))
+    repeated_chars = bool(_REPEATED_CHARS_PATTERN.search(text))
 
     spam_score = (
         (len(indicators) * 0.2) +
@@ -115,7 +133,7 @@ def calculate_readability(text: str) -> Dict[str, Any]:
         Dict with readability metrics
     """
     # Split into sentences
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENTENCE_SPLIT_PATTERN.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
 
     # Split into words
@@ -178,7 +196,7 @@ def extract_keywords(text: str, top_n: int = 10) -> List[str]:
     }
 
     # Extract words
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+    words = _KEYWORD_PATTERN.findall(text.lower())
     words = [w for w in words if w not in stop_words]
 
     # Count frequencies
@@ -210,17 +228,10 @@ def check_length_appropriate(
     Returns:
         Dict with length check results
     """
-    # Default lengths by type
-    defaults = {
-        "comment": {"min": 50, "max": 2000},
-        "post": {"min": 100, "max": 10000},
-        "reply": {"min": 20, "max": 1000},
-    }
+    default_min, default_max = LENGTH_BOUNDS.get(content_type, LENGTH_BOUNDS["comment"])
 
-    type_defaults = defaults.get(content_type, defaults["comment"])
-
-    min_len = min_length or type_defaults["min"]
-    max_len = max_length or type_defaults["max"]
+    min_len = min_length or default_min
+    max_len = max_length or default_max
 
     word_count = len(text.split())
     char_count = len(text)
@@ -238,7 +249,13 @@ def check_length_appropriate(
     }
 
 
-def calculate_authenticity_score(text: str, context: Optional[str] = None) -> float:
+def calculate_authenticity_score(
+    text: str,
+    context: Optional[str] = None,
+    promo: Optional[Dict[str, Any]] = None,
+    spam: Optional[Dict[str, Any]] = None,
+    readability: Optional[Dict[str, Any]] = None
+) -> float:
     """
     Calculate an authenticity score for generated content.
 
@@ -247,6 +264,9 @@ def calculate_authenticity_score(text: str, context: Optional[str] = None) -> fl
     Args:
         text: Generated text to analyze
         context: Optional context (original post) for relevance
+        promo: detect_promotional_language(text) result, if already computed
+        spam: detect_spam_patterns(text) result, if already computed
+        readability: calculate_readability(text) result, if already computed
 
     Returns:
         float: Authenticity score (0-1)
@@ -254,15 +274,18 @@ def calculate_authenticity_score(text: str, context: Optional[str] = None) -> fl
     score = 1.0
 
     # Penalize promotional language
-    promo = detect_promotional_language(text)
+    if promo is None:
+        promo = detect_promotional_language(text)
     score -= promo["promotional_score"] * 0.3
 
     # Penalize spam patterns
-    spam = detect_spam_patterns(text)
+    if spam is None:
+        spam = detect_spam_patterns(text)
     score -= spam["spam_score"] * 0.4
 
     # Consider readability
-    readability = calculate_readability(text)
+    if readability is None:
+        readability = calculate_readability(text)
     score *= readability["readability_score"]
 
     # Penalize very short or very long responses
@@ -278,7 +301,7 @@ def calculate_authenticity_score(text: str, context: Optional[str] = None) -> fl
         score += 0.05
 
     # Has personal pronouns (seems more human)
-    personal_pronouns = re.findall(r'\b(I|my|me|we|our)\b', text, re.IGNORECASE)
+    personal_pronouns = _PERSONAL_PRONOUN_PATTERN.findall(text)
     if personal_pronouns:
         score += min(len(personal_pronouns) * 0.02, 0.1)
 
@@ -296,13 +319,13 @@ def sanitize_for_reddit(text: str) -> str:
         Sanitized text
     """
     # Remove any tracking/affiliate links
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\?[^)]*(?:ref|affiliate|utm)[^)]*\)', r'\1', text)
+    text = _TRACKING_LINK_PATTERN.sub(r'\1', text)
 
     # Remove excessive newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _EXCESS_NEWLINES_PATTERN.sub('\n\n', text)
 
     # Remove excessive spaces
-    text = re.sub(r' {2,}', ' ', text)
+    text = _EXCESS_SPACES_PATTERN.sub(' ', text)
 
     # Trim
     text = text.strip()
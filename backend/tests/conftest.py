@@ -2,12 +2,13 @@
 Test configuration and fixtures.
 """
 import pytest
+from contextlib import contextmanager
 from typing import Generator
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -43,6 +44,34 @@ def db() -> Generator:
         Base.metadata.drop_all(bind=engine)
 
 
+@contextmanager
+def _count_queries_context():
+    """Count SQL statements executed on the test engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Context manager that records executed SQL statements.
+
+    Usage:
+        with count_queries() as queries:
+            client.get(...)
+        assert len(queries) == 2
+    """
+    return _count_queries_context
+
+
 @pytest.fixture(scope="function")
 def client(db) -> Generator:
     """Create a test client with database override."""
@@ -88,7 +117,6 @@ def sample_opportunity(db, sample_project) -> Opportunity:
         subreddit="python",
         post_title="How to learn Python effectively?",
         post_content="I'm new to programming and want to learn Python...",
-        post_url="https://reddit.com/r/python/comments/abc123",
         post_author="test_user",
         post_created_at=datetime.utcnow() - timedelta(hours=1),
         post_score=50,
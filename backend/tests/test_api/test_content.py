@@ -46,6 +46,17 @@ class TestContentAPI:
         assert data["id"] == sample_content.id
         assert data["content_text"] == sample_content.content_text
 
+    def test_get_content_metadata_only_stored_keys(self, client: TestClient, sample_content):
+        """Metadata responses carry the stored keys, not a null for every declared one."""
+        response = client.get(f"/api/v1/content/{sample_content.id}")
+        data = response.json()
+        assert data["quality_checks"] == sample_content.quality_checks
+        assert data["content_metadata"] == {}
+
+        listed = client.get("/api/v1/content").json()["items"][0]
+        assert listed["quality_checks"] == sample_content.quality_checks
+        assert listed["content_metadata"] == {}
+
     def test_get_content_not_found(self, client: TestClient):
         """Test getting non-existent content."""
         response = client.get("/api/v1/content/99999")
@@ -45,6 +45,16 @@ class TestOpportunitiesAPI:
         data = response.json()
         assert data["id"] == sample_opportunity.id
         assert data["reddit_post_id"] == sample_opportunity.reddit_post_id
+        assert data["post_url"] == "https://www.reddit.com/r/python/comments/abc123/"
+
+    def test_get_opportunity_metadata_only_stored_keys(self, client: TestClient, sample_opportunity, db):
+        """Metadata responses carry the stored keys, not a null for every declared one."""
+        sample_opportunity.opportunity_metadata = {"is_self": True, "source": "rising"}
+        db.commit()
+
+        response = client.get(f"/api/v1/opportunities/{sample_opportunity.id}")
+
+        assert response.json()["opportunity_metadata"] == {"is_self": True, "source": "rising"}
 
     def test_get_opportunity_not_found(self, client: TestClient):
         """Test getting a non-existent opportunity."""
@@ -87,7 +97,6 @@ class TestOpportunitiesAPI:
             reddit_post_id="expired123",
             subreddit="python",
             post_title="Expired Post",
-            post_url="https://reddit.com/r/python/comments/expired123",
             status="expired",
             discovered_at=datetime.utcnow(),
         )
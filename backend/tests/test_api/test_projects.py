@@ -2,8 +2,11 @@
 Tests for project API endpoints.
 """
 import pytest
+from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 
+from app.models import SubredditConfig
+
 
 class TestProjectsAPI:
     """Tests for /api/v1/projects endpoints."""
@@ -35,6 +38,43 @@ class TestProjectsAPI:
         assert data["total"] >= 1
         assert len(data["items"]) >= 1
 
+    def test_list_projects_query_count(self, client: TestClient, db, sample_project, count_queries):
+        """Listing projects runs a fixed number of queries regardless of size."""
+        db.expunge_all()
+
+        with count_queries() as queries:
+            response = client.get("/api/v1/projects")
+
+        assert response.status_code == 200
+        assert len(queries) == 2  # count + page
+
+    def test_list_subreddits_query_count(
+        self, client: TestClient, db, sample_project, sample_subreddit_config, count_queries
+    ):
+        """Listing subreddit configs runs a single query."""
+        project_id = sample_project.id
+        db.expunge_all()
+
+        with count_queries() as queries:
+            response = client.get(f"/api/v1/projects/{project_id}/subreddits")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert len(queries) == 1
+
+    def test_subreddit_config_query_does_not_join_project(
+        self, db, sample_subreddit_config, count_queries
+    ):
+        """Loading configs doesn't drag in the project, its account and rate row."""
+        db.expunge_all()
+
+        with count_queries() as queries:
+            configs = db.query(SubredditConfig).all()
+
+        assert len(configs) == 1
+        assert len(queries) == 1
+        assert "JOIN" not in queries[0].upper()
+
     def test_get_project(self, client: TestClient, sample_project):
         """Test getting a specific project."""
         response = client.get(f"/api/v1/projects/{sample_project.id}")
@@ -94,3 +134,45 @@ class TestProjectsAPI:
         assert response.status_code == 200
         data = response.json()
         assert all(p["status"] == "active" for p in data["items"])
+
+    def test_create_project_failed_analysis_leaves_no_configs(self, client: TestClient, db):
+        """Subreddits whose analysis fails don't keep an empty config behind."""
+        reddit = MagicMock()
+        reddit.subreddit.side_effect = RuntimeError("reddit unavailable")
+
+        with patch(
+            "app.services.subreddit_analyzer.RedditClientFactory.create_read_only_client",
+            return_value=reddit,
+        ):
+            response = client.post(
+                "/api/v1/projects",
+                json={"name": "Offline Project", "target_subreddits": ["python", "learnpython"]},
+            )
+            assert response.status_code == 201
+            project_id = response.json()["id"]
+            assert db.query(SubredditConfig).filter_by(project_id=project_id).count() == 0
+
+    def test_add_subreddit_retries_unanalyzed_config(self, client: TestClient, db, sample_project):
+        """A leftover placeholder config doesn't block adding the subreddit again."""
+        placeholder = SubredditConfig(project_id=sample_project.id, subreddit_name="python")
+        db.add(placeholder)
+        db.commit()
+        analyzer = MagicMock()
+        analyzer.analyze_subreddit.return_value = placeholder
+
+        with patch("app.api.endpoints.projects.SubredditAnalyzer", return_value=analyzer):
+            response = client.post(
+                f"/api/v1/projects/{sample_project.id}/subreddits",
+                json={"subreddit_name": "python"},
+            )
+
+        assert response.status_code == 200
+        analyzer.analyze_subreddit.assert_called_once_with(db, "python", sample_project.id)
+
+    def test_create_project_rejects_overlong_subreddit(self, client: TestClient):
+        """Subreddit names longer than the config column are rejected up front."""
+        response = client.post(
+            "/api/v1/projects",
+            json={"name": "Bad Project", "target_subreddits": ["x" * 33]},
+        )
+        assert response.status_code == 422
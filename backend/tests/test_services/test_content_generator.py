@@ -0,0 +1,166 @@
+"""
+Tests for content generator service.
+"""
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.config import settings
+from app.services.content_generator import ContentGenerator, MentionStrategy, _response_cache
+
+
+class _FakeStream:
+    """Async iterator standing in for an OpenAI chat completion stream."""
+
+    def __init__(self, deltas):
+        self._chunks = [
+            SimpleNamespace(
+                usage=None,
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))],
+            )
+            for delta in deltas
+        ]
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+class TestContentGeneratorStreaming:
+    """Tests for streamed OpenAI generations."""
+
+    @pytest.fixture
+    def generator(self):
+        """Create a ContentGenerator with a mocked OpenAI client."""
+        generator = ContentGenerator(semantic_cache=MagicMock(), http_client=MagicMock())
+        generator._openai_client = MagicMock()
+        return generator
+
+    def test_separator_inside_comment_is_kept(self, generator):
+        """A markdown horizontal rule must not cut off the rest of the comment."""
+        stream = _FakeStream(["Para1\n", "\n--", "-\n\nPara2"])
+        generator._openai_client.chat.completions.create = AsyncMock(return_value=stream)
+
+        text, _ = asyncio.run(generator._generate_openai("system", "user", "gpt-test"))
+
+        assert text == "Para1\n\n---\n\nPara2"
+        assert "Para2" in generator._post_process(text)
+
+    def test_no_stop_sequences_sent_to_openai(self, generator):
+        """OpenAI must not be asked to stop at separators."""
+        create = AsyncMock(return_value=_FakeStream(["Hello"]))
+        generator._openai_client.chat.completions.create = create
+
+        asyncio.run(generator._generate_openai("system", "user", "gpt-test"))
+
+        assert "stop" not in create.call_args.kwargs
+
+    def test_no_stop_sequences_sent_to_anthropic(self, generator):
+        """The Anthropic fallback must not be asked to stop at separators either."""
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="Hello")],
+            usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+        )
+        create = AsyncMock(return_value=response)
+        generator._anthropic_client = MagicMock()
+        generator._anthropic_client.messages.create = create
+
+        asyncio.run(generator._generate_anthropic("system", "user"))
+
+        assert "stop_sequences" not in create.call_args.kwargs
+
+
+class TestContentGeneratorResponseCache:
+    """Tests for the exact-prompt response cache in generate_content."""
+
+    @pytest.fixture
+    def generator(self):
+        """Create a ContentGenerator whose prompts and provider call are stubbed."""
+        generator = ContentGenerator(semantic_cache=None, http_client=MagicMock())
+        generator.semantic_cache = None
+        generator._openai_client = MagicMock()
+        generator._generate_openai = AsyncMock(return_value=("A helpful reply", {"provider": "openai"}))
+        generator._build_system_prompt = MagicMock(return_value="system")
+        generator._build_user_prompt_base = MagicMock(return_value="user")
+        generator._build_generated_content = MagicMock(
+            side_effect=lambda opportunity, project, style, text, metadata, *args: (text, metadata)
+        )
+        _response_cache._entries.clear()
+        yield generator
+        _response_cache._entries.clear()
+
+    def _generate_twice(self, generator, temperature):
+        opportunity, project = MagicMock(id=1), MagicMock(id=1)
+        with patch.object(settings, "DEFAULT_LLM_TEMPERATURE", temperature), \
+                patch.object(MentionStrategy, "analyze_opportunity", return_value=("none", "test")):
+            first = asyncio.run(generator.generate_content(opportunity, project))
+            second = asyncio.run(generator.generate_content(opportunity, project))
+        return first, second
+
+    def test_not_replayed_when_sampling(self, generator):
+        """Above temperature 0 every request calls the provider."""
+        self._generate_twice(generator, 0.7)
+
+        assert generator._generate_openai.await_count == 2
+
+    def test_replayed_at_temperature_zero(self, generator):
+        """At temperature 0 an identical request replays the stored response."""
+        _, (text, metadata) = self._generate_twice(generator, 0)
+
+        assert generator._generate_openai.await_count == 1
+        assert text == "A helpful reply"
+        assert metadata["cache_hit"] is True
+
+
+class TestContentGeneratorBatch:
+    """Tests for collecting OpenAI Batch API results."""
+
+    @pytest.fixture
+    def generator(self):
+        """Create a ContentGenerator with a mocked OpenAI client."""
+        generator = ContentGenerator(semantic_cache=None, http_client=MagicMock())
+        generator._openai_client = MagicMock()
+        return generator
+
+    def _batch(self, status, output_file_id=None, error_file_id=None):
+        return SimpleNamespace(
+            id="batch_1", status=status,
+            output_file_id=output_file_id, error_file_id=error_file_id,
+        )
+
+    def test_running_batch_returns_none(self, generator):
+        """Results are only read once the batch has finished."""
+        generator._openai_client.batches.retrieve = AsyncMock(return_value=self._batch("in_progress"))
+
+        assert asyncio.run(generator.fetch_content_batch("batch_1")) is None
+
+    def test_error_file_is_read(self, generator, caplog):
+        """Requests reported in the error file are logged and left out of the results."""
+        output = (
+            '{"custom_id": "1:casual", "response": {"status_code": 200, "body": '
+            '{"choices": [{"message": {"content": "A reply"}}], "usage": {}}}}'
+        )
+        errors = (
+            '{"custom_id": "2:casual", "response": {"status_code": 400, '
+            '"body": {"error": "bad request"}}, "error": null}'
+        )
+        generator._openai_client.batches.retrieve = AsyncMock(
+            return_value=self._batch("completed", "file_out", "file_err")
+        )
+        generator._openai_client.files.content = AsyncMock(side_effect=lambda file_id: SimpleNamespace(
+            text=output if file_id == "file_out" else errors
+        ))
+
+        results = asyncio.run(generator.fetch_content_batch("batch_1"))
+
+        assert list(results) == ["1:casual"]
+        assert results["1:casual"][0] == "A reply"
+        assert "2:casual" in caplog.text
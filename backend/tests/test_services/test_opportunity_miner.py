@@ -1,12 +1,22 @@
 """
 Tests for opportunity miner service.
 """
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+from app.models import Opportunity
 from app.services.opportunity_miner import OpportunityMiner
-from app.utils.reddit_helpers import calculate_post_velocity, classify_urgency
+from app.utils.reddit_helpers import (
+    RateLimitedRequestor,
+    RedditClientFactory,
+    TokenBucket,
+    calculate_post_velocity,
+    classify_urgency,
+)
 
 
 class TestOpportunityMiner:
@@ -160,3 +170,119 @@ class TestOpportunityMiner:
         # Very large subreddit
         threshold = miner._get_velocity_threshold(5000000)
         assert threshold == 200
+
+
+class TestOpportunityMinerThreadedMerge:
+    """Tests for merging per-subreddit results fetched on the mining pool."""
+
+    # Later subreddits finish first, so results arrive out of target order
+    POSTS = {
+        "python": (0.05, ["p1", "shared", "p2"]),
+        "programming": (0.0, ["shared", "g1", "g2"]),
+        "learnpython": (0.0, ["l1"]),
+    }
+
+    @pytest.fixture
+    def miner(self):
+        """Create an OpportunityMiner whose subreddit fetches are stubbed."""
+        miner = OpportunityMiner()
+
+        def mine_subreddit(db, project, subreddit_name, **kwargs):
+            delay, post_ids = self.POSTS[subreddit_name]
+            time.sleep(delay)
+            if post_ids is None:
+                raise RuntimeError("subreddit unavailable")
+            return [
+                {
+                    "project_id": project.id,
+                    "reddit_post_id": post_id,
+                    "subreddit": subreddit_name,
+                    "post_title": f"Post {post_id}",
+                }
+                for post_id in post_ids
+            ]
+
+        miner._mine_subreddit = MagicMock(side_effect=mine_subreddit)
+        return miner
+
+    def _stored(self, db):
+        return [
+            (opportunity.reddit_post_id, opportunity.subreddit)
+            for opportunity in db.query(Opportunity).order_by(Opportunity.id)
+        ]
+
+    def test_merge_keeps_target_order(self, miner, db, sample_project):
+        """Rows are merged in target order, deduplicated, then cut at the limit."""
+        opportunities = miner.mine_opportunities(db, sample_project, limit=4)
+
+        assert len(opportunities) == 4
+        assert self._stored(db) == [
+            ("p1", "python"), ("shared", "python"), ("p2", "python"), ("g1", "programming"),
+        ]
+
+    def test_failed_subreddit_is_skipped(self, miner, db, sample_project):
+        """A subreddit that raises doesn't stop the others from being merged."""
+        with patch.dict(self.POSTS, {"python": (0.0, None)}):
+            miner.mine_opportunities(db, sample_project, limit=10)
+
+        assert self._stored(db) == [
+            ("shared", "programming"), ("g1", "programming"), ("g2", "programming"),
+            ("l1", "learnpython"),
+        ]
+
+    def test_thread_client_reused_across_runs(self, miner, db, sample_project):
+        """Pool threads outlive a run, so later runs reuse their Reddit clients."""
+        clients = []
+
+        def mine_subreddit(**kwargs):
+            clients.append(miner._get_thread_reddit())
+            return []
+
+        miner._mine_subreddit.side_effect = mine_subreddit
+        # A single worker, so both runs land on the same pool thread
+        executor = ThreadPoolExecutor(max_workers=1)
+        with patch("app.services.opportunity_miner._mining_executor", executor), \
+                patch("app.utils.reddit_helpers.praw.Reddit", side_effect=lambda **kwargs: MagicMock()):
+            miner.mine_opportunities(db, sample_project, subreddits=["python"])
+            miner.mine_opportunities(db, sample_project, subreddits=["python"])
+        executor.shutdown()
+
+        assert len(clients) == 2
+        assert clients[0] is clients[1]
+
+
+class TestReadOnlyRateLimit:
+    """Tests for the rate limit shared by read-only Reddit clients."""
+
+    def test_token_bucket_waits_when_empty(self):
+        """Once the burst is used up, acquire() sleeps until the next token."""
+        clock = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("app.utils.reddit_helpers.time") as fake_time:
+            fake_time.monotonic.side_effect = lambda: clock[0]
+            fake_time.sleep.side_effect = sleep
+            bucket = TokenBucket(rate_per_minute=60, capacity=2)
+            for _ in range(3):
+                bucket.acquire()
+
+        assert sleeps == [pytest.approx(1.0)]
+
+    def test_read_only_clients_use_rate_limited_requestor(self):
+        """Every thread's read-only client sends its requests through the shared bucket."""
+        created = []
+
+        with patch("app.utils.reddit_helpers.praw.Reddit") as reddit_class:
+            # A fresh thread, so no client is cached yet
+            thread = threading.Thread(
+                target=lambda: created.append(RedditClientFactory.create_read_only_client())
+            )
+            thread.start()
+            thread.join()
+
+        assert created == [reddit_class.return_value]
+        assert reddit_class.call_args.kwargs["requestor_class"] is RateLimitedRequestor
@@ -0,0 +1,125 @@
+"""
+Tests for Reddit publisher service.
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.models import AccountStatus, RedditAccount, RedditAccountRate
+from app.services.reddit_publisher import RedditPublisher
+from app.tasks.check_account_health import reset_daily_limits_task
+
+
+def _failing_commit(db, errors):
+    """Stand-in for db.commit that raises the queued errors before committing for real."""
+    real_commit = db.commit
+
+    def commit():
+        if errors:
+            raise errors.pop(0)
+        real_commit()
+
+    return patch.object(db, "commit", side_effect=commit)
+
+
+class TestClaimActionSlot:
+    """Tests for reserving an action on an account's versioned rate counters."""
+
+    @pytest.fixture
+    def publisher(self):
+        return RedditPublisher()
+
+    def _count(self, db, account_id):
+        db.expire_all()
+        return db.query(RedditAccount).get(account_id).daily_actions_count
+
+    def test_claim_retries_stale_counters(self, publisher, db, sample_account):
+        """A concurrent update of the counters is re-read and the claim retried."""
+        with _failing_commit(db, [StaleDataError("rate row changed")]) as commit:
+            claimed = publisher._claim_action_slot(db, sample_account)
+
+        assert claimed is True
+        assert commit.call_count == 2
+        assert self._count(db, sample_account.id) == 1
+
+    def test_claim_retries_rate_row_insert_conflict(self, publisher, db, sample_project):
+        """Losing the race to create the rate row is retried like a stale update."""
+        account = RedditAccount(
+            project_id=sample_project.id,
+            username="fresh_account",
+            refresh_token_encrypted="encrypted_token_here",
+            status=AccountStatus.ACTIVE.value,
+        )
+        db.add(account)
+        db.commit()
+        assert account.rate is None
+
+        conflict = IntegrityError("INSERT INTO reddit_account_rates", {}, Exception("duplicate key"))
+        with _failing_commit(db, [conflict]) as commit:
+            claimed = publisher._claim_action_slot(db, account)
+
+        assert claimed is True
+        assert commit.call_count == 2
+        assert db.query(RedditAccountRate).filter_by(account_id=account.id).count() == 1
+        assert self._count(db, account.id) == 1
+
+    def test_claim_gives_up_after_max_attempts(self, publisher, db, sample_account):
+        """Counters that keep changing make the claim fail instead of looping."""
+        errors = [StaleDataError("rate row changed")] * RedditPublisher.MAX_CLAIM_ATTEMPTS
+        with _failing_commit(db, errors) as commit:
+            claimed = publisher._claim_action_slot(db, sample_account)
+
+        assert claimed is False
+        assert commit.call_count == RedditPublisher.MAX_CLAIM_ATTEMPTS
+        assert self._count(db, sample_account.id) == 0
+
+
+class TestResetDailyLimits:
+    """Tests for resetting daily counters alongside concurrent claims."""
+
+    @pytest.fixture
+    def accounts(self, db, sample_project):
+        """Two accounts that used actions yesterday."""
+        yesterday = datetime.utcnow() - timedelta(days=1, hours=1)
+        accounts = []
+        for username in ("first_account", "second_account"):
+            account = RedditAccount(
+                project_id=sample_project.id,
+                username=username,
+                refresh_token_encrypted="encrypted_token_here",
+                status=AccountStatus.ACTIVE.value,
+                daily_actions_count=5,
+                daily_actions_reset_at=yesterday,
+            )
+            db.add(account)
+            accounts.append(account)
+        db.commit()
+        return [account.id for account in accounts]
+
+    def test_reset_retries_stale_counters(self, db, accounts):
+        """A reset that races a claim is retried instead of being lost."""
+        account = db.query(RedditAccount).get(accounts[0])
+        midnight = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        with _failing_commit(db, [StaleDataError("rate row changed")]):
+            reset = RedditPublisher().reset_daily_actions(db, account, midnight)
+
+        assert reset is True
+        db.expire_all()
+        assert db.query(RedditAccount).get(accounts[0]).daily_actions_count == 0
+
+    def test_task_resets_other_accounts_when_one_keeps_failing(self, db, accounts):
+        """One account's conflicting counters don't roll back the other resets."""
+        errors = [StaleDataError("rate row changed")] * RedditPublisher.MAX_CLAIM_ATTEMPTS
+
+        with patch("app.tasks.check_account_health.SessionLocal", return_value=db), \
+                _failing_commit(db, errors):
+            result = reset_daily_limits_task()
+
+        assert result == {"reset_count": 1}
+        db.expire_all()
+        counts = [db.query(RedditAccount).get(account_id).daily_actions_count for account_id in accounts]
+        assert counts == [5, 0]
@@ -0,0 +1,77 @@
+"""
+Tests for semantic cache service.
+"""
+import asyncio
+import base64
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import orjson
+
+from app.services.semantic_cache import SemanticCache
+
+
+def _entry(embedding, content_text="Cached reply"):
+    return orjson.dumps({
+        "embedding": base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode("ascii"),
+        "content_text": content_text,
+        "metadata": {"provider": "openai"},
+    })
+
+
+class TestSemanticCacheLookup:
+    """Tests for SemanticCache.lookup failing open on bad entries."""
+
+    @pytest.fixture
+    def redis(self):
+        """Redis client stub whose list contents are set per test."""
+        redis = MagicMock()
+        redis.lrange = AsyncMock(return_value=[])
+        pipe = redis.pipeline.return_value.__aenter__.return_value
+        pipe.execute = AsyncMock()
+        return redis
+
+    @pytest.fixture
+    def cache(self, redis):
+        return SemanticCache(redis_client=redis, threshold=0.9, ttl_seconds=60, max_entries=10)
+
+    def _lookup(self, cache, embedding):
+        return asyncio.run(cache.lookup(1, "Python", "casual", "none", embedding))
+
+    def test_hit_above_threshold(self, cache, redis):
+        """The most similar valid entry is returned."""
+        redis.lrange.return_value = [_entry([0.0, 1.0, 0.0]), _entry([1.0, 0.0, 0.0], "Best match")]
+
+        text, metadata, similarity = self._lookup(cache, [1.0, 0.0, 0.0])
+
+        assert text == "Best match"
+        assert similarity == pytest.approx(1.0)
+
+    def test_corrupt_entry_is_skipped_and_evicted(self, cache, redis):
+        """An entry that doesn't decode is dropped; the remaining entries still match."""
+        corrupt = b"not json"
+        redis.lrange.return_value = [corrupt, _entry([1.0, 0.0, 0.0])]
+
+        result = self._lookup(cache, [1.0, 0.0, 0.0])
+
+        assert result[0] == "Cached reply"
+        pipe = redis.pipeline.return_value.__aenter__.return_value
+        pipe.lrem.assert_called_once_with("content_cache:1:python:casual:none", 0, corrupt)
+
+    def test_mismatched_dimension_is_a_miss(self, cache, redis):
+        """Entries embedded with a different model can't match and don't raise."""
+        stale = _entry([1.0, 0.0])
+        redis.lrange.return_value = [stale]
+
+        assert self._lookup(cache, [1.0, 0.0, 0.0]) is None
+        pipe = redis.pipeline.return_value.__aenter__.return_value
+        pipe.lrem.assert_called_once_with("content_cache:1:python:casual:none", 0, stale)
+
+    def test_key_includes_subreddit(self, cache, redis):
+        """Content cached for one subreddit isn't looked up for another."""
+        self._lookup(cache, [1.0, 0.0, 0.0])
+        asyncio.run(cache.lookup(1, "learnpython", "casual", "none", [1.0, 0.0, 0.0]))
+
+        keys = [call.args[0] for call in redis.lrange.call_args_list]
+        assert keys == ["content_cache:1:python:casual:none", "content_cache:1:learnpython:casual:none"]
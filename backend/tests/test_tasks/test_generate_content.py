@@ -0,0 +1,110 @@
+"""
+Tests for content generation tasks.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models import GeneratedContent, Opportunity, OpportunityStatus
+from app.services.content_generator import ContentGenerator
+from app.tasks.generate_content import (
+    collect_content_batches_task,
+    generate_content_task,
+    submit_content_batch_task,
+)
+
+
+class TestContentBatchTasks:
+    """Tests for the OpenAI Batch API submit/collect tasks."""
+
+    @pytest.fixture
+    def generator(self, db):
+        """Patch the tasks onto the test session and a generator with stubbed API calls."""
+        generator = ContentGenerator(semantic_cache=None, http_client=MagicMock())
+        generator.semantic_cache = None
+        generator.submit_content_batch = AsyncMock(return_value="batch_1")
+        generator.fetch_content_batch = AsyncMock(return_value=None)
+
+        with patch("app.tasks.generate_content.SessionLocal", return_value=db), \
+                patch("app.tasks.generate_content._get_generator", return_value=generator):
+            yield generator
+
+    @pytest.fixture
+    def opportunity_id(self, db, sample_opportunity):
+        """ID of an approved opportunity (the tasks close the session, detaching objects)."""
+        sample_opportunity.status = OpportunityStatus.APPROVED.value
+        db.commit()
+        return sample_opportunity.id
+
+    @pytest.fixture
+    def project_id(self, sample_project):
+        return sample_project.id
+
+    def _reload(self, db, opportunity_id):
+        db.expire_all()
+        return db.query(Opportunity).get(opportunity_id)
+
+    def test_submit_claims_opportunities(self, db, generator, project_id, opportunity_id):
+        """Submitted opportunities are marked GENERATING and remember their batch."""
+        result = submit_content_batch_task(project_id, styles=["casual"])
+
+        assert result["batch_id"] == "batch_1"
+        opportunity = self._reload(db, opportunity_id)
+        assert opportunity.status == OpportunityStatus.GENERATING.value
+        assert opportunity.opportunity_metadata["batch_id"] == "batch_1"
+        assert opportunity.opportunity_metadata["batch_styles"] == ["casual"]
+
+    def test_submit_failure_releases_opportunities(self, db, generator, project_id, opportunity_id):
+        """A failed submission puts the opportunities back to APPROVED."""
+        generator.submit_content_batch.side_effect = RuntimeError("upload failed")
+
+        result = submit_content_batch_task(project_id)
+
+        assert "error" in result
+        assert self._reload(db, opportunity_id).status == OpportunityStatus.APPROVED.value
+
+    def test_generate_content_skips_batched_opportunity(self, db, generator, project_id, opportunity_id):
+        """Per-opportunity generation leaves opportunities in a pending batch alone."""
+        submit_content_batch_task(project_id)
+
+        result = generate_content_task.run(opportunity_id)
+
+        assert result["skipped"] is True
+
+    def test_collect_waits_for_running_batch(self, db, generator, project_id, opportunity_id):
+        """Nothing changes while the batch is still running."""
+        submit_content_batch_task(project_id)
+
+        result = collect_content_batches_task()
+
+        assert result["pending_batches"] == 1
+        assert self._reload(db, opportunity_id).status == OpportunityStatus.GENERATING.value
+
+    def test_collect_stores_results(self, db, generator, project_id, opportunity_id):
+        """Finished batches store content; opportunities without a result are released."""
+        submit_content_batch_task(project_id, styles=["casual", "technical"])
+        generator.fetch_content_batch.return_value = {
+            ContentGenerator.batch_custom_id(opportunity_id, "casual"): (
+                "Honestly the official tutorial got me going, then small projects.",
+                {"provider": "openai", "batch_id": "batch_1"},
+            ),
+        }
+
+        result = collect_content_batches_task()
+
+        assert result["collected_batches"] == ["batch_1"]
+        opportunity = self._reload(db, opportunity_id)
+        assert opportunity.status == OpportunityStatus.READY.value
+        assert "batch_id" not in opportunity.opportunity_metadata
+        contents = db.query(GeneratedContent).filter_by(opportunity_id=opportunity.id).all()
+        assert [content.style for content in contents] == ["casual"]
+
+    def test_collect_releases_failed_requests(self, db, generator, project_id, opportunity_id):
+        """An opportunity whose requests all failed goes back to APPROVED."""
+        submit_content_batch_task(project_id)
+        generator.fetch_content_batch.return_value = {}
+
+        collect_content_batches_task()
+
+        opportunity = self._reload(db, opportunity_id)
+        assert opportunity.status == OpportunityStatus.APPROVED.value
+        assert "batch_id" not in opportunity.opportunity_metadata
@@ -0,0 +1,93 @@
+"""
+Tests for the circuit breaker.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    @pytest.fixture
+    def clock(self):
+        """Controllable time.monotonic for the breaker."""
+        now = [1000.0]
+        with patch("app.utils.circuit_breaker.time.monotonic", side_effect=lambda: now[0]):
+            yield now
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker("test", failure_threshold=3, reset_timeout=30.0)
+
+    def _fail(self, breaker, times=1):
+        for _ in range(times):
+            with pytest.raises(RuntimeError):
+                asyncio.run(breaker.call(AsyncMock(side_effect=RuntimeError("provider down"))))
+
+    def _succeed(self, breaker):
+        return asyncio.run(breaker.call(AsyncMock(return_value="ok")))
+
+    def test_opens_at_failure_threshold(self, breaker):
+        """Closed until failure_threshold consecutive failures, then open."""
+        self._fail(breaker, 2)
+        assert not breaker.is_open
+
+        self._fail(breaker)
+        assert breaker.is_open
+
+    def test_success_resets_failure_count(self, breaker):
+        """Failures only count while consecutive."""
+        self._fail(breaker, 2)
+        self._succeed(breaker)
+        self._fail(breaker, 2)
+
+        assert not breaker.is_open
+
+    def test_rejects_calls_while_open(self, breaker, clock):
+        """An open circuit fails fast without calling the provider."""
+        self._fail(breaker, 3)
+        clock[0] += 29
+        func = AsyncMock(return_value="ok")
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(breaker.call(func))
+
+        func.assert_not_awaited()
+
+    def test_half_open_after_timeout(self, breaker, clock):
+        """After the timeout exactly one probe goes through; others are still rejected."""
+        self._fail(breaker, 3)
+        clock[0] += 30
+
+        breaker.before_call()  # the probe
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_success_closes(self, breaker, clock):
+        """A successful probe closes the circuit."""
+        self._fail(breaker, 3)
+        clock[0] += 30
+
+        assert self._succeed(breaker) == "ok"
+
+        assert not breaker.is_open
+        assert breaker.fail_count == 0
+        assert self._succeed(breaker) == "ok"
+
+    def test_half_open_failure_reopens(self, breaker, clock):
+        """A failed probe re-opens the circuit for another full timeout."""
+        self._fail(breaker, 3)
+        clock[0] += 30
+
+        self._fail(breaker)
+
+        assert breaker.is_open
+        clock[0] += 29
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        clock[0] += 1
+        breaker.before_call()
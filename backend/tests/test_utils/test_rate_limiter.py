@@ -0,0 +1,83 @@
+"""
+Tests for the token-bucket rate limiter.
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter refill, waiting and burst capacity."""
+
+    @pytest.fixture
+    def clock(self):
+        """Controllable time.monotonic; asyncio.sleep advances it instead of sleeping."""
+        now = [1000.0]
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        with patch("app.utils.rate_limiter.time.monotonic", side_effect=lambda: now[0]), \
+                patch("app.utils.rate_limiter.asyncio.sleep", side_effect=sleep):
+            yield now, sleeps
+
+    def _acquire(self, limiter, times=1):
+        async def run():
+            for _ in range(times):
+                await limiter.acquire()
+        asyncio.run(run())
+
+    def test_burst_capacity(self, clock):
+        """A full bucket allows `rate` calls at once, then waits."""
+        _, sleeps = clock
+        limiter = RateLimiter("test", rate=5, period=60.0)
+
+        self._acquire(limiter, 5)
+        assert sleeps == []
+
+        self._acquire(limiter)
+        assert len(sleeps) == 1
+
+    def test_acquire_waits_for_next_token(self, clock):
+        """With the bucket empty, acquire sleeps exactly until one token has refilled."""
+        _, sleeps = clock
+        limiter = RateLimiter("test", rate=6, period=60.0)
+        self._acquire(limiter, 6)
+
+        self._acquire(limiter)
+
+        assert sleeps == [pytest.approx(10.0)]
+        assert limiter.tokens == pytest.approx(0.0)
+
+    def test_refills_at_configured_rate(self, clock):
+        """Tokens come back at rate/period, capped at the burst size."""
+        now, sleeps = clock
+        limiter = RateLimiter("test", rate=6, period=60.0)
+        self._acquire(limiter, 6)
+
+        now[0] += 25
+        limiter._refill()
+        assert limiter.tokens == pytest.approx(2.5)
+
+        now[0] += 600
+        limiter._refill()
+        assert limiter.tokens == pytest.approx(6.0)
+
+        self._acquire(limiter, 6)
+        assert sleeps == []
+
+    def test_context_manager_takes_a_token(self, clock):
+        """`async with limiter` acquires one token."""
+        limiter = RateLimiter("test", rate=2, period=60.0)
+
+        async def run():
+            async with limiter:
+                pass
+
+        asyncio.run(run())
+
+        assert limiter.tokens == pytest.approx(1.0)